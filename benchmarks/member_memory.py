@@ -0,0 +1,119 @@
+"""
+Measures the memory taken by structured guild members.
+
+---
+
+Structures a guild and its members with tracemalloc running, and
+reports the memory held by them once structured. The baseline gives
+every user the bot reference `Object` used to store on each instance,
+and is reported before the current layout. Usage:
+
+    python benchmarks/member_memory.py [members]
+"""
+import gc
+import sys
+import tracemalloc
+from weakref import WeakValueDictionary
+
+from attrs import define, field
+
+from retux.client.resources.guild import Guild, Member
+from retux.client.resources.user import User
+from retux.const import MISSING
+from retux.utils.conversion import _make_structure_fn, converter, structure
+
+
+@define(kw_only=True)
+class BaselineUser(User):
+    _bot_inst: object = field(default=MISSING, init=False)
+
+
+@define(kw_only=True)
+class BaselineMember(Member):
+    user: BaselineUser = None
+
+
+def _make_baseline_hook():
+    # Users are shared by their ID in both layouts, as done for `User`.
+    structure_user = _make_structure_fn(BaselineUser)
+    users = WeakValueDictionary()
+
+    def hook(data: dict, cls: type) -> BaselineUser:
+        user_id = int(data["id"])
+
+        if (user := users.get(user_id)) is None:
+            user = users[user_id] = structure_user(data, cls)
+        return user
+
+    return hook
+
+
+converter.register_structure_hook(BaselineUser, _make_baseline_hook())
+
+
+GUILD = {
+    "id": "1",
+    "name": "guild",
+    "icon": None,
+    "owner_id": "2",
+    "afk_timeout": 300,
+    "verification_level": 0,
+    "default_message_notifications": 0,
+    "explicit_content_filter": 0,
+    "features": [],
+    "mfa_level": 0,
+    "system_channel_flags": 0,
+    "premium_tier": 0,
+    "preferred_locale": "en-US",
+    "nsfw_level": 0,
+    "premium_progress_bar_enabled": False,
+}
+
+
+def member(index: int) -> dict:
+    return {
+        "user": {
+            "id": str(10**17 + index),
+            "username": f"user{index}",
+            "discriminator": "0001",
+            "avatar": None,
+        },
+        "roles": [],
+        "joined_at": "2022-01-01T00:00:00+00:00",
+        "deaf": False,
+        "mute": False,
+    }
+
+
+def measure(label: str, members: list[dict], cls: type):
+    # Builds the structuring functions ahead of measuring.
+    structure(GUILD, Guild)
+    structure(members[:1], list[cls])
+
+    gc.collect()
+    tracemalloc.start()
+
+    guild = structure(GUILD, Guild)  # noqa: F841
+    structured = structure(members, list[cls])
+
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{label}: {current / 2**20:.1f} MiB, {current / len(structured):.0f} B per member, "
+        f"{peak / 2**20:.1f} MiB at peak"
+    )
+    del guild, structured
+    gc.collect()
+
+
+def main(count: int):
+    print(f"Guild with {count} members")
+    measure("before", [member(index) for index in range(count)], BaselineMember)
+    # Offset the IDs so that no user is shared with the baseline.
+    measure("after", [member(count + index) for index in range(count)], Member)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -1,4 +1,6 @@
+from .cluster import *  # noqa
 from .error import *  # noqa
 from .events import *  # noqa
 from .gateway import *  # noqa
 from .http import *  # noqa
+from .shard import *  # noqa
@@ -0,0 +1,674 @@
+from inspect import isawaitable
+from itertools import count
+from logging import getLogger
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from os import cpu_count
+from typing import Any, Callable
+
+from attrs import define, field
+from trio import Cancelled, CancelScope, Event, Lock, current_time, open_nursery, run, to_thread
+
+from ..client.flags import Intents
+from ..const import MISSING, NotNeeded
+from .error import IPCError
+from .http import Endpoint, HTTPClient
+from .shard import IdentifyScheduler, ShardManager
+
+logger = getLogger(__name__)
+
+__all__ = ("IPCChannel", "ClusterManager")
+
+_IPC_TIMEOUT = 5
+"""The seconds given to a request made over IPC while being cancelled."""
+
+
+@define()
+class _IPCPayload:
+    """
+    Represents a payload sent between the processes of a cluster.
+
+    A payload without an `op` is a reply to the request sharing its `nonce`.
+    """
+
+    nonce: int = field()
+    """The number identifying the request, shared with its reply."""
+    op: str | None = field(default=None)
+    """The name of the request, or `None` for a reply."""
+    d: Any | None = field(default=None)
+    """The data of the request or reply."""
+    error: str | None = field(default=None)
+    """The error raised by the handler of the request, if any."""
+
+
+class IPCChannel:
+    """
+    Represents a channel of communication between two processes of a cluster.
+
+    ---
+
+    Channels are bidirectional: both ends may make requests to, and handle
+    requests from, the other end. Payloads are sent over a `multiprocessing`
+    pipe, which is backed by a Unix socket pair on POSIX systems.
+
+    ---
+
+    Attributes
+    ----------
+    _conn : `multiprocessing.connection.Connection`
+        The end of the pipe owned by this process.
+    _handlers : `dict[str, typing.Callable]`
+        The handlers of requests registered by their name.
+    _pending : `dict[int, list]`
+        The requests awaiting a reply, stored as an event and its reply.
+    _nonces : `itertools.count`
+        The counter used to create request nonces.
+    _lock : `trio.Lock`
+        The lock preventing concurrent writes to the pipe.
+    """
+
+    __slots__ = ("_conn", "_handlers", "_pending", "_nonces", "_lock")
+    _conn: Connection
+    """The end of the pipe owned by this process."""
+    _handlers: dict[str, Callable]
+    """The handlers of requests registered by their name."""
+    _pending: dict[int, list]
+    """The requests awaiting a reply, stored as an event and its reply."""
+    _nonces: count
+    """The counter used to create request nonces."""
+    _lock: Lock
+    """The lock preventing concurrent writes to the pipe."""
+
+    def __init__(self, conn: Connection):
+        """
+        Creates a new channel over a pipe.
+
+        Parameters
+        ----------
+        conn : `multiprocessing.connection.Connection`
+            The end of the pipe owned by this process.
+        """
+        self._conn = conn
+        self._handlers = {}
+        self._pending = {}
+        self._nonces = count()
+        self._lock = Lock()
+
+    def handler(
+        self, coro: NotNeeded[Callable] = MISSING, *, name: NotNeeded[str] = MISSING
+    ) -> Callable[..., Any]:
+        """
+        Registers a handler for requests made from the other end of the channel.
+
+        ---
+
+        Handlers receive the data of the request and return the data
+        of the reply. Both synchronous and asynchronous functions
+        are accepted.
+
+        ```
+        @bot.ipc.handler
+        async def channel_count(data):
+            return len(my_channels)
+        ```
+
+        ---
+
+        Parameters
+        ----------
+        coro : `typing.Callable`, optional
+            The handler to register. This is only "optional"
+            when `name` has been specified.
+        name : `str`, optional
+            The name of the request. Defaults to the name of the handler.
+
+        Returns
+        -------
+        `typing.Callable[..., typing.Any]`
+            The handler, unchanged.
+        """
+
+        def decor(coro: Callable):
+            self._handlers[name if name is not MISSING else coro.__name__] = coro
+            return coro
+
+        if coro is not MISSING:
+            return decor(coro)
+
+        return decor
+
+    async def request(self, op: str, data: Any = None) -> Any:
+        """
+        Makes a request to the other end of the channel.
+
+        Parameters
+        ----------
+        op : `str`
+            The name of the request.
+        data : `typing.Any`, optional
+            The data of the request. This must be picklable.
+
+        Returns
+        -------
+        `typing.Any`
+            The data replied with.
+        """
+        nonce = next(self._nonces)
+        pending = self._pending[nonce] = [Event(), None]
+
+        try:
+            await self._send(_IPCPayload(nonce=nonce, op=op, d=data))
+            await pending[0].wait()
+        finally:
+            self._pending.pop(nonce, None)
+
+        reply: _IPCPayload = pending[1]
+        if reply.error is not None:
+            raise IPCError(f"The request {op} has failed: {reply.error}")
+        return reply.d
+
+    async def listen(self):
+        """
+        Listens for payloads from the other end of the channel until it closes.
+
+        ---
+
+        Pending requests are failed once listening stops, including
+        when it is cancelled, as no reply can arrive for them anymore.
+        """
+        try:
+            async with open_nursery() as nursery:
+                while True:
+                    try:
+                        payload: _IPCPayload = await to_thread.run_sync(
+                            self._conn.recv, cancellable=True
+                        )
+                    except (EOFError, OSError):
+                        logger.warning("The IPC channel has been closed.")
+                        break
+
+                    if payload.op is None:
+                        if pending := self._pending.pop(payload.nonce, None):
+                            pending[1] = payload
+                            pending[0].set()
+                    else:
+                        nursery.start_soon(self._handle, payload)
+        finally:
+            for nonce, pending in self._pending.items():
+                pending[1] = _IPCPayload(nonce=nonce, error="The IPC channel has been closed.")
+                pending[0].set()
+            self._pending.clear()
+
+    async def _handle(self, payload: _IPCPayload):
+        """
+        Handles a request from the other end of the channel and replies to it.
+
+        Parameters
+        ----------
+        payload : `_IPCPayload`
+            The payload of the request.
+        """
+        reply = _IPCPayload(nonce=payload.nonce)
+
+        if handler := self._handlers.get(payload.op):
+            try:
+                reply.d = handler(payload.d)
+                if isawaitable(reply.d):
+                    reply.d = await reply.d
+            except Exception as err:
+                logger.exception(f"The IPC handler for {payload.op} has failed.")
+                reply.d, reply.error = None, repr(err)
+        else:
+            reply.error = f"No handler is registered for {payload.op}."
+
+        try:
+            await self._send(reply)
+        except Exception as err:
+            # The reply itself could not be pickled.
+            await self._send(_IPCPayload(nonce=payload.nonce, error=repr(err)))
+
+    async def _send(self, payload: _IPCPayload):
+        """
+        Sends a payload to the other end of the channel.
+
+        Parameters
+        ----------
+        payload : `_IPCPayload`
+            The payload to send.
+        """
+        async with self._lock:
+            await to_thread.run_sync(self._conn.send, payload)
+
+
+class _IPCScheduler:
+    """
+    Represents an identification scheduler shared by every process of a cluster.
+
+    Identifications are requested from the cluster manager, which owns
+    the only `IdentifyScheduler` for the bot. A wait cancelled before
+    its reply is abandoned, so the manager frees the bucket once given.
+    """
+
+    __slots__ = ("_channel",)
+
+    def __init__(self, channel: IPCChannel):
+        self._channel = channel
+
+    async def wait(self, shard_id: int):
+        """
+        Waits until a shard is allowed to identify to the Gateway.
+
+        Parameters
+        ----------
+        shard_id : `int`
+            The ID of the shard identifying.
+        """
+        try:
+            await self._channel.request("identify", shard_id)
+        except Cancelled:
+            with CancelScope(shield=True, deadline=current_time() + _IPC_TIMEOUT):
+                await self._channel.request("abandon", shard_id)
+            raise
+
+    async def release(self, shard_id: int, identified: bool = True):
+        """
+        Frees the bucket of a shard, once it has identified or given up on it.
+
+        Parameters
+        ----------
+        shard_id : `int`
+            The ID of the shard.
+        identified : `bool`, optional
+            Whether the shard has sent its identification or not.
+            Defaults to `True`.
+        """
+        await self._channel.request("release", (shard_id, identified))
+
+
+def _run_cluster(
+    cluster_id: int,
+    token: str,
+    intents: Intents,
+    shard_ids: list[int],
+    shard_count: int,
+    setup: Callable | None,
+    session_file: str | MISSING,
+    allow_eval: bool,
+    conn: Connection,
+):
+    """
+    Runs a bot for a range of shards inside of a cluster process.
+
+    Parameters
+    ----------
+    cluster_id : `int`
+        The ID of the cluster.
+    token : `str`
+        The token of the bot.
+    intents : `Intents`
+        The intents to connect with.
+    shard_ids : `list[int]`
+        The IDs of the shards ran by the cluster.
+    shard_count : `int`
+        The total amount of shards of the bot.
+    setup : `typing.Callable`, optional
+        The function registering callbacks onto the bot.
+    session_file : `str`, optional
+        The path of the file to persist the sessions of the shards to.
+    allow_eval : `bool`
+        Whether to register the `eval` handler or not.
+    conn : `multiprocessing.connection.Connection`
+        The end of the pipe to the cluster manager.
+    """
+    from ..client.bot import Bot
+
+    bot = Bot(intents, autoshard=True, session_file=session_file)
+    bot.http = HTTPClient(token)
+    bot.ipc = IPCChannel(conn)
+
+    if allow_eval:
+
+        @bot.ipc.handler(name="eval")
+        def _eval(data: str) -> Any:
+            return eval(data, {"bot": bot, "cluster_id": cluster_id})
+
+    @bot.ipc.handler
+    def shards(data: None) -> dict[int, float]:
+        return {shard.shard[0]: shard.latency for shard in bot._gateway.shards}
+
+    if setup is not None:
+        setup(bot)
+
+    async def main():
+        gateway = ShardManager(
+            token,
+            intents,
+            bot.http,
+            shard_count=shard_count,
+            shard_ids=shard_ids,
+            scheduler=_IPCScheduler(bot.ipc),
+            session_file=session_file,
+        )
+
+        async with open_nursery() as nursery:
+            nursery.start_soon(bot.ipc.listen)
+            await bot._connect(token, gateway)
+            nursery.cancel_scope.cancel()
+
+    logger.info(f"Cluster {cluster_id} is running shard(s) {shard_ids}.")
+    run(main)
+
+
+class ClusterManager:
+    """
+    Represents a manager of numerous processes, each running a range of shards.
+
+    ---
+
+    A single Python process is only able to make use of one CPU core.
+    Clustering spreads the decoding and handling of Gateway events across
+    numerous processes, where each process runs its own `Bot` with a
+    `ShardManager` for its range of shards.
+
+    Processes talk to the manager through an `IPCChannel`, available as
+    `bot.ipc` in every process. Requests made to the manager may be
+    broadcasted to every process, allowing for cross-cluster calls:
+
+    ```
+    def setup(bot: retux.Bot):
+        @bot.ipc.handler
+        def guild_count(data):
+            return len(my_guilds)
+
+        @bot.on
+        async def ready(event):
+            counts = await bot.ipc.request("broadcast", {"op": "guild_count"})
+            print(f"The bot is in {sum(counts)} guilds.")
+
+    if __name__ == "__main__":
+        ClusterManager(token, intents, setup, clusters=4).start()
+    ```
+
+    Every process has a `shards` handler registered for shard latencies.
+    An `eval` handler for broadcast evaluation is also registered when
+    `allow_eval` is given, as it runs any code sent to it.
+
+    ---
+
+    Attributes
+    ----------
+    token : `str`
+        The bots token.
+    intents : `Intents`
+        The intents to connect with.
+    setup : `typing.Callable`, optional
+        The function registering callbacks onto the bot of every process.
+        This must be picklable, i.e. defined at the top of a module.
+    clusters : `int`
+        The amount of processes to run.
+    shard_count : `int`, optional
+        The total amount of shards to run. This is determined by Discord
+        when not given.
+    session_file : `str`, optional
+        The path of the file the sessions of every shard are persisted to.
+        Every process is given its own file, suffixed with its cluster ID.
+    allow_eval : `bool`
+        Whether every process registers the `eval` handler or not.
+    scheduler : `IdentifyScheduler`, optional
+        The scheduler for the identification of every shard across processes.
+    channels : `list[IPCChannel]`
+        The channels to every process, ordered by their cluster ID.
+    _waiting : `set[int]`
+        The IDs of the shards waiting to identify.
+    _abandoned : `set[int]`
+        The IDs of the waiting shards whose process has stopped waiting.
+    """
+
+    __slots__ = (
+        "token",
+        "intents",
+        "setup",
+        "clusters",
+        "shard_count",
+        "session_file",
+        "allow_eval",
+        "scheduler",
+        "channels",
+        "_waiting",
+        "_abandoned",
+    )
+    token: str
+    """The bots token."""
+    intents: Intents
+    """The intents to connect with."""
+    setup: Callable | None
+    """
+    The function registering callbacks onto the bot of every process.
+    This must be picklable, i.e. defined at the top of a module.
+    """
+    clusters: int
+    """The amount of processes to run."""
+    shard_count: int | MISSING
+    """The total amount of shards to run. This is determined by Discord when not given."""
+    session_file: str | MISSING
+    """
+    The path of the file the sessions of every shard are persisted to.
+    Every process is given its own file, suffixed with its cluster ID.
+    """
+    allow_eval: bool
+    """Whether every process registers the `eval` handler or not."""
+    scheduler: IdentifyScheduler | None
+    """The scheduler for the identification of every shard across processes."""
+    channels: list[IPCChannel]
+    """The channels to every process, ordered by their cluster ID."""
+    _waiting: set[int]
+    """The IDs of the shards waiting to identify."""
+    _abandoned: set[int]
+    """The IDs of the waiting shards whose process has stopped waiting."""
+
+    def __init__(
+        self,
+        token: str,
+        intents: Intents,
+        setup: Callable | None = None,
+        *,
+        clusters: NotNeeded[int] = MISSING,
+        shard_count: NotNeeded[int] = MISSING,
+        session_file: NotNeeded[str] = MISSING,
+        allow_eval: bool = False,
+    ):
+        """
+        Creates a new manager for a cluster of processes.
+
+        Parameters
+        ----------
+        token : `str`
+            The bots token to connect with.
+        intents : `Intents`
+            The intents to connect with.
+        setup : `typing.Callable`, optional
+            The function registering callbacks onto the bot of every process.
+        clusters : `int`, optional
+            The amount of processes to run. Defaults to the amount of
+            CPU cores, bounded by the amount of shards.
+        shard_count : `int`, optional
+            The total amount of shards to run. Defaults to the amount
+            recommended by Discord.
+        session_file : `str`, optional
+            The path of a file to persist every shard's session to upon
+            shutting down. Defaults to no persistence.
+        allow_eval : `bool`, optional
+            Whether every process registers an `eval` handler, running
+            the code sent to it. Defaults to `False`.
+        """
+        self.token = token
+        self.intents = intents
+        self.setup = setup
+        self.clusters = (cpu_count() or 1) if clusters is MISSING else clusters
+        self.shard_count = shard_count
+        self.session_file = session_file
+        self.allow_eval = allow_eval
+        self.scheduler = None
+        self.channels = []
+        self._waiting = set()
+        self._abandoned = set()
+
+    def start(self):
+        """Starts every process of the cluster and blocks until they have all exited."""
+        run(self._run)
+
+    async def _run(self):
+        """Spawns every process of the cluster and serves their requests."""
+        http = HTTPClient(self.token)
+        data = await http.request("GET", Endpoint.GET_GATEWAY_BOT)
+        await http.aclose()
+
+        if self.shard_count is MISSING:
+            self.shard_count = data["shards"]
+        self.scheduler = IdentifyScheduler.from_limit(data.get("session_start_limit", {}))
+        self.clusters = max(min(self.clusters, self.shard_count), 1)
+
+        size, extra = divmod(self.shard_count, self.clusters)
+        context = get_context("spawn")
+        processes = []
+        start = 0
+
+        for cluster_id in range(self.clusters):
+            end = start + size + (1 if cluster_id < extra else 0)
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_run_cluster,
+                args=(
+                    cluster_id,
+                    self.token,
+                    self.intents,
+                    list(range(start, end)),
+                    self.shard_count,
+                    self.setup,
+                    MISSING
+                    if self.session_file is MISSING
+                    else f"{self.session_file}.{cluster_id}",
+                    self.allow_eval,
+                    child,
+                ),
+                name=f"retux-cluster-{cluster_id}",
+                daemon=True,
+            )
+            process.start()
+            child.close()
+
+            channel = IPCChannel(parent)
+            channel.handler(self._identify, name="identify")
+            channel.handler(self._abandon, name="abandon")
+            channel.handler(self._release, name="release")
+            channel.handler(self._broadcast, name="broadcast")
+            self.channels.append(channel)
+            processes.append(process)
+            start = end
+
+        logger.info(f"Started {self.clusters} cluster(s) for {self.shard_count} shard(s).")
+
+        async with open_nursery() as nursery:
+            for channel in self.channels:
+                nursery.start_soon(channel.listen)
+            for process in processes:
+                nursery.start_soon(to_thread.run_sync, process.join)
+
+    async def _identify(self, shard_id: int):
+        """
+        Handles a request to wait until a shard is allowed to identify.
+
+        Parameters
+        ----------
+        shard_id : `int`
+            The ID of the shard identifying.
+        """
+        self._waiting.add(shard_id)
+
+        try:
+            await self.scheduler.wait(shard_id)
+        finally:
+            self._waiting.discard(shard_id)
+
+        if shard_id in self._abandoned:
+            self._abandoned.discard(shard_id)
+            await self.scheduler.release(shard_id, identified=False)
+
+    async def _abandon(self, shard_id: int):
+        """
+        Handles a request to give up on a shard's wait to identify.
+
+        ---
+
+        The process stops waiting on its reply, so the bucket is freed
+        as soon as it is given to the shard, if it has not been yet.
+
+        ---
+
+        Parameters
+        ----------
+        shard_id : `int`
+            The ID of the shard.
+        """
+        if shard_id in self._waiting:
+            self._abandoned.add(shard_id)
+        else:
+            await self.scheduler.release(shard_id, identified=False)
+
+    async def _release(self, data: tuple[int, bool]):
+        """
+        Handles a request to free the identification bucket of a shard.
+
+        Parameters
+        ----------
+        data : `tuple[int, bool]`
+            The ID of the shard, and whether it has identified or not.
+        """
+        await self.scheduler.release(*data)
+
+    async def _broadcast(self, data: dict) -> list[Any]:
+        """
+        Handles a broadcast request made by a process of the cluster.
+
+        Parameters
+        ----------
+        data : `dict`
+            The request to broadcast, given as `{"op": ..., "data": ...}`.
+
+        Returns
+        -------
+        `list[typing.Any]`
+            The replies of every process, ordered by their cluster ID.
+        """
+        return await self.broadcast(data["op"], data.get("data"))
+
+    async def broadcast(self, op: str, data: Any = None) -> list[Any]:
+        """
+        Makes a request to every process of the cluster.
+
+        Parameters
+        ----------
+        op : `str`
+            The name of the request.
+        data : `typing.Any`, optional
+            The data of the request. This must be picklable.
+
+        Returns
+        -------
+        `list[typing.Any]`
+            The replies of every process, ordered by their cluster ID.
+            A process whose handler has failed replies with its `IPCError`.
+        """
+        replies = [None] * len(self.channels)
+
+        async def gather(index: int, channel: IPCChannel):
+            try:
+                replies[index] = await channel.request(op, data)
+            except IPCError as err:
+                replies[index] = err
+
+        async with open_nursery() as nursery:
+            for index, channel in enumerate(self.channels):
+                nursery.start_soon(gather, index, channel)
+
+        return replies
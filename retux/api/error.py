@@ -92,3 +92,12 @@ class RandomClose(Exception):
 
     These can occur for whatever reason and must be properly handled.
     """
+
+
+class IPCError(Exception):
+    """
+    A request made to another process of a cluster has failed.
+
+    This may be raised from an exception inside of the handler of the
+    request, or from the connection to the process being closed.
+    """
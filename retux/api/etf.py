@@ -0,0 +1,296 @@
+from enum import IntEnum
+from struct import Struct
+from typing import Any
+
+__all__ = ("loads", "dumps")
+
+try:
+    import erlpack
+except ImportError:
+    erlpack = None
+    _erlpack_decoder = None
+else:
+    _erlpack_decoder = erlpack.ErlangTermDecoder(encoding="utf-8")
+
+_VERSION = 131
+"""The version byte prefixed to data in the Erlang term format."""
+
+
+class _Term(IntEnum):
+    """Represents the tag of a term in the Erlang term format."""
+
+    NEW_FLOAT_EXT = 70
+    SMALL_INTEGER_EXT = 97
+    INTEGER_EXT = 98
+    FLOAT_EXT = 99
+    ATOM_EXT = 100
+    SMALL_TUPLE_EXT = 104
+    LARGE_TUPLE_EXT = 105
+    NIL_EXT = 106
+    STRING_EXT = 107
+    LIST_EXT = 108
+    BINARY_EXT = 109
+    SMALL_BIG_EXT = 110
+    LARGE_BIG_EXT = 111
+    SMALL_ATOM_EXT = 115
+    MAP_EXT = 116
+    ATOM_UTF8_EXT = 118
+    SMALL_ATOM_UTF8_EXT = 119
+
+
+_U16 = Struct(">H")
+_U32 = Struct(">I")
+_I32 = Struct(">i")
+_F64 = Struct(">d")
+
+_ATOMS = {"nil": None, "null": None, "true": True, "false": False}
+"""The atoms with a native Python equivalent."""
+
+
+class _Decoder:
+    """
+    Represents a pure-Python decoder of the Erlang term format.
+
+    ---
+
+    Binaries are decoded as UTF-8 strings and atoms are decoded into
+    their Python equivalent when one exists, so that decoded payloads
+    share the same shape as their JSON counterpart.
+
+    ---
+
+    Attributes
+    ----------
+    data : `bytes`
+        The data being decoded.
+    pos : `int`
+        The current position of the decoder inside `data`.
+    """
+
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+
+    def decode(self) -> Any:
+        """Decodes the next term of the data."""
+        data = self.data
+        tag = data[self.pos]
+        self.pos += 1
+
+        match tag:
+            case _Term.SMALL_INTEGER_EXT:
+                self.pos += 1
+                return data[self.pos - 1]
+            case _Term.INTEGER_EXT:
+                self.pos += 4
+                return _I32.unpack_from(data, self.pos - 4)[0]
+            case _Term.BINARY_EXT:
+                size = _U32.unpack_from(data, self.pos)[0]
+                self.pos += 4 + size
+                return data[self.pos - size : self.pos].decode("utf-8")
+            case _Term.MAP_EXT:
+                arity = _U32.unpack_from(data, self.pos)[0]
+                self.pos += 4
+                return {self.decode(): self.decode() for _ in range(arity)}
+            case _Term.LIST_EXT:
+                size = _U32.unpack_from(data, self.pos)[0]
+                self.pos += 4
+                items = [self.decode() for _ in range(size)]
+                tail = self.decode()
+
+                if tail != []:
+                    items.append(tail)
+                return items
+            case _Term.NIL_EXT:
+                return []
+            case _Term.SMALL_BIG_EXT | _Term.LARGE_BIG_EXT:
+                if tag == _Term.SMALL_BIG_EXT:
+                    size = data[self.pos]
+                    self.pos += 1
+                else:
+                    size = _U32.unpack_from(data, self.pos)[0]
+                    self.pos += 4
+
+                sign = data[self.pos]
+                self.pos += 1 + size
+                value = int.from_bytes(data[self.pos - size : self.pos], "little")
+                return -value if sign else value
+            case _Term.ATOM_EXT | _Term.ATOM_UTF8_EXT:
+                size = _U16.unpack_from(data, self.pos)[0]
+                self.pos += 2 + size
+                return self._atom(data[self.pos - size : self.pos])
+            case _Term.SMALL_ATOM_EXT | _Term.SMALL_ATOM_UTF8_EXT:
+                size = data[self.pos]
+                self.pos += 1 + size
+                return self._atom(data[self.pos - size : self.pos])
+            case _Term.NEW_FLOAT_EXT:
+                self.pos += 8
+                return _F64.unpack_from(data, self.pos - 8)[0]
+            case _Term.FLOAT_EXT:
+                self.pos += 31
+                return float(data[self.pos - 31 : self.pos].rstrip(b"\x00"))
+            case _Term.STRING_EXT:
+                size = _U16.unpack_from(data, self.pos)[0]
+                self.pos += 2 + size
+                return list(data[self.pos - size : self.pos])
+            case _Term.SMALL_TUPLE_EXT | _Term.LARGE_TUPLE_EXT:
+                if tag == _Term.SMALL_TUPLE_EXT:
+                    arity = data[self.pos]
+                    self.pos += 1
+                else:
+                    arity = _U32.unpack_from(data, self.pos)[0]
+                    self.pos += 4
+                return [self.decode() for _ in range(arity)]
+            case _:
+                raise ValueError(f"Unsupported Erlang term format tag: {tag}")
+
+    @staticmethod
+    def _atom(value: bytes) -> Any:
+        """Converts an atom into its Python equivalent, if any."""
+        atom = value.decode("utf-8")
+        return _ATOMS.get(atom, atom)
+
+
+def _normalize(obj: Any) -> Any:
+    """
+    Normalises data decoded by `erlpack` into the shape given
+    by the pure-Python decoder.
+
+    ---
+
+    `erlpack` leaves atoms as `erlpack.Atom` and tuples as `tuple`,
+    and returns binaries as `bytes` when not given an encoding.
+    """
+    match obj:
+        case dict():
+            return {_normalize(key): _normalize(value) for key, value in obj.items()}
+        case list() | tuple():
+            return [_normalize(item) for item in obj]
+        case bytes():
+            return obj.decode("utf-8")
+        case str() if type(obj) is not str:
+            atom = str(obj)
+            return _ATOMS.get(atom, atom)
+        case _:
+            return obj
+
+
+def _encode(obj: Any, buffer: bytearray):
+    """
+    Encodes a Python object into the Erlang term format.
+
+    Parameters
+    ----------
+    obj : `typing.Any`
+        The object to encode.
+    buffer : `bytearray`
+        The buffer to write the encoded term to.
+    """
+    if obj is None:
+        buffer += b"\x73\x03nil"
+    elif obj is True:
+        buffer += b"\x73\x04true"
+    elif obj is False:
+        buffer += b"\x73\x05false"
+    elif isinstance(obj, int):
+        if 0 <= obj <= 255:
+            buffer.append(_Term.SMALL_INTEGER_EXT)
+            buffer.append(obj)
+        elif -(2**31) <= obj < 2**31:
+            buffer.append(_Term.INTEGER_EXT)
+            buffer += _I32.pack(obj)
+        else:
+            digits = abs(obj).to_bytes((abs(obj).bit_length() + 7) // 8, "little")
+            buffer.append(_Term.SMALL_BIG_EXT)
+            buffer.append(len(digits))
+            buffer.append(int(obj < 0))
+            buffer += digits
+    elif isinstance(obj, float):
+        buffer.append(_Term.NEW_FLOAT_EXT)
+        buffer += _F64.pack(obj)
+    elif isinstance(obj, (str, bytes)):
+        value = obj.encode("utf-8") if isinstance(obj, str) else obj
+        buffer.append(_Term.BINARY_EXT)
+        buffer += _U32.pack(len(value))
+        buffer += value
+    elif isinstance(obj, dict):
+        buffer.append(_Term.MAP_EXT)
+        buffer += _U32.pack(len(obj))
+        for key, value in obj.items():
+            _encode(key, buffer)
+            _encode(value, buffer)
+    elif isinstance(obj, (list, tuple)):
+        if not obj:
+            buffer.append(_Term.NIL_EXT)
+            return
+        buffer.append(_Term.LIST_EXT)
+        buffer += _U32.pack(len(obj))
+        for value in obj:
+            _encode(value, buffer)
+        buffer.append(_Term.NIL_EXT)
+    else:
+        raise TypeError(f"Object of type {type(obj).__name__} is not ETF serializable")
+
+
+def loads(data: bytes) -> Any:
+    """
+    Decodes data in the Erlang term format.
+
+    ---
+
+    If `erlpack` is installed, it will be used in place of
+    the pure-Python decoder. Its output is normalised so that
+    both decoders return the same data.
+
+    ---
+
+    Parameters
+    ----------
+    data : `bytes`
+        The data to decode.
+
+    Returns
+    -------
+    `typing.Any`
+        The decoded data.
+    """
+    if erlpack is not None:
+        return _normalize(_erlpack_decoder.loads(data))
+
+    if data[0] != _VERSION:
+        raise ValueError("The data given is not in the Erlang term format.")
+
+    decoder = _Decoder(data)
+    decoder.pos = 1
+    return decoder.decode()
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encodes an object in the Erlang term format.
+
+    ---
+
+    If `erlpack` is installed, it will be used in place of
+    the pure-Python encoder.
+
+    ---
+
+    Parameters
+    ----------
+    obj : `typing.Any`
+        The object to encode.
+
+    Returns
+    -------
+    `bytes`
+        The encoded data.
+    """
+    if erlpack is not None:
+        return erlpack.pack(obj)
+
+    buffer = bytearray((_VERSION,))
+    _encode(obj, buffer)
+    return bytes(buffer)
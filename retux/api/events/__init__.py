@@ -1,4 +1,5 @@
 from .abc import *  # noqa
+from .channel import *  # noqa
 from .connection import *  # noqa
-from .guild import *  # noqa
-from .message import *  # noqa
+from .interaction import *  # noqa
+from .misc import *  # noqa
@@ -1,18 +1,144 @@
-from .guild import _GuildEvents
-from .message import _MessageEvents
-from .misc import TypingStart
+from typing import Any
 
+from attrs import NOTHING, fields, has
 
-class _EventTable(_MessageEvents, _GuildEvents):
+from ...client.resources.channel import Channel, Message, ThreadChannel, ThreadMember
+from ...client.resources.guild import Guild
+from ...utils.conversion import structure
+from .channel import ChannelPinsUpdate, ThreadListSync, ThreadMembersUpdate
+from .interaction import InteractionCreate
+from .misc import PresenceUpdate, TypingStart
+
+__all__ = ("register_event",)
+
+
+class _EventTable:
     """
     Stores events from the Gateway for potential use dispatching.
+
+    ---
+
+    Events are looked up by their name in a single mapping, and
+    structured with the specialized functions of retux's converter.
+    Events without a model are dispatched as their raw data.
     """
 
+    _events: dict[str, type] = {
+        "CHANNEL_CREATE": Channel,
+        "CHANNEL_UPDATE": Channel,
+        "CHANNEL_DELETE": Channel,
+        "CHANNEL_PINS_UPDATE": ChannelPinsUpdate,
+        "THREAD_CREATE": ThreadChannel,
+        "THREAD_UPDATE": ThreadChannel,
+        "THREAD_DELETE": ThreadChannel,
+        "THREAD_LIST_SYNC": ThreadListSync,
+        "THREAD_MEMBER_UPDATE": ThreadMember,
+        "THREAD_MEMBERS_UPDATE": ThreadMembersUpdate,
+        "GUILD_CREATE": Guild,
+        "INTERACTION_CREATE": InteractionCreate,
+        "MESSAGE_CREATE": Message,
+        "MESSAGE_UPDATE": Message,
+        "PRESENCE_UPDATE": PresenceUpdate,
+        "TYPING_START": TypingStart,
+    }
+    """The models of every event, registered by their name."""
+    _partial: frozenset[str] = frozenset({"MESSAGE_UPDATE"})
+    """The events whose data may only carry the fields that changed."""
+
     @classmethod
-    def lookup(self, name: str, data: dict):
-        if messages := _MessageEvents.lookup(name, data):
-            return messages
-        elif guilds := _GuildEvents.lookup(name, data):
-            return guilds
-        if name == "TYPING_START":
-            return TypingStart
+    def lookup(cls, name: str, data: dict | None = None) -> type | None:
+        """
+        Looks up the model of an event.
+
+        ---
+
+        Events which may be partial are only given their model
+        when `data` carries every field the model requires, and
+        are otherwise dispatched as their raw data.
+
+        ---
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the event, as given by the Gateway.
+        data : `dict`, optional
+            The data of the event, checked when it may be partial.
+
+        Returns
+        -------
+        `type`, optional
+            The model of the event, if one is registered.
+        """
+        model = cls._events.get(name)
+
+        if name in cls._partial and data is not None and has(model):
+            for attr in fields(model):
+                if attr.init and attr.default is NOTHING and attr.alias not in data:
+                    return None
+        return model
+
+    @classmethod
+    def register(cls, name: str, model: type):
+        """
+        Registers the model of an event.
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the event, as given by the Gateway.
+        model : `type`
+            The model to structure the event's data into.
+        """
+        cls._events[name] = model
+
+    @classmethod
+    def structure(cls, data: dict, model: type) -> Any:
+        """
+        Structures the data of an event into its model.
+
+        Parameters
+        ----------
+        data : `dict`
+            The data of the event.
+        model : `type`
+            The model to structure the data into.
+
+        Returns
+        -------
+        `typing.Any`
+            An instance of the model.
+        """
+        return structure(data, model)
+
+
+def register_event(name: str, model: type):
+    """
+    Registers a model for a Gateway event to be dispatched as.
+
+    ---
+
+    This may be used for events retux has no model for, or to
+    replace the model of an existing one.
+
+    ---
+
+    Examples
+    --------
+    ```
+    @define()
+    class AutoModerationActionExecution:
+        guild_id: retux.Snowflake
+        rule_id: retux.Snowflake
+
+    retux.register_event("AUTO_MODERATION_ACTION_EXECUTION", AutoModerationActionExecution)
+    ```
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the event, as given by the Gateway.
+    model : `type`
+        The model to structure the event's data into.
+    """
+    _EventTable.register(name, model)
@@ -0,0 +1,113 @@
+from attrs import define
+
+from ...client.resources.abc import Snowflake, Timestamp
+from ...client.resources.channel import ThreadChannel, ThreadMember
+
+__all__ = ("ChannelPinsUpdate", "ThreadListSync", "ThreadMembersUpdate")
+
+
+@define(kw_only=True)
+class ChannelPinsUpdate:
+    """
+    Represents a `CHANNEL_PINS_UPDATE` event from Discord.
+
+    ---
+
+    Sent when a message is pinned or unpinned in a channel.
+    This is not sent when a pinned message is deleted.
+
+    ---
+
+    Attributes
+    ----------
+    guild_id : `Snowflake`, optional
+        The ID of the guild of the channel.
+    channel_id : `Snowflake`
+        The ID of the channel.
+    last_pin_timestamp : `Timestamp`, optional
+        The time at which the most recent pinned message was pinned.
+    """
+
+    guild_id: Snowflake = None
+    """The ID of the guild of the channel."""
+    channel_id: Snowflake
+    """The ID of the channel."""
+    last_pin_timestamp: Timestamp = None
+    """The time at which the most recent pinned message was pinned."""
+
+
+@define(kw_only=True)
+class ThreadListSync:
+    """
+    Represents a `THREAD_LIST_SYNC` event from Discord.
+
+    ---
+
+    Sent when the bot gains access to a channel, containing
+    every active thread in that channel.
+
+    ---
+
+    Attributes
+    ----------
+    guild_id : `Snowflake`
+        The ID of the guild.
+    channel_ids : `list[Snowflake]`, optional
+        The IDs of the parent channels whose threads are being synced.
+
+        When omitted, threads were synced for the entire guild.
+    threads : `list[ThreadChannel]`
+        The active threads in the given channels.
+    members : `list[ThreadMember]`
+        The thread members for the bot in every active thread.
+    """
+
+    guild_id: Snowflake
+    """The ID of the guild."""
+    channel_ids: list[Snowflake] = None
+    """
+    The IDs of the parent channels whose threads are being synced.
+
+    When omitted, threads were synced for the entire guild.
+    """
+    threads: list[ThreadChannel]
+    """The active threads in the given channels."""
+    members: list[ThreadMember]
+    """The thread members for the bot in every active thread."""
+
+
+@define(kw_only=True)
+class ThreadMembersUpdate:
+    """
+    Represents a `THREAD_MEMBERS_UPDATE` event from Discord.
+
+    ---
+
+    Sent when anyone is added to or removed from a thread.
+
+    ---
+
+    Attributes
+    ----------
+    id : `Snowflake`
+        The ID of the thread.
+    guild_id : `Snowflake`
+        The ID of the guild.
+    member_count : `int`
+        The approximate amount of members in the thread, stopping at 50.
+    added_members : `list[ThreadMember]`, optional
+        The members added to the thread.
+    removed_member_ids : `list[Snowflake]`, optional
+        The IDs of the members removed from the thread.
+    """
+
+    id: Snowflake
+    """The ID of the thread."""
+    guild_id: Snowflake
+    """The ID of the guild."""
+    member_count: int
+    """The approximate amount of members in the thread, stopping at 50."""
+    added_members: list[ThreadMember] = None
+    """The members added to the thread."""
+    removed_member_ids: list[Snowflake] = None
+    """The IDs of the members removed from the thread."""
@@ -114,16 +114,12 @@ class Resumed:
 
     Attributes
     ----------
-    token : `str`
-        The token of the bot used.
     session_id : `str`
         The ID of the Gateway connection session.
     seq : `int`
         The last sequence number given for the session.
     """
 
-    token: str
-    """The token of the bot used."""
     session_id: str
     """The ID of the Gateway connection session."""
     seq: int
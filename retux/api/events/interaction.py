@@ -0,0 +1,111 @@
+from enum import IntEnum
+
+from attrs import define
+
+from ...client.resources.abc import Object, Snowflake
+from ...client.resources.guild import Member
+from ...client.resources.user import User
+
+__all__ = ("InteractionType", "InteractionCreate")
+
+
+class InteractionType(IntEnum):
+    """
+    Represents the types of interactions from Discord.
+
+    Constants
+    ---------
+    PING
+        A ping, only sent to interactions received over HTTP.
+    APPLICATION_COMMAND
+        An application command being ran.
+    MESSAGE_COMPONENT
+        A component of a message being interacted with.
+    APPLICATION_COMMAND_AUTOCOMPLETE
+        An option of an application command requesting choices.
+    MODAL_SUBMIT
+        A modal being submitted.
+    """
+
+    PING = 1
+    """A ping, only sent to interactions received over HTTP."""
+    APPLICATION_COMMAND = 2
+    """An application command being ran."""
+    MESSAGE_COMPONENT = 3
+    """A component of a message being interacted with."""
+    APPLICATION_COMMAND_AUTOCOMPLETE = 4
+    """An option of an application command requesting choices."""
+    MODAL_SUBMIT = 5
+    """A modal being submitted."""
+
+
+@define(kw_only=True)
+class InteractionCreate(Object):
+    """
+    Represents an `INTERACTION_CREATE` event from Discord.
+
+    ---
+
+    Sent when a user runs an application command,
+    or interacts with a component or modal.
+
+    ---
+
+    Attributes
+    ----------
+    id : `Snowflake`
+        The ID of the interaction.
+    application_id : `Snowflake`
+        The ID of the application the interaction is for.
+    type : `InteractionType`
+        The type of the interaction.
+    data : `dict`, optional
+        The data of the interaction, which varies by its type.
+    guild_id : `Snowflake`, optional
+        The ID of the guild the interaction was sent from.
+    channel_id : `Snowflake`, optional
+        The ID of the channel the interaction was sent from.
+    member : `Member`, optional
+        The member who invoked the interaction, if sent from a guild.
+    user : `User`, optional
+        The user who invoked the interaction, if sent from a DM.
+    token : `str`
+        The token used for responding to the interaction.
+    version : `int`
+        The version of the interaction. This is always `1`.
+    message : `dict`, optional
+        The message the component interacted with is attached to.
+    app_permissions : `str`, optional
+        The permissions of the application in the channel, if sent from a guild.
+    locale : `str`, optional
+        The locale of the user who invoked the interaction.
+    guild_locale : `str`, optional
+        The preferred locale of the guild, if sent from a guild.
+    """
+
+    application_id: Snowflake
+    """The ID of the application the interaction is for."""
+    type: InteractionType
+    """The type of the interaction."""
+    data: dict = None
+    """The data of the interaction, which varies by its type."""
+    guild_id: Snowflake = None
+    """The ID of the guild the interaction was sent from."""
+    channel_id: Snowflake = None
+    """The ID of the channel the interaction was sent from."""
+    member: Member = None
+    """The member who invoked the interaction, if sent from a guild."""
+    user: User = None
+    """The user who invoked the interaction, if sent from a DM."""
+    token: str
+    """The token used for responding to the interaction."""
+    version: int = 1
+    """The version of the interaction. This is always `1`."""
+    message: dict = None
+    """The message the component interacted with is attached to."""
+    app_permissions: str = None
+    """The permissions of the application in the channel, if sent from a guild."""
+    locale: str = None
+    """The locale of the user who invoked the interaction."""
+    guild_locale: str = None
+    """The preferred locale of the guild, if sent from a guild."""
@@ -1,10 +1,10 @@
-from datetime import datetime
+from attrs import define
 
-from attrs import define, field
-
-from ...client.resources.abc import Snowflake
+from ...client.resources.abc import Snowflake, Timestamp
 from ...client.resources.guild import Member
 
+__all__ = ("TypingStart", "PresenceUpdate")
+
 
 @define()
 class TypingStart:
@@ -23,7 +23,7 @@ class TypingStart:
         The ID of the channel when typing occured.
     user_id : `Snowflake`
         The ID of the user who started typing.
-    timestamp : `datetime.datetime`
+    timestamp : `Timestamp`
         The timestamp of when the typing occured.
     guild_id : `Snowflake`, optional
         The ID of the guild when typing occured.
@@ -41,7 +41,7 @@ class TypingStart:
     """The ID of the channel when typing occured."""
     user_id: Snowflake
     """The ID of the user who started typing."""
-    timestamp: datetime = field(converter=datetime.fromtimestamp)
+    timestamp: Timestamp
     """The timestamp of when the typing occured."""
     guild_id: Snowflake = None
     """
@@ -57,3 +57,47 @@ class TypingStart:
     This will only appear when a user is typing
     outside of a DM.
     """
+
+
+@define(kw_only=True)
+class PresenceUpdate:
+    """
+    Represents a `PRESENCE_UPDATE` event from Discord.
+
+    ---
+
+    Sent when the presence of a member in a guild is updated.
+    This requires the `GUILD_PRESENCES` intent.
+
+    ---
+
+    Attributes
+    ----------
+    user : `dict`
+        The user whose presence was updated.
+
+        Only the `id` of the user is guaranteed to be given.
+    guild_id : `Snowflake`
+        The ID of the guild.
+    status : `str`
+        The status of the user, either `idle`, `dnd`, `online` or `offline`.
+    activities : `list[dict]`
+        The current activities of the user.
+    client_status : `dict`
+        The status of the user per platform, given as `desktop`, `mobile` and `web`.
+    """
+
+    user: dict
+    """
+    The user whose presence was updated.
+
+    Only the `id` of the user is guaranteed to be given.
+    """
+    guild_id: Snowflake
+    """The ID of the guild."""
+    status: str
+    """The status of the user, either `idle`, `dnd`, `online` or `offline`."""
+    activities: list[dict] = None
+    """The current activities of the user."""
+    client_status: dict = None
+    """The status of the user per platform, given as `desktop`, `mobile` and `web`."""
@@ -1,19 +1,41 @@
+from collections import deque
 from enum import IntEnum
-from json import dumps, loads
 from logging import getLogger
+from math import inf
+from os import path, replace
 from random import random
 from sys import platform
+from tempfile import TemporaryFile
 from time import perf_counter
 from typing import Any, Protocol
+from zlib import decompressobj
 
 from attrs import asdict, define, field
-from cattrs import structure
-from trio import Nursery, open_nursery, sleep
+from trio import (
+    CancelScope,
+    EndOfChannel,
+    Event,
+    Lock,
+    MemoryReceiveChannel,
+    MemorySendChannel,
+    Nursery,
+    WouldBlock,
+    current_time,
+    move_on_after,
+    open_memory_channel,
+    open_nursery,
+    sleep,
+    sleep_until,
+    to_thread,
+)
 from trio_websocket import ConnectionClosed, WebSocketConnection, open_websocket_url
 
 from ..client.flags import Intents
 from ..client.resources.abc import Snowflake
 from ..const import MISSING, NotNeeded, __gateway_url__
+from ..utils.conversion import structure
+from ..utils.serializers import json_dumps, json_loads
+from . import etf
 from .error import (
     DisallowedIntents,
     InvalidIntents,
@@ -28,6 +50,18 @@ from .events.connection import HeartbeatAck, InvalidSession, Ready, Reconnect, R
 
 logger = getLogger(__name__)
 
+_ZLIB_SUFFIX = b"\x00\x00\xff\xff"
+"""The suffix of a `Z_SYNC_FLUSH`, marking the end of a compressed `zlib-stream` message."""
+
+_RELEASE_TIMEOUT = 5
+"""The seconds given to freeing the bucket of a scheduler while shutting down."""
+
+_CONNECTION_EVENTS = frozenset({"READY", "RESUMED"})
+"""The dispatched events relating to the connection, which are always tracked."""
+
+_DROPPABLE_EVENTS = frozenset({"PRESENCE_UPDATE", "TYPING_START"})
+"""The dispatched events that may be dropped when the receive queue overflows."""
+
 
 @define()
 class _GatewayMeta:
@@ -45,6 +79,8 @@ class _GatewayMeta:
     """The ID of an existent session, used for when resuming a lost connection."""
     seq: int | None = field(default=None)
     """The sequence number on an existent session."""
+    resume_url: str | None = field(default=None)
+    """The URL of the Gateway used for when resuming a lost connection."""
 
 
 class _GatewayOpCode(IntEnum):
@@ -77,7 +113,175 @@ class _GatewayOpCode(IntEnum):
     """An event received to acknowledge a `HEARTBEAT` sent."""
 
 
-@define(slots=False)
+class _GatewayRateLimit:
+    """
+    Represents the rate limit of commands sent over a Gateway connection.
+
+    ---
+
+    Discord closes a connection sending more than 120 commands in 60 seconds
+    with the code `4008`. Commands are kept in a sliding window so that no
+    60 second period may exceed the limit, and callers wait for room in the
+    window instead of being disconnected.
+
+    A number of slots are reserved for heartbeats, which may always be sent
+    ahead of other commands so the connection is never considered dead.
+
+    ---
+
+    Attributes
+    ----------
+    limit : `int`
+        The amount of commands allowed per window.
+    per : `float`
+        The length of the window in seconds.
+    reserved : `int`
+        The amount of commands in a window reserved for heartbeats.
+    _sent : `collections.deque[float]`
+        The times of the commands sent in the current window, in `trio` clock time.
+    _lock : `trio.Lock`
+        The lock ordering non-heartbeat commands waiting for room in the window.
+    """
+
+    __slots__ = ("limit", "per", "reserved", "_sent", "_lock")
+    limit: int
+    """The amount of commands allowed per window."""
+    per: float
+    """The length of the window in seconds."""
+    reserved: int
+    """The amount of commands in a window reserved for heartbeats."""
+    _sent: deque[float]
+    """The times of the commands sent in the current window, in `trio` clock time."""
+    _lock: Lock
+    """The lock ordering non-heartbeat commands waiting for room in the window."""
+
+    def __init__(self, limit: int = 120, per: float = 60.0, reserved: int = 3):
+        self.limit = limit
+        self.per = per
+        self.reserved = reserved
+        self._sent = deque()
+        self._lock = Lock()
+
+    def _expire(self):
+        """Removes the commands sent outside of the current window."""
+        while self._sent and self._sent[0] <= current_time() - self.per:
+            self._sent.popleft()
+
+    async def acquire(self, priority: bool = False):
+        """
+        Waits until a command may be sent, and marks it as sent.
+
+        Parameters
+        ----------
+        priority : `bool`, optional
+            Whether the command may use the reserved slots or not.
+            This should only be used for heartbeats. Defaults to `False`.
+        """
+        if priority:
+            self._expire()
+            while len(self._sent) >= self.limit:
+                await sleep_until(self._sent[0] + self.per)
+                self._expire()
+        else:
+            async with self._lock:
+                self._expire()
+                while len(self._sent) >= self.limit - self.reserved:
+                    logger.warning(
+                        "Gateway commands are being rate limited. "
+                        f"Waiting {self._sent[0] + self.per - current_time():.2f}s to send."
+                    )
+                    await sleep_until(self._sent[0] + self.per)
+                    self._expire()
+
+        self._sent.append(current_time())
+
+
+class _GatewaySpill:
+    """
+    Represents a file that messages overflowing the receive queue are spilled to.
+
+    ---
+
+    Messages are written with a 4-byte length prefix, and are read back
+    in the order they were written. The file is truncated whenever every
+    message has been read back.
+
+    Reading and writing happen in a worker thread, one at a time, so
+    that the disk never blocks the Gateway connection.
+
+    ---
+
+    Attributes
+    ----------
+    count : `int`
+        The amount of messages written to the file that have not been read back.
+    _file : `typing.BinaryIO`
+        The temporary file the messages are written to.
+    _read_at : `int`
+        The position of the next message to read back.
+    _lock : `trio.Lock`
+        The lock held while reading from or writing to the file.
+    """
+
+    __slots__ = ("count", "_file", "_read_at", "_lock")
+    count: int
+    """The amount of messages written to the file that have not been read back."""
+    _file: Any
+    """The temporary file the messages are written to."""
+    _read_at: int
+    """The position of the next message to read back."""
+    _lock: Lock
+    """The lock held while reading from or writing to the file."""
+
+    def __init__(self, file: Any):
+        self.count = 0
+        self._file = file
+        self._read_at = 0
+        self._lock = Lock()
+
+    @classmethod
+    async def open(cls) -> "_GatewaySpill":
+        """Creates a spill backed by a new temporary file."""
+        return cls(await to_thread.run_sync(TemporaryFile))
+
+    async def push(self, message: str | bytes):
+        """Writes a message to the end of the file."""
+        data = message.encode("utf-8") if isinstance(message, str) else message
+
+        async with self._lock:
+            await to_thread.run_sync(self._write, len(data).to_bytes(4, "big") + data)
+
+        # Only counted once written, so that it is never read back before.
+        self.count += 1
+
+    async def pop(self) -> bytes:
+        """Reads back the oldest message in the file."""
+        async with self._lock:
+            self.count -= 1
+            return await to_thread.run_sync(self._read, not self.count)
+
+    def _write(self, data: bytes):
+        self._file.seek(0, 2)
+        self._file.write(data)
+
+    def _read(self, truncate: bool) -> bytes:
+        self._file.seek(self._read_at)
+        size = int.from_bytes(self._file.read(4), "big")
+        data = self._file.read(size)
+        self._read_at += 4 + size
+
+        if truncate:
+            self._file.seek(0)
+            self._file.truncate()
+            self._read_at = 0
+        return data
+
+    def close(self):
+        """Closes and removes the file."""
+        self._file.close()
+
+
+@define()
 class _GatewayPayload:
     """
     Represents a Gateway payload, signifying data for events.
@@ -128,6 +332,7 @@ class GatewayProtocol(Protocol):
         version: int = 10,
         encoding: str = "json",
         compress: NotNeeded[str] = MISSING,
+        shard: NotNeeded[list[int]] = MISSING,
     ):
         ...
 
@@ -182,6 +387,18 @@ class GatewayClient(GatewayProtocol):
         The bots token.
     intents : `Intents`
         The intents to connect with.
+    shard : `list[int]`, optional
+        The shard of the connection, given as `[shard_id, num_shards]`.
+    session_file : `str`, optional
+        The path of the file the session is persisted to between restarts.
+    overflow : `str`
+        The policy for messages received while the receive queue is full.
+    queue_size : `int`
+        The amount of messages the receive queue holds before overflowing.
+    _scheduler : `IdentifyScheduler`, optional
+        The scheduler to wait on before identifying.
+    _holding : `bool`
+        Whether the connection is holding its bucket of the scheduler or not.
     _conn : `trio_websocket.WebSocketConnection`
         An instance of a connection to the Gateway.
     _meta : `_GatewayMeta`
@@ -193,20 +410,46 @@ class GatewayClient(GatewayProtocol):
     _stopped : `bool`
         Whether the Gateway connection was forcefully stopped or not.
     _heartbeat_ack : `bool`
-        Whether we've received the first heartbeat acknowledgement or not.
+        Whether the last heartbeat sent was acknowledged or not.
     _last_ack : `list[float]`
-        The before/after time of the last Gateway event tracked. See `latency` for Gateway connection timing.
+        The time the last heartbeat was sent and acknowledged. See `latency` for Gateway connection timing.
+    _hello : `trio.Event`
+        The event set once the connection receives its `HELLO` payload.
+    _reader : `trio.CancelScope`
+        The cancel scope of the task reading from the connection.
     _bots : `list[retux.Bot]`
         The bot instances used for dispatching events.
+    _consumers : `set[str]`
+        The names of events consumed internally, regardless of any callbacks.
+    _zlib : `zlib._Decompress`
+        The shared decompressor of the connection, used for `zlib-stream` compression.
+    _buffer : `bytearray`
+        The buffer of compressed frames awaiting a `Z_SYNC_FLUSH` suffix.
+    _rate_limit : `_GatewayRateLimit`
+        The rate limit of commands sent over the connection.
+    _spill : `_GatewaySpill`, optional
+        The file messages are spilled to when the receive queue overflows.
     """
 
-    # TODO: Add sharding and presence changing.
+    # TODO: Add presence changing.
 
     __slots__ = ("token", "intents", "_meta")
     token: str
     """The bots token."""
     intents: Intents
     """The intents to connect with."""
+    shard: list[int] | MISSING = MISSING
+    """The shard of the connection, given as `[shard_id, num_shards]`."""
+    session_file: str | MISSING = MISSING
+    """The path of the file the session is persisted to between restarts."""
+    overflow: str = "block"
+    """The policy for messages received while the receive queue is full."""
+    queue_size: int = 256
+    """The amount of messages the receive queue holds before overflowing."""
+    _scheduler: "IdentifyScheduler" = MISSING  # noqa
+    """The scheduler to wait on before identifying."""
+    _holding: bool = False
+    """Whether the connection is holding its bucket of the scheduler or not."""
     _conn: WebSocketConnection = None
     """An instance of a connection to the Gateway."""
     _meta: _GatewayMeta
@@ -218,11 +461,25 @@ class GatewayClient(GatewayProtocol):
     _stopped: bool = False
     """Whether the Gateway connection was forcefully stopped or not."""
     _heartbeat_ack: bool = False
-    """Whether we've received the first heartbeat acknowledgement or not."""
+    """Whether the last heartbeat sent was acknowledged or not."""
     _last_ack: list[float] = []
-    """The before/after time of the last Gateway event tracked. See `latency` for Gateway connection timing."""
+    """The time the last heartbeat was sent and acknowledged. See `latency` for Gateway connection timing."""
+    _hello: Event = None
+    """The event set once the connection receives its `HELLO` payload."""
+    _reader: CancelScope = None
+    """The cancel scope of the task reading from the connection."""
     _bots: list["Bot"] = []  # noqa
     """The bot instances used for dispatching events."""
+    _consumers: set[str] = set()
+    """The names of events consumed internally, regardless of any callbacks."""
+    _zlib: object = None
+    """The shared decompressor of the connection, used for `zlib-stream` compression."""
+    _buffer: bytearray = None
+    """The buffer of compressed frames awaiting a `Z_SYNC_FLUSH` suffix."""
+    _rate_limit: _GatewayRateLimit = None
+    """The rate limit of commands sent over the connection."""
+    _spill: _GatewaySpill = None
+    """The file messages are spilled to when the receive queue overflows."""
 
     def __init__(
         self,
@@ -232,6 +489,11 @@ class GatewayClient(GatewayProtocol):
         version: int = 10,
         encoding: str = "json",
         compress: str = None,
+        shard: NotNeeded[list[int]] = MISSING,
+        scheduler: NotNeeded["IdentifyScheduler"] = MISSING,  # noqa
+        session_file: NotNeeded[str] = MISSING,
+        overflow: str = "block",
+        queue_size: int = 256,
     ):
         """
         Creates a new connection to the Gateway.
@@ -246,31 +508,85 @@ class GatewayClient(GatewayProtocol):
             The version of the Gateway to use. Defaults to version `10`.
         encoding : `str`, optional
             The type of encoding to use on payloads. Defaults to `json`.
+
+            Payloads may either be encoded as `json` or `etf`, the latter
+            of which is the Erlang term format.
         compress : `str`, optional
             The type of data compression to use on payloads. Defaults to none.
+
+            Only `zlib-stream` is supported, which shares one decompression
+            context across the entire connection.
+        shard : `list[int]`, optional
+            The shard to identify with, given as `[shard_id, num_shards]`.
+            Defaults to no sharding.
+        scheduler : `IdentifyScheduler`, optional
+            The scheduler to wait on before identifying. This is
+            shared between shards by `ShardManager`.
+        session_file : `str`, optional
+            The path of a file to persist the session to upon shutting down.
+            When given, the session in the file is resumed upon starting
+            before falling back to identifying. Defaults to no persistence.
+        overflow : `str`, optional
+            The policy for messages received while the receive queue is full.
+            Defaults to `block`.
+
+            Messages are read from the socket separately from being processed.
+            Once `queue_size` messages are waiting, reading may either `block`
+            until there is room, `drop` presence and typing events, or `spill`
+            messages to a temporary file to be processed later on. Blocking
+            falls back to spilling after a quarter of the heartbeat interval,
+            so that heartbeat acknowledgements are still read in time.
+        queue_size : `int`, optional
+            The amount of messages waiting to be processed before overflowing.
+            Defaults to `256`.
         """
+        if encoding not in {"json", "etf"}:
+            raise ValueError(f"Unsupported Gateway encoding type: {encoding}")
+        if compress not in {None, "zlib-stream"}:
+            raise ValueError(f"Unsupported Gateway compression type: {compress}")
+        if overflow not in {"block", "drop", "spill"}:
+            raise ValueError(f"Unsupported receive overflow policy: {overflow}")
+
         self.token = token
         self.intents = intents
+        self.shard = shard
+        self._scheduler = scheduler
+        self.session_file = session_file
+        self.overflow = overflow
+        self.queue_size = queue_size
         self._meta = _GatewayMeta(version=version, encoding=encoding, compress=compress)
+        self._last_ack = []
+        self._bots = []
+        self._consumers = set()
+
+        if self.session_file is not MISSING:
+            self._load_session()
 
     async def __aenter__(self):
         self._tasks = open_nursery()
         nursery = await self._tasks.__aenter__()
         nursery.start_soon(self.reconnect)
-        nursery.start_soon(self._heartbeat)
         return self
 
     async def __aexit__(self, *exc):
         return await self._tasks.__aexit__(*exc)
 
-    async def _receive(self) -> _GatewayPayload:
+    async def _receive(self) -> str | bytes | None:
         """
-        Receives the next incoming payload from the Gateway.
+        Receives the next incoming message from the Gateway.
+
+        ---
+
+        When `zlib-stream` compression is used, a payload may be split
+        across several frames. Frames are buffered until the `Z_SYNC_FLUSH`
+        suffix arrives, in which case `None` is returned for the incomplete ones.
+
+        ---
 
         Returns
         -------
-        `_GatewayPayload`
-            A class of the payload data.
+        `str`, `bytes`, optional
+            The complete, decompressed message.
         """
 
         # FIXME: our exception handling neglects other rejection
@@ -280,73 +596,342 @@ class GatewayClient(GatewayProtocol):
 
         try:
             resp = await self._conn.get_message()
-            json = loads(resp)
-            return structure(json, _GatewayPayload)
+
+            if self._meta.compress == "zlib-stream":
+                self._buffer.extend(resp)
+
+                if len(resp) < 4 or resp[-4:] != _ZLIB_SUFFIX:
+                    return None
+
+                resp = self._zlib.decompress(self._buffer)
+                self._buffer.clear()
+
+            return resp
         except ConnectionClosed:
-            logger.error("The connection to Discord's Gateway has closed.")
-            await self._error()
+            # Closing on our own already ends the connection as wanted.
+            if not self._closed:
+                logger.error("The connection to Discord's Gateway has closed.")
+                await self._error()
+
+    def _decode(self, message: str | bytes) -> dict:
+        """Decodes a message from the Gateway with the connection's encoding."""
+        return etf.loads(message) if self._meta.encoding == "etf" else json_loads(message)
+
+    def _structure(self, data: dict) -> _GatewayPayload | None:
+        """
+        Structures decoded data from the Gateway into a payload.
+
+        Parameters
+        ----------
+        data : `dict`
+            The decoded data.
+
+        Returns
+        -------
+        `_GatewayPayload`, optional
+            A class of the payload data, or `None` if nothing listens to it.
+        """
+
+        # Events nobody listens to are dropped before anything is structured.
+        if data["op"] == _GatewayOpCode.DISPATCH and not self._subscribed(data["t"]):
+            return None
+
+        return structure(data, _GatewayPayload)
+
+    async def _read(self, queue: MemorySendChannel):
+        """
+        Reads messages from the Gateway into the receive queue.
+
+        ---
+
+        Reading is kept apart from processing so that the socket is
+        drained during bursts of events. Messages received while the
+        queue is full are handled by the `overflow` policy.
+
+        Heartbeats are tracked upon reading, rather than processing, so
+        that a backlog never delays acknowledgements. Sequences are only
+        tracked once processed, so that a session is never resumed past
+        messages still waiting in the queue.
+
+        ---
+
+        Parameters
+        ----------
+        queue : `trio.MemorySendChannel`
+            The sending end of the receive queue.
+        """
+        with CancelScope() as self._reader:
+            async with queue:
+                while not self._closed and not self._stopped:
+                    message = await self._receive()
+
+                    if message is None:
+                        continue
+
+                    data = self._decode(message)
+
+                    match data["op"]:
+                        case _GatewayOpCode.HELLO:
+                            self._meta.heartbeat_interval = data["d"]["heartbeat_interval"] / 1000
+                            logger.debug(f"Heartbeat set to {self._meta.heartbeat_interval}s.")
+                            self._heartbeat_ack = True
+                            self._hello.set()
+                        case _GatewayOpCode.HEARTBEAT_ACK:
+                            self._last_ack[1] = perf_counter()
+                            self._heartbeat_ack = True
+                            logger.debug(f"The heartbeat was acknowledged. (took {self.latency}s.)")
+                        case _GatewayOpCode.HEARTBEAT:
+                            logger.debug("The Gateway has requested a heartbeat.")
+                            await self._beat()
+
+                    # Once spilling, every message is spilled to keep them in order.
+                    if self._spill is not None and self._spill.count:
+                        await self._spill.push(message)
+                        continue
+
+                    try:
+                        queue.send_nowait(data)
+                    except WouldBlock:
+                        await self._overflow(queue, message, data)
+
+    async def _overflow(self, queue: MemorySendChannel, message: str | bytes, data: dict):
+        """
+        Handles a message received while the receive queue is full.
+
+        Parameters
+        ----------
+        queue : `trio.MemorySendChannel`
+            The sending end of the receive queue.
+        message : `str`, `bytes`
+            The message that did not fit into the queue.
+        data : `dict`
+            The decoded data of the message.
+        """
+        match self.overflow:
+            case "drop":
+                if data["op"] == _GatewayOpCode.DISPATCH and data["t"] in _DROPPABLE_EVENTS:
+                    logger.debug(f"The receive queue is full, dropping {data['t']}.")
+                    return
+            case "spill":
+                logger.debug("The receive queue is full, spilling to disk.")
+                await self._spill_message(message)
+                return
+
+        # Nothing is read while waiting, heartbeat acknowledgements included, so
+        # waiting is bounded well within the heartbeat interval before spilling.
+        logger.debug("The receive queue is full, waiting for room.")
+        interval = self._meta.heartbeat_interval
+
+        with move_on_after(inf if interval is None else interval / 4):
+            await queue.send(data)
+            return
+
+        logger.warning("The receive queue has stayed full, spilling to disk.")
+        await self._spill_message(message)
+
+    async def _spill_message(self, message: str | bytes):
+        """
+        Spills a message to disk, opening the spill file when needed.
+
+        Parameters
+        ----------
+        message : `str`, `bytes`
+            The message to spill.
+        """
+        if self._spill is None:
+            self._spill = await _GatewaySpill.open()
+        await self._spill.push(message)
+
+    async def _process(self, queue: MemoryReceiveChannel):
+        """
+        Processes messages from the receive queue in order.
+
+        Parameters
+        ----------
+        queue : `trio.MemoryReceiveChannel`
+            The receiving end of the receive queue.
+        """
+        async with queue:
+            while True:
+                # Spilled messages are only read back once the queue is drained,
+                # as every one of them was received after those in the queue.
+                if (
+                    self._spill is not None
+                    and self._spill.count
+                    and not queue.statistics().current_buffer_used
+                ):
+                    data = self._decode(await self._spill.pop())
+                else:
+                    try:
+                        data = await queue.receive()
+                    except EndOfChannel:
+                        break
+
+                if payload := self._structure(data):
+                    await self._track(payload)
+
+                if data.get("s") is not None:
+                    self._meta.seq = data["s"]
 
     async def _send(self, payload: _GatewayPayload):
         """
         Sends a payload to the Gateway.
 
+        ---
+
+        Payloads wait for room inside of the connection's rate limit
+        before being sent, with heartbeats taking priority.
+
+        ---
+
         Parameters
         ----------
         payload : `_GatewayPayload`
             The payload to send.
         """
-
-        # TODO: implement the gateway rate limiting logic here.
-        # the theory of this is to "queue" dispatched information
-        # from the Gateway when we enter a rate limit.
+        await self._rate_limit.acquire(priority=payload.op == _GatewayOpCode.HEARTBEAT)
 
         try:
-            json = dumps(asdict(payload))
-            resp = await self._conn.send_message(json)  # noqa
+            data = (
+                etf.dumps(asdict(payload))
+                if self._meta.encoding == "etf"
+                else json_dumps(asdict(payload))
+            )
+            resp = await self._conn.send_message(data)  # noqa
         except ConnectionClosed:
             logger.error("The connection to Discord's Gateway has closed.")
             await self._error()
 
     async def connect(self):
-        """Connects to the Gateway and initiates a WebSocket state."""
+        """
+        Connects to the Gateway and initiates a WebSocket state.
+
+        ---
+
+        The connection is re-established whenever it is lost until the
+        Gateway is stopped. If a session exists, the connection is made
+        to the session's `resume_gateway_url` so that it may be resumed.
+
+        ---
+        """
         self._stopped = False
-        self._last_ack = [perf_counter(), perf_counter()]
 
-        # FIXME: this connection type will only work with JSON in mind.
-        # if other compression or encoding types are supplied, they
-        # will not be properly digested. This is only added so others
-        # may modify their GatewayClient to their liking.
+        try:
+            await self._run()
+        finally:
+            if self.session_file is not MISSING:
+                self._save_session()
+
+    async def _run(self):
+        """Runs connections to the Gateway until stopped."""
+        while not self._stopped:
+            self._closed = True
+            self._heartbeat_ack = False
+            self._last_ack = [perf_counter(), perf_counter()]
+            self._hello = Event()
+            self._rate_limit = _GatewayRateLimit()
+
+            # A zlib-stream context lives for exactly one connection, so
+            # any previous state must be discarded before reconnecting.
+            if self._meta.compress == "zlib-stream":
+                self._zlib = decompressobj()
+                self._buffer = bytearray()
+
+            # Identifying is rate limited across shards, whereas resuming is not.
+            # The slot of the shard is held until it has sent its identification.
+            identifying = self._scheduler is not MISSING and not self._meta.session_id
+            shard_id = 0 if self.shard is MISSING else self.shard[0]
+
+            if identifying:
+                await self._scheduler.wait(shard_id)
+                self._holding = True
+
+            try:
+                await self._open()
+            finally:
+                # The bucket is only freed here if identifying never happened, bounded
+                # in time since a scheduler shared over IPC may no longer be listening.
+                if self._holding:
+                    self._holding = False
+                    with CancelScope(shield=True, deadline=current_time() + _RELEASE_TIMEOUT):
+                        await self._scheduler.release(shard_id, identified=False)
+
+    async def _open(self):
+        """Opens a single connection to the Gateway, and runs it until closed."""
+        url = (
+            self._meta.resume_url
+            if self._meta.session_id and self._meta.resume_url
+            else __gateway_url__
+        )
 
         async with open_websocket_url(
-            f"{__gateway_url__}?v={self._meta.version}&encoding={self._meta.encoding}"
+            f"{url.rstrip('/')}/?v={self._meta.version}&encoding={self._meta.encoding}"
             f"{'' if self._meta.compress is None else f'&compress={self._meta.compress}'}"
         ) as self._conn:
             self._closed = bool(self._conn.closed)
 
-            if self._stopped:
-                await self._conn.aclose()
             if self._closed:
                 await self._error()
 
-            while not self._closed:
-                data = await self._receive()
+            try:
+                send, receive = open_memory_channel(self.queue_size)
+
+                async with open_nursery() as nursery:
+                    nursery.start_soon(self._heartbeat)
+
+                    async with open_nursery() as connection:
+                        connection.start_soon(self._read, send)
+                        connection.start_soon(self._process, receive)
+                    nursery.cancel_scope.cancel()
+            finally:
+                if self._spill is not None:
+                    self._spill.close()
+                    self._spill = None
 
-                if data:
-                    await self._track(data)
+                # Closing with 1000 would end the session, which
+                # must be kept alive for it to be resumed later on.
+                if self.session_file is not MISSING and not self._closed:
+                    with CancelScope(shield=True):
+                        await self._close()
+
+            if self._stopped:
+                await self._conn.aclose()
 
     async def reconnect(self):
-        """Reconnects to the Gateway and re-initiates a WebSocket state."""
-        self._closed = True
-        self._heartbeat_ack = False
+        """
+        Reconnects to the Gateway and re-initiates a WebSocket state.
 
-        if self._closed:
-            await self.connect()
+        ---
+
+        If a connection is currently open, it is closed in a way that keeps
+        its session alive, and the existing session is resumed.
+
+        ---
+        """
+        if self._conn is not None and not self._closed:
+            await self._close()
         else:
-            logger.info("Told to reconnect, but did not need to.")
+            await self.connect()
+
+    async def _close(self, code: int = 4000):
+        """
+        Closes the current connection so that it may be reconnected to.
+
+        Parameters
+        ----------
+        code : `int`, optional
+            The code to close with. Codes besides `1000` and `1001` keep the
+            session alive for resuming. Defaults to `4000`.
+        """
+        self._closed = True
+        self._heartbeat_ack = False
+        await self._conn.aclose(code)
 
     async def _error(self):
         """Handles error responses from closing codes."""
         code = self._conn.closed.code
+        self._closed = True
+        self._heartbeat_ack = False
         await self._conn.aclose()
 
         match code:
@@ -362,7 +947,12 @@ class GatewayClient(GatewayProtocol):
                     RateLimited,
                     "Your bot is being Gateway rate limited. You will be reconnected.",
                 )
-                await self.reconnect()
+            case 4007 | 4009:
+                logger.warning(
+                    f"The Gateway session can no longer be resumed. (WS code {code}) "
+                    "Starting new connection."
+                )
+                self._invalidate()
             case 4010:
                 raise InvalidShard(
                     "You provided an invalid shard. Make sure the shard is correct! (https://discord.dev/topics/gateway#sharding)"
@@ -377,8 +967,73 @@ class GatewayClient(GatewayProtocol):
                 raise DisallowedIntents(
                     "You provided an intent that your bot is not approved for. Make sure your bot is verified and/or has it enabled in the Developer Portal."
                 )
+            case 4012:
+                raise RandomClose(
+                    f"The Gateway has closed due to an invalid version. (WS code {code})"
+                )
             case _:
-                raise RandomClose(f"The Gateway has randomly closed. (WS code {code})")
+                logger.warning(
+                    f"The Gateway has randomly closed. (WS code {code}) Resuming last known connection."
+                )
+
+    def _session_key(self) -> str:
+        """The key of the connection's session inside of the session file."""
+        return "0" if self.shard is MISSING else str(self.shard[0])
+
+    def _load_session(self):
+        """Loads a persisted session from the session file, if one exists."""
+        if not path.exists(self.session_file):
+            return
+
+        try:
+            with open(self.session_file, "rb") as file:
+                session = json_loads(file.read()).get(self._session_key())
+        except (OSError, ValueError):
+            logger.warning(f"The session file {self.session_file} could not be read.")
+            return
+
+        # A session belongs to a single shard, and a change in the
+        # amount of shards means the session can no longer be resumed.
+        if not session or session.get("shard") != (None if self.shard is MISSING else self.shard):
+            return
+
+        self._meta.session_id = session["session_id"]
+        self._meta.seq = session["seq"]
+        self._meta.resume_url = session["resume_url"]
+        logger.info(f"Loaded a persisted session. (session: {self._meta.session_id})")
+
+    def _save_session(self):
+        """Saves the current session to the session file, or removes it if there is none."""
+        sessions = {}
+
+        if path.exists(self.session_file):
+            try:
+                with open(self.session_file, "rb") as file:
+                    sessions = json_loads(file.read())
+            except (OSError, ValueError):
+                logger.warning(f"The session file {self.session_file} will be overwritten.")
+
+        if self._meta.session_id:
+            sessions[self._session_key()] = {
+                "shard": None if self.shard is MISSING else self.shard,
+                "session_id": self._meta.session_id,
+                "seq": self._meta.seq,
+                "resume_url": self._meta.resume_url,
+            }
+        else:
+            sessions.pop(self._session_key(), None)
+
+        # Writing to a temporary file first stops a crash from corrupting the sessions.
+        with open(f"{self.session_file}.tmp", "w") as file:
+            file.write(json_dumps(sessions))
+        replace(f"{self.session_file}.tmp", self.session_file)
+        logger.info(f"Persisted the session. (session: {self._meta.session_id})")
+
+    def _invalidate(self):
+        """Discards the current session, so that the next connection identifies anew."""
+        self._meta.session_id = None
+        self._meta.seq = None
+        self._meta.resume_url = None
 
     async def _track(self, payload: _GatewayPayload):
         """
@@ -402,15 +1057,8 @@ class GatewayClient(GatewayProtocol):
                 else:
                     logger.debug("New connection found, identifying to the Gateway.")
                     await self._identify()
-                    self._meta.heartbeat_interval = payload.data["heartbeat_interval"] / 1000
-                    logger.debug(f"Heartbeat set to {self._meta.heartbeat_interval}ms.")
-                    self._heartbeat_ack = True
-                    logger.debug("Began the heartbeat process.")
             case _GatewayOpCode.HEARTBEAT_ACK:
-                self._last_ack[1] = perf_counter()
-                logger.debug(f"The heartbeat was acknowledged. (took {self.latency}ms.)")
                 await self._dispatch("HEARTBEAT_ACK", HeartbeatAck, latency=self.latency)
-                self._last_ack[0] = perf_counter()
             case _GatewayOpCode.INVALID_SESSION:
                 logger.info(
                     "Our Gateway connection has suddenly invalidated. Checking reconnection status."
@@ -421,33 +1069,44 @@ class GatewayClient(GatewayProtocol):
                     logger.warning(
                         "The Gateway has told us to reconnect. Resuming last known connection."
                     )
-                    await self._resume()
                 else:
                     logger.error(
                         "The given connection cannot be reconnected to. Starting new connection."
                     )
-                    self._meta.session_id = None
-                    await self._conn.aclose()
-                    await self.reconnect()
+                    self._invalidate()
+                    # Discord asks for a random wait of 1-5 seconds before identifying again.
+                    await sleep(1 + random() * 4)
+                await self._close()
             case _GatewayOpCode.RECONNECT:
                 logger.warning(
                     "The Gateway has told us to reconnect. Resuming last known connection."
                 )
                 await self._dispatch("RECONNECT", Reconnect)
-                await self._resume()
+                await self._close()
             case _GatewayOpCode.DISPATCH:
-                if payload.name not in ["RESUMED", "READY"]:
+                if payload.name not in _CONNECTION_EVENTS:
+                    cached = {}
+
+                    for bot in self._bots:
+                        if (model := await bot._consume(payload.name, payload.data)) is not None:
+                            cached[bot] = model
+
                     resource = _EventTable.lookup(payload.name, payload.data)
-                    await self._dispatch(payload.name, resource, **payload.data)
+                    await self._dispatch(payload.name, resource, _cached=cached, **payload.data)
         match payload.name:
             case "RESUMED":
                 logger.info(
                     f"The connection was resumed. (session: {self._meta.session_id}, sequence: {self._meta.seq}"
                 )
-                await self._dispatch("RESUMED", Resumed, **payload.data)
+                await self._dispatch(
+                    "RESUMED",
+                    Resumed,
+                    session_id=self._meta.session_id,
+                    seq=self._meta.seq,
+                )
             case "READY":
                 self._meta.session_id = payload.data["session_id"]
-                self._meta.seq = payload.sequence
+                self._meta.resume_url = payload.data.get("resume_gateway_url")
                 logger.info(
                     f"The Gateway has declared a ready connection. (session: {self._meta.session_id}, sequence: {self._meta.seq})"
                 )
@@ -476,8 +1135,52 @@ class GatewayClient(GatewayProtocol):
         logger.debug("Hooking the bot into the Gateway.")
         self._bots.append(bot)
 
+    def _subscribe(self, *names: str):
+        """
+        Subscribes to events consumed internally.
+
+        ---
+
+        Subscribed events are dispatched even when no hooked
+        bot has registered a callback for them.
+
+        ---
+
+        Parameters
+        ----------
+        *names : `str`
+            The names of the events, as given by the Gateway.
+        """
+        self._consumers.update(names)
+
+    def _subscribed(self, name: str) -> bool:
+        """
+        Checks whether an event is listened to or not.
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the event, as given by the Gateway.
+
+        Returns
+        -------
+        `bool`
+            Whether the event has a callback in any hooked bot
+            or is consumed internally.
+        """
+        if name in _CONNECTION_EVENTS or name in self._consumers:
+            return True
+
+        name = name.lower()
+        return any(name in bot._calls for bot in self._bots)
+
     async def _dispatch(
-        self, _name: str, data: list[dict] | dict | type | MISSING, *args, **kwargs
+        self,
+        _name: str,
+        data: list[dict] | dict | type | MISSING,
+        *args,
+        _cached: NotNeeded[dict["Bot", Any]] = MISSING,  # noqa
+        **kwargs,
     ):
         """
         Dispatches an event from the Gateway.
@@ -504,21 +1207,45 @@ class GatewayClient(GatewayProtocol):
 
             If a resource was not able to be found for
             the event called for, `MISSING` will be given.
+        _cached : `dict[Bot, typing.Any]`, optional
+            The models of the event already structured by the
+            cache of each bot, dispatched to it instead.
         """
         logger.debug(f"Dispatching {_name}: {data if isinstance(data, dict) else kwargs}")
 
-        for bot in self._bots:
-            if isinstance(data, (dict, MISSING)):
-                await bot._trigger(_name.lower(), data)
-            elif data is None:
-                await bot._trigger(_name.lower(), kwargs)
-            else:
-                if kwargs.get("id"):
-                    kwargs["bot_inst"] = bot
-                await bot._trigger(
-                    _name.lower(),
-                    structure(kwargs, data),
-                )
+        name = _name.lower()
+        bots = [bot for bot in self._bots if name in bot._calls]
+
+        if not bots:
+            return
+
+        if isinstance(data, (dict, MISSING)):
+            resource = data
+        elif data is None:
+            resource = kwargs
+        else:
+            resource = None
+
+        shared = None
+
+        for bot in bots:
+            view = resource
+
+            # Bots caching the event are given their cached model, the
+            # others share one structured only when first needed.
+            if view is None:
+                view = None if _cached is MISSING else _cached.get(bot)
+
+                if not isinstance(view, data):
+                    if shared is None:
+                        try:
+                            shared = _EventTable.structure(kwargs, data)
+                        except Exception:
+                            logger.exception(f"Could not structure {_name}, dropping it.")
+                            return
+                    view = shared
+
+            await bot._trigger(name, view)
 
     async def _identify(self):
         """Sends an identification payload to the Gateway."""
@@ -530,9 +1257,17 @@ class GatewayClient(GatewayProtocol):
                 "properties": {"os": platform, "browser": "retux", "device": "retux"},
             },
         )
+
+        if self.shard is not MISSING:
+            payload.data["shard"] = self.shard
+
         logger.debug("Sending an identification payload to the Gateway.")
         await self._send(payload)
 
+        if self._holding:
+            self._holding = False
+            await self._scheduler.release(0 if self.shard is MISSING else self.shard[0])
+
     async def _resume(self):
         """Sends a resuming payload to the Gateway."""
         payload = _GatewayPayload(
@@ -547,17 +1282,48 @@ class GatewayClient(GatewayProtocol):
         await self._send(payload)
 
     async def _heartbeat(self):
-        """Sends a heartbeat payload to the Gateway."""
-        payload = _GatewayPayload(op=_GatewayOpCode.HEARTBEAT.value, d=self._meta.seq)
+        """
+        Sends heartbeats to the Gateway for as long as the connection is open.
+
+        ---
+
+        The first heartbeat is sent after `heartbeat_interval * jitter`, where
+        `jitter` is a random value between 0 and 1, as documented by Discord.
+
+        If the previous heartbeat was not acknowledged by the time the next
+        one is due, the connection is considered "zombied," which happens
+        when the connection has silently failed. The connection is then
+        closed so that it may be resumed.
+        """
+        await self._hello.wait()
+        logger.debug("Began the heartbeat process.")
+        await sleep(self._meta.heartbeat_interval * random())
+
+        while not self._closed:
+            if not self._heartbeat_ack:
+                logger.warning(
+                    "The last heartbeat was not acknowledged. Resuming the zombied connection."
+                )
+                self._reader.cancel()
 
-        logger.debug("Waiting the appropriate time for probable connection.")
-        await sleep(random())
+                # A zombied connection may never complete the closing handshake.
+                with move_on_after(5):
+                    await self._close()
+                return
 
-        while self._heartbeat_ack:
-            logger.debug("Sending a heartbeat payload to the Gateway.")
-            await self._send(payload)
+            await self._beat()
             await sleep(self._meta.heartbeat_interval)
 
+    async def _beat(self):
+        """Sends a heartbeat payload to the Gateway."""
+        self._heartbeat_ack = False
+        self._last_ack[0] = perf_counter()
+
+        # The payload must carry the last sequence number received.
+        payload = _GatewayPayload(op=_GatewayOpCode.HEARTBEAT.value, d=self._meta.seq)
+        logger.debug("Sending a heartbeat payload to the Gateway.")
+        await self._send(payload)
+
     async def request_guild_members(
         self,
         guild_id: Snowflake,
@@ -687,8 +1453,8 @@ class GatewayClient(GatewayProtocol):
     @property
     def latency(self) -> float:
         """
-        The calculated difference between the last known set
-        of acknowledgements for a Gateway event.
+        The time between the last heartbeat sent and its
+        acknowledgement from the Gateway, in seconds.
         """
         logger.debug("Determining the latency call.")
         return self._last_ack[1] - self._last_ack[0]
@@ -1,5 +1,4 @@
 from enum import Enum
-from json import dumps
 from logging import getLogger
 from mimetypes import guess_type
 from sys import version_info
@@ -11,6 +10,7 @@ from httpx import __version__ as __http_version__
 from trio import Event, sleep
 
 from ..const import MISSING, NotNeeded, __api_url__, __repo_url__, __version__
+from ..utils.serializers import json_dumps, json_loads
 from .error import HTTPException
 
 logger = getLogger(__name__)
@@ -39,11 +39,11 @@ def _get_bucket_identifier(
     )
 
 
-@define(slots=False)
+@define()
 class _Limit:
     """Represents a bucket that exists for a route."""
 
-    event: Event = field(default=Event())
+    event: Event = field(factory=Event)
     """The asynchronous event associated to the bucket, used for blocking conditions."""
     reset_after: float = field(default=0.0)
     """The time remaining before the event may be reset. Defaults to `0.0`."""
@@ -163,17 +163,20 @@ class HTTPClient(HTTPProtocol):
         if query is not MISSING:
             reqkwargs["params"] = query
 
+        reqkwargs["headers"] = {}
+
         if reason is not MISSING:
-            reqkwargs["headers"] = {"X-Audit-Log-Reason": reason}
+            reqkwargs["headers"]["X-Audit-Log-Reason"] = reason
 
         if method != "GET":
             if files is not MISSING:
-                reqkwargs["data"] = {"payload_json": dumps(json)}
+                reqkwargs["data"] = {"payload_json": json_dumps(json)}
                 reqkwargs["files"] = []
                 for (idx, file) in enumerate(files.__iter__()):
                     reqkwargs["files"].append((f"files[{idx}]", (file.name, file.get(), file.mime)))
-            else:
-                reqkwargs["json"] = json
+            elif json is not MISSING:
+                reqkwargs["content"] = json_dumps(json)
+                reqkwargs["headers"]["Content-Type"] = "application/json"
 
         retry_attempts = 1 if retries is MISSING else retries
 
@@ -215,7 +218,7 @@ class HTTPClient(HTTPProtocol):
                 payload = (
                     response.text
                     if response.headers.get("Content-Type") != "application/json"
-                    else response.json()
+                    else json_loads(response.content)
                 )
 
                 if response.status_code == 429:
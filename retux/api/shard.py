@@ -0,0 +1,508 @@
+from logging import getLogger
+
+from trio import Nursery, Semaphore, current_time, open_nursery, sleep_until
+
+from ..client.flags import Intents
+from ..client.resources.abc import Snowflake
+from ..const import MISSING, NotNeeded
+from .gateway import GatewayClient, GatewayProtocol
+from .http import Endpoint, HTTPClient
+
+logger = getLogger(__name__)
+
+__all__ = ("IdentifyScheduler", "ShardManager")
+
+
+class IdentifyScheduler:
+    """
+    Represents a scheduler for the identification of shards to the Gateway.
+
+    ---
+
+    Discord only allows shards to identify once every 5 seconds per
+    "bucket," where a shard's bucket is `shard_id % max_concurrency`.
+    Every bucket may identify in parallel, so larger bots with a higher
+    `max_concurrency` start up far quicker than identifying one at a time.
+
+    A shard holds its bucket from the moment it may identify until it
+    has sent its identification, and the 5 seconds are counted from
+    then on, however long connecting took.
+
+    The scheduler also keeps count of the remaining daily identifications
+    given by `session_start_limit`, and waits for the limit to reset
+    instead of exhausting it.
+
+    ---
+
+    Attributes
+    ----------
+    max_concurrency : `int`
+        The amount of buckets allowed to identify at once.
+    total : `int`
+        The total amount of identifications allowed per reset.
+    remaining : `int`
+        The remaining amount of identifications before the limit resets.
+    _reset_at : `float`
+        The time at which the identification limit resets, in `trio` clock time.
+    _buckets : `dict[int, trio.Semaphore]`
+        The slots of every bucket, used to identify one shard at a time per bucket.
+    _holders : `dict[int, int]`
+        The ID of the shard holding every held bucket.
+    _last_identify : `dict[int, float]`
+        The time of the last identification of every bucket, in `trio` clock time.
+    """
+
+    __slots__ = (
+        "max_concurrency",
+        "total",
+        "remaining",
+        "_reset_at",
+        "_buckets",
+        "_holders",
+        "_last_identify",
+    )
+    max_concurrency: int
+    """The amount of buckets allowed to identify at once."""
+    total: int
+    """The total amount of identifications allowed per reset."""
+    remaining: int
+    """The remaining amount of identifications before the limit resets."""
+    _reset_at: float
+    """The time at which the identification limit resets, in `trio` clock time."""
+    _buckets: dict[int, Semaphore]
+    """The slots of every bucket, used to identify one shard at a time per bucket."""
+    _holders: dict[int, int]
+    """The ID of the shard holding every held bucket."""
+    _last_identify: dict[int, float]
+    """The time of the last identification of every bucket, in `trio` clock time."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 1,
+        total: int = 1000,
+        remaining: int = 1000,
+        reset_after: int = 0,
+    ):
+        """
+        Creates a new identification scheduler.
+
+        Parameters
+        ----------
+        max_concurrency : `int`, optional
+            The amount of buckets allowed to identify at once. Defaults to `1`.
+        total : `int`, optional
+            The total amount of identifications allowed per reset. Defaults to `1000`.
+        remaining : `int`, optional
+            The remaining amount of identifications. Defaults to `1000`.
+        reset_after : `int`, optional
+            The milliseconds until the identification limit resets. Defaults to `0`.
+        """
+        self.max_concurrency = max(max_concurrency, 1)
+        self.total = total
+        self.remaining = remaining
+        self._reset_at = current_time() + reset_after / 1000
+        self._buckets = {bucket: Semaphore(1) for bucket in range(self.max_concurrency)}
+        self._holders = {}
+        self._last_identify = {}
+
+    @classmethod
+    def from_limit(cls, limit: dict) -> "IdentifyScheduler":
+        """
+        Creates a new identification scheduler from a `session_start_limit`.
+
+        Parameters
+        ----------
+        limit : `dict`
+            The `session_start_limit` given by the `GET /gateway/bot` route.
+
+        Returns
+        -------
+        `IdentifyScheduler`
+            The scheduler respecting the limit.
+        """
+        return cls(
+            max_concurrency=limit.get("max_concurrency", 1),
+            total=limit.get("total", 1000),
+            remaining=limit.get("remaining", 1000),
+            reset_after=limit.get("reset_after", 0),
+        )
+
+    async def wait(self, shard_id: int):
+        """
+        Waits until a shard is allowed to identify to the Gateway.
+
+        ---
+
+        The bucket of the shard is held from then on, and must be
+        freed with `release()` once the shard has identified.
+
+        ---
+
+        Parameters
+        ----------
+        shard_id : `int`
+            The ID of the shard identifying.
+        """
+        bucket = shard_id % self.max_concurrency
+        await self._buckets[bucket].acquire()
+        self._holders[bucket] = shard_id
+
+        try:
+            if self.remaining <= 0:
+                logger.warning(
+                    "The daily identification limit has been reached. "
+                    f"Waiting {max(self._reset_at - current_time(), 0):.0f}s for it to reset."
+                )
+                await sleep_until(self._reset_at)
+
+            # The limit is renewed a day after it resets.
+            if current_time() >= self._reset_at:
+                self.remaining = self.total
+                self._reset_at = current_time() + 86400
+
+            if bucket in self._last_identify:
+                await sleep_until(self._last_identify[bucket] + 5)
+        except BaseException:
+            await self.release(shard_id, identified=False)
+            raise
+
+        self.remaining -= 1
+        logger.debug(f"Shard {shard_id} may now identify. (bucket: {bucket})")
+
+    async def release(self, shard_id: int, identified: bool = True):
+        """
+        Frees the bucket of a shard, once it has identified or given up on it.
+
+        ---
+
+        Nothing is done if the shard is not holding its bucket, such
+        as when it has already been freed.
+
+        ---
+
+        Parameters
+        ----------
+        shard_id : `int`
+            The ID of the shard.
+        identified : `bool`, optional
+            Whether the shard has sent its identification or not. The
+            next shard of the bucket only waits 5 seconds if it has.
+            Defaults to `True`.
+        """
+        bucket = shard_id % self.max_concurrency
+
+        if self._holders.get(bucket) != shard_id:
+            return
+
+        if identified:
+            self._last_identify[bucket] = current_time()
+
+        del self._holders[bucket]
+        self._buckets[bucket].release()
+
+
+class ShardManager(GatewayProtocol):
+    """
+    Represents a manager of numerous sharded connections to Discord's Gateway.
+
+    ---
+
+    Bots in more than 2,500 guilds are required by Discord to split their
+    connection into "shards," where each shard receives events for a portion
+    of the bot's guilds. The manager asks the REST API for the recommended
+    shard count and runs a `GatewayClient` for each shard alongside one another.
+
+    Every shard shares the same hooked bots and `HTTPClient`, meaning the
+    manager may be used in place of a single `GatewayClient`.
+
+    ---
+
+    Attributes
+    ----------
+    token : `str`
+        The bots token.
+    intents : `Intents`
+        The intents to connect with.
+    http : `HTTPClient`
+        The HTTP connection shared across every shard.
+    shard_count : `int`, optional
+        The amount of shards to run. This is determined by Discord
+        when not given.
+    shard_ids : `list[int]`, optional
+        The IDs of the shards to run. Every shard is ran when not given.
+    shards : `list[GatewayClient]`
+        The Gateway connections of every shard, ordered by their ID.
+    scheduler : `IdentifyScheduler`, optional
+        The scheduler for the identification of every shard. This is
+        created from Discord's `session_start_limit` when not given.
+    _options : `dict`
+        The keyword arguments given to every shard's `GatewayClient`.
+    _consumers : `set[str]`
+        The names of events consumed internally, shared by every shard.
+    _tasks : `trio.Nursery`
+        The tasks associated with the shards.
+    """
+
+    __slots__ = (
+        "token",
+        "intents",
+        "http",
+        "shard_count",
+        "shard_ids",
+        "shards",
+        "scheduler",
+        "_options",
+        "_consumers",
+        "_tasks",
+    )
+    token: str
+    """The bots token."""
+    intents: Intents
+    """The intents to connect with."""
+    http: HTTPClient
+    """The HTTP connection shared across every shard."""
+    shard_count: int | MISSING
+    """The amount of shards to run. This is determined by Discord when not given."""
+    shard_ids: list[int] | MISSING
+    """The IDs of the shards to run. Every shard is ran when not given."""
+    shards: list[GatewayClient]
+    """The Gateway connections of every shard, ordered by their ID."""
+    scheduler: IdentifyScheduler | MISSING
+    """
+    The scheduler for the identification of every shard. This is
+    created from Discord's `session_start_limit` when not given.
+    """
+    _options: dict
+    """The keyword arguments given to every shard's `GatewayClient`."""
+    _consumers: set[str]
+    """The names of events consumed internally, shared by every shard."""
+    _tasks: Nursery
+    """The tasks associated with the shards."""
+
+    def __init__(
+        self,
+        token: str,
+        intents: Intents,
+        http: HTTPClient,
+        *,
+        shard_count: NotNeeded[int] = MISSING,
+        shard_ids: NotNeeded[list[int]] = MISSING,
+        scheduler: NotNeeded[IdentifyScheduler] = MISSING,
+        version: int = 10,
+        encoding: str = "json",
+        compress: str = None,
+        session_file: NotNeeded[str] = MISSING,
+        overflow: str = "block",
+        queue_size: int = 256,
+    ):
+        """
+        Creates a new manager for sharded connections to the Gateway.
+
+        Parameters
+        ----------
+        token : `str`
+            The bots token to connect with.
+        intents : `Intents`
+            The intents to connect with.
+        http : `HTTPClient`
+            The HTTP connection to share across every shard.
+        shard_count : `int`, optional
+            The amount of shards to run. Defaults to the amount
+            recommended by Discord.
+        shard_ids : `list[int]`, optional
+            The IDs of the shards to run, allowing the shards to be split
+            across numerous processes. Defaults to every shard.
+        scheduler : `IdentifyScheduler`, optional
+            The scheduler to identify every shard with. Any object with
+            an asynchronous `wait(shard_id)` method may be given, such as
+            one shared between processes. Defaults to a scheduler following
+            Discord's `session_start_limit`.
+        version : `int`, optional
+            The version of the Gateway to use. Defaults to version `10`.
+        encoding : `str`, optional
+            The type of encoding to use on payloads. Defaults to `json`.
+        compress : `str`, optional
+            The type of data compression to use on payloads. Defaults to none.
+        session_file : `str`, optional
+            The path of a file to persist every shard's session to upon
+            shutting down. Defaults to no persistence.
+        overflow : `str`, optional
+            The policy for messages received while a shard's receive queue
+            is full, either `block`, `drop` or `spill`. Defaults to `block`.
+        queue_size : `int`, optional
+            The amount of messages waiting to be processed per shard before
+            overflowing. Defaults to `256`.
+        """
+        self.token = token
+        self.intents = intents
+        self.http = http
+        self.shard_count = shard_count
+        self.shard_ids = shard_ids
+        self.shards = []
+        self.scheduler = scheduler
+        self._consumers = set()
+        self._options = {
+            "version": version,
+            "encoding": encoding,
+            "compress": compress,
+            "session_file": session_file,
+            "overflow": overflow,
+            "queue_size": queue_size,
+        }
+        self._tasks = None
+
+    async def __aenter__(self):
+        if self.shard_count is MISSING or self.scheduler is MISSING:
+            data = await self.http.request("GET", Endpoint.GET_GATEWAY_BOT)
+
+            if self.shard_count is MISSING:
+                self.shard_count = data["shards"]
+
+            if self.scheduler is MISSING:
+                self.scheduler = IdentifyScheduler.from_limit(data.get("session_start_limit", {}))
+
+                if self.scheduler.remaining < self.shard_count:
+                    logger.warning(
+                        f"Only {self.scheduler.remaining} identification(s) remain for "
+                        f"{self.shard_count} shard(s). Some shards will wait for the limit to reset."
+                    )
+
+        if self.shard_ids is MISSING:
+            self.shard_ids = list(range(self.shard_count))
+        logger.info(
+            f"Starting {len(self.shard_ids)} of {self.shard_count} shard(s) for the Gateway."
+        )
+
+        self.shards = [
+            GatewayClient(
+                self.token,
+                self.intents,
+                shard=[shard_id, self.shard_count],
+                scheduler=self.scheduler,
+                **self._options,
+            )
+            for shard_id in self.shard_ids
+        ]
+
+        for shard in self.shards:
+            shard._consumers = self._consumers
+
+        self._tasks = open_nursery()
+        nursery = await self._tasks.__aenter__()
+
+        for shard in self.shards:
+            nursery.start_soon(shard.reconnect)
+        return self
+
+    async def __aexit__(self, *exc):
+        return await self._tasks.__aexit__(*exc)
+
+    def get_shard(self, guild_id: Snowflake | int | str) -> GatewayClient:
+        """
+        Gets the shard receiving events for a guild.
+
+        ---
+
+        A `ValueError` is raised if the guild's shard is
+        not ran by this manager.
+
+        ---
+
+        Parameters
+        ----------
+        guild_id : `Snowflake`, `int`, `str`
+            The ID of the guild.
+
+        Returns
+        -------
+        `GatewayClient`
+            The Gateway connection of the shard.
+        """
+        shard_id = (int(guild_id) >> 22) % self.shard_count
+
+        for shard in self.shards:
+            if shard.shard[0] == shard_id:
+                return shard
+        raise ValueError(f"Shard {shard_id} is not ran by this manager.")
+
+    async def _hook(self, bot: "Bot"):  # noqa
+        """
+        Hooks every shard to a bot for event dispatching.
+
+        Parameters
+        ----------
+        bot : `retux.Bot`
+            The bot instance to hook onto.
+        """
+        for shard in self.shards:
+            await shard._hook(bot)
+
+    def _subscribe(self, *names: str):
+        """
+        Subscribes every shard to events consumed internally.
+
+        Parameters
+        ----------
+        *names : `str`
+            The names of the events, as given by the Gateway.
+        """
+        self._consumers.update(names)
+
+    async def connect(self):
+        """Connects every shard to the Gateway."""
+        async with open_nursery() as nursery:
+            for shard in self.shards:
+                nursery.start_soon(shard.connect)
+
+    async def reconnect(self):
+        """Reconnects every shard to the Gateway."""
+        async with open_nursery() as nursery:
+            for shard in self.shards:
+                nursery.start_soon(shard.reconnect)
+
+    async def request_guild_members(self, guild_id: Snowflake, **kwargs):
+        """
+        Sends a request for all guild members to the shard of the guild.
+
+        See `GatewayClient.request_guild_members` for the accepted arguments.
+        """
+        await self.get_shard(guild_id).request_guild_members(guild_id, **kwargs)
+
+    async def update_voice_state(self, guild_id: Snowflake, **kwargs):
+        """
+        Sends a request updating the bots voice state to the shard of the guild.
+
+        See `GatewayClient.update_voice_state` for the accepted arguments.
+        """
+        await self.get_shard(guild_id).update_voice_state(guild_id, **kwargs)
+
+    async def update_presence(self, **kwargs):
+        """
+        Sends a request updating the bots presence to every shard.
+
+        See `GatewayClient.update_presence` for the accepted arguments.
+        """
+        for shard in self.shards:
+            await shard.update_presence(**kwargs)
+
+    @property
+    def _closed(self) -> bool:
+        """Whether every shard's Gateway connection is closed or not."""
+        return all(shard._closed for shard in self.shards)
+
+    @property
+    def _stopped(self) -> bool:
+        """Whether every shard's Gateway connection was forcefully stopped or not."""
+        return all(shard._stopped for shard in self.shards)
+
+    @_stopped.setter
+    def _stopped(self, value: bool):
+        for shard in self.shards:
+            shard._stopped = value
+
+    @property
+    def latency(self) -> float:
+        """The average latency of every shard's Gateway connection."""
+        if not self.shards:
+            return 0.0
+        return sum(shard.latency for shard in self.shards) / len(self.shards)
@@ -1,4 +1,7 @@
 from .bot import *  # noqa
+from .cache import *  # noqa
 from .flags import *  # noqa
+from .members import *  # noqa
 from .mixins import *  # noqa
 from .resources import *  # noqa
+from .scheduler import *  # noqa
@@ -1,19 +1,32 @@
+from functools import partial
 from logging import getLogger
 from typing import Any, Callable, Coroutine, Optional, Protocol
 
 from trio import run
 
-from ..api import GatewayClient
+from ..api.gateway import GatewayClient
 from ..api.http import HTTPClient
+from ..api.shard import ShardManager
 from ..const import MISSING, NotNeeded
-from ..utils.hooks import cattrs_structure_hooks
+from .cache import Cache
 from .flags import Intents
+from .resources.abc import _current_bot
+from .scheduler import DispatchScheduler
 
 logger = getLogger(__name__)
 
 
 class BotProtocol(Protocol):
-    def __init__(self, intents: Intents):
+    def __init__(
+        self,
+        intents: Intents,
+        *,
+        autoshard: bool = False,
+        session_file: NotNeeded[str] = MISSING,
+        max_handlers: int = 100,
+        max_pending: int = 256,
+        cache: NotNeeded[Cache] = MISSING,
+    ):
         ...
 
     def start(self, token: str):
@@ -45,10 +58,21 @@ class Bot(BotProtocol):
     ----------
     intents : `Intents`
         The bot's intents.
-    _gateway : `GatewayClient`
+    autoshard : `bool`
+        Whether the bot automatically shards its Gateway connection or not.
+    session_file : `str`, optional
+        The path of the file the bot's Gateway sessions are persisted to.
+    cache : `Cache`
+        The cache of entities, fed by the bot's Gateway events.
+    _scheduler : `DispatchScheduler`
+        The scheduler of callbacks, ordering events per guild.
+    _gateway : `GatewayClient`, `ShardManager`
         The bot's gateway connection.
     http : `HTTPClient`
         The bot's HTTP connection.
+    ipc : `IPCChannel`, optional
+        The bot's channel to its cluster manager, if the bot is ran
+        inside of a cluster.
     _calls : `dict[str, list[typing.Coroutine]]`
         A set of callbacks registered by their name to their function.
         These are used to help dispatch Gateway events.
@@ -56,22 +80,75 @@ class Bot(BotProtocol):
 
     intents: Intents
     """The bot's intents."""
-    _gateway: GatewayClient
+    autoshard: bool
+    """Whether the bot automatically shards its Gateway connection or not."""
+    session_file: str | MISSING
+    """The path of the file the bot's Gateway sessions are persisted to."""
+    cache: Cache
+    """The cache of entities, fed by the bot's Gateway events."""
+    _scheduler: DispatchScheduler
+    """The scheduler of callbacks, ordering events per guild."""
+    _gateway: GatewayClient | ShardManager
     """The bot's gateway connection."""
     http: HTTPClient
     """The bot's HTTP connection."""
-    _calls: dict[str, list[Coroutine]] = {}
+    ipc: "IPCChannel"  # noqa
+    """The bot's channel to its cluster manager, if the bot is ran inside of a cluster."""
+    _calls: dict[str, list[Coroutine]]
     """
     A set of callbacks registered by their name to their function.
     These are used to help dispatch Gateway events.
     """
 
-    def __init__(self, intents: Intents):
+    def __init__(
+        self,
+        intents: Intents,
+        *,
+        autoshard: bool = False,
+        session_file: NotNeeded[str] = MISSING,
+        max_handlers: int = 100,
+        max_pending: int = 256,
+        cache: NotNeeded[Cache] = MISSING,
+    ):
+        """
+        Creates a new bot.
+
+        Parameters
+        ----------
+        intents : `Intents`
+            The intents to connect with.
+        autoshard : `bool`, optional
+            Whether to split the Gateway connection into the amount
+            of shards recommended by Discord or not. This is required
+            for bots in more than 2,500 guilds. Defaults to `False`.
+        session_file : `str`, optional
+            The path of a file to persist the bot's Gateway sessions to
+            upon shutting down. The sessions are resumed upon starting again,
+            avoiding a full re-identification when restarting. Defaults to
+            no persistence.
+        max_handlers : `int`, optional
+            The maximum amount of callbacks to run at once. Callbacks
+            run in the background of the Gateway connection, and any
+            past this limit wait for another to finish. Defaults to `100`.
+        max_pending : `int`, optional
+            The maximum amount of events waiting to be handled per guild.
+            Events of one guild are handled in order, and receiving more
+            than this waits for room. Events without a guild are limited
+            to as many waiting or running at once. Defaults to `256`.
+        cache : `Cache`, optional
+            The cache of entities to feed from Gateway events. Defaults
+            to a cache of every guild, channel, role, member, user, emoji
+            and sticker received.
+        """
         self.intents = intents
+        self.autoshard = autoshard
+        self.session_file = session_file
+        self.cache = Cache() if cache is MISSING else cache
+        self._scheduler = DispatchScheduler(max_handlers, max_pending)
         self._gateway = MISSING
         self.http = MISSING
-
-        cattrs_structure_hooks()
+        self.ipc = MISSING
+        self._calls = {}
 
     def start(self, token: str):
         """
@@ -93,7 +170,9 @@ class Bot(BotProtocol):
         """Restarts a connection with Discord."""
         await self._gateway.reconnect()
 
-    async def _connect(self, token: str):
+    async def _connect(
+        self, token: str, gateway: NotNeeded[GatewayClient | ShardManager] = MISSING
+    ):
         """
         Connects to the Gateway and hooks into the manager.
 
@@ -101,9 +180,24 @@ class Bot(BotProtocol):
         ----------
         token : `str`
             The token of the bot.
+        gateway : `GatewayClient`, `ShardManager`, optional
+            The Gateway connection to use. Defaults to one
+            determined by `autoshard`.
         """
-        async with GatewayClient(token, self.intents) as self._gateway:
-            await self._gateway._hook(self)
+        if gateway is MISSING and self.autoshard:
+            gateway = ShardManager(token, self.intents, self.http, session_file=self.session_file)
+        elif gateway is MISSING:
+            gateway = GatewayClient(token, self.intents, session_file=self.session_file)
+
+        gateway._subscribe(*self.cache.events)
+
+        # Every task spawned while connected inherits the bot, so that
+        # objects used outside of a callback still find it.
+        _current_bot.set(self)
+
+        async with self._scheduler:
+            async with gateway as self._gateway:
+                await self._gateway._hook(self)
 
     def _register(self, coro: Coroutine, name: Optional[str] = None, event: Optional[bool] = True):
         """
@@ -132,13 +226,102 @@ class Bot(BotProtocol):
         """
         Triggers a name registered for callbacks.
 
+        ---
+
+        While connected, the callbacks are queued onto the scheduler,
+        keyed by the guild of the event. Callbacks are then ran in the
+        background, in order for events of the same guild.
+
+        ---
+
         Parameters
         ----------
         name : `str`
             The name associated with the callbacks.
         """
-        for event in self._calls.get(name, []):
-            await event(*args)
+        calls = self._calls.get(name, [])
+
+        if not calls:
+            return
+
+        # Tasks spawned by the scheduler inherit the context
+        # they were spawned in, and with it the bot instance.
+        token = _current_bot.set(self)
+
+        try:
+            if not self._scheduler.running:
+                for event in calls:
+                    await event(*args)
+                return
+
+            await self._scheduler.submit(self._key(name, *args), list(calls), *args)
+        finally:
+            _current_bot.reset(token)
+
+    async def _consume(self, name: str, data: dict) -> Any:
+        """
+        Feeds a Gateway event to the cache.
+
+        ---
+
+        When the event updates a cached resource in place, the
+        callbacks of its changed attributes are triggered, given
+        the resource and the attribute before and after the update.
+        Changes are only collected when such a callback exists.
+
+        ---
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the event, as given by the Gateway.
+        data : `dict`
+            The data of the event, as given by the Gateway.
+
+        Returns
+        -------
+        `typing.Any`, optional
+            The model of the event structured by the cache, if any.
+        """
+        prefix = f"{name.lower()}."
+        diff = any(call.startswith(prefix) for call in self._calls)
+        handled = self.cache._handle(name, data, diff)
+
+        if handled is None:
+            return None
+
+        resource, changes = handled
+
+        for attr, (before, after) in changes.items():
+            await self._trigger(prefix + attr, resource, before, after)
+
+        return resource
+
+    @staticmethod
+    def _key(name: str, data: Any = MISSING, *args) -> str | None:
+        """
+        Gets the key an event is ordered by.
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the event.
+        data : `typing.Any`, optional
+            The data of the event.
+
+        Returns
+        -------
+        `str`, optional
+            The ID of the guild the event belongs to, if any.
+        """
+        # Changes to attributes are ordered along with their event.
+        name = name.partition(".")[0]
+        getter = data.get if isinstance(data, dict) else partial(getattr, data)
+        guild_id = getter("guild_id", None)
+
+        if guild_id is None and name.startswith("guild_") and "_" not in name[6:]:
+            guild_id = getter("id", None)
+        return None if guild_id is None else str(guild_id)
 
     def on(
         self, coro: NotNeeded[Coroutine] = MISSING, *, name: NotNeeded[str] = MISSING
@@ -202,6 +385,16 @@ class Bot(BotProtocol):
         The nicest part of this is that you can create your own event handlers
         for attributes changing, done with `async def channel_id(value)`!
 
+        Changes to the attributes of cached resources can already be listened
+        to by naming the callback after the update event and the attribute,
+        separated by a dot. The callback is given the updated resource, along
+        with the attribute before and after the update.
+        ```
+        @bot.on(name="channel_update.name")
+        async def renamed(channel: retux.Channel, before: str, after: str):
+            ...
+        ```
+
         Additionally, you can also provide converters for your message event,
         in case you do not feel like specifying it via. `create` and etc., such
         as `async def to_voice(channel: retux.VoiceChannel)`.
@@ -0,0 +1,774 @@
+from collections import OrderedDict
+from copy import copy
+from logging import getLogger
+from typing import Any, Callable, get_args
+
+from attrs import define, fields, has
+
+from ..const import MISSING, NotNeeded
+from ..utils.conversion import shared_user, structure
+from .members import MemberStore
+from .resources.abc import Snowflake
+from .resources.channel import Channel, ThreadChannel
+from .resources.emoji import Emoji
+from .resources.guild import Guild, Member
+from .resources.role import Role
+from .resources.sticker import Sticker
+from .resources.user import User
+
+logger = getLogger(__name__)
+
+__all__ = ("CachePolicy", "Cache")
+
+_EVENTS: dict[str, tuple[str, ...]] = {
+    "GUILD_CREATE": ("guilds", "channels", "roles", "members", "users", "emojis", "stickers"),
+    "GUILD_UPDATE": ("guilds", "roles", "emojis", "stickers"),
+    "GUILD_DELETE": ("guilds", "channels", "roles", "members", "emojis", "stickers"),
+    "GUILD_ROLE_CREATE": ("guilds", "roles"),
+    "GUILD_ROLE_UPDATE": ("guilds", "roles"),
+    "GUILD_ROLE_DELETE": ("guilds", "roles"),
+    "GUILD_MEMBER_ADD": ("members", "users"),
+    "GUILD_MEMBER_UPDATE": ("members", "users"),
+    "GUILD_MEMBER_REMOVE": ("members",),
+    "GUILD_MEMBERS_CHUNK": ("members", "users"),
+    "GUILD_EMOJIS_UPDATE": ("guilds", "emojis"),
+    "GUILD_STICKERS_UPDATE": ("guilds", "stickers"),
+    "CHANNEL_CREATE": ("channels",),
+    "CHANNEL_UPDATE": ("channels",),
+    "CHANNEL_DELETE": ("channels",),
+    "THREAD_CREATE": ("channels",),
+    "THREAD_UPDATE": ("channels",),
+    "THREAD_DELETE": ("channels",),
+    "THREAD_LIST_SYNC": ("channels",),
+    "USER_UPDATE": ("users",),
+}
+"""The Gateway events feeding the cache, and the entities each of them affects."""
+
+
+@define(frozen=True)
+class CachePolicy:
+    """
+    Represents how many entities of one type are cached.
+
+    ---
+
+    A policy caches either `none` of the entities, `all` of
+    them, or only the `lru` (least recently used) ones up to
+    `max_size`, evicting the least recently used past it.
+
+    Members may also be cached as `columnar`, storing every
+    member of a guild in a `MemberStore` rather than as models.
+
+    ---
+
+    Attributes
+    ----------
+    kind : `str`
+        The kind of policy, either `none`, `all`, `lru` or `columnar`.
+    max_size : `int`, optional
+        The maximum amount of entities cached by an `lru` policy.
+    """
+
+    kind: str = "all"
+    """The kind of policy, either `none`, `all`, `lru` or `columnar`."""
+    max_size: int | None = None
+    """The maximum amount of entities cached by an `lru` policy."""
+
+    def __attrs_post_init__(self):
+        if self.kind not in {"none", "all", "lru", "columnar"}:
+            raise ValueError(f"Unsupported cache policy: {self.kind}")
+        if self.kind == "lru" and (self.max_size is None or self.max_size < 1):
+            raise ValueError("An lru cache policy needs a max_size of at least 1.")
+
+    @classmethod
+    def none(cls) -> "CachePolicy":
+        """Creates a policy caching no entities."""
+        return cls("none")
+
+    @classmethod
+    def all(cls) -> "CachePolicy":
+        """Creates a policy caching every entity."""
+        return cls("all")
+
+    @classmethod
+    def lru(cls, max_size: int) -> "CachePolicy":
+        """Creates a policy caching the `max_size` least recently used entities."""
+        return cls("lru", max_size)
+
+    @classmethod
+    def columnar(cls) -> "CachePolicy":
+        """Creates a policy caching every member in a `MemberStore` per guild."""
+        return cls("columnar")
+
+
+class _EntityStore:
+    """
+    Represents the index of one type of entity, keyed by its ID.
+
+    Attributes
+    ----------
+    policy : `CachePolicy`
+        The policy of the index.
+    _items : `dict[typing.Any, typing.Any]`
+        The cached entities by their key, from least to most
+        recently used for an `lru` policy.
+    """
+
+    __slots__ = ("policy", "_items")
+    policy: CachePolicy
+    """The policy of the index."""
+    _items: dict[Any, Any]
+    """The cached entities by their key."""
+
+    def __init__(self, policy: CachePolicy):
+        if policy.kind == "columnar":
+            raise ValueError("Only members can be cached with a columnar policy.")
+
+        self.policy = policy
+        self._items = OrderedDict() if policy.kind == "lru" else {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the index caches anything or not."""
+        return self.policy.kind != "none"
+
+    def get(self, key: Any) -> Any | None:
+        """Gets an entity, marking it as recently used."""
+        item = self._items.get(key)
+
+        if item is not None and self.policy.kind == "lru":
+            self._items.move_to_end(key)
+        return item
+
+    def peek(self, key: Any) -> Any | None:
+        """Gets an entity without marking it as recently used."""
+        return self._items.get(key)
+
+    def put(self, key: Any, item: Any):
+        """Caches an entity, replacing any cached under the same key."""
+        if self.policy.kind == "none":
+            return
+
+        self._items[key] = item
+
+        if self.policy.kind == "lru":
+            self._items.move_to_end(key)
+
+            if len(self._items) > self.policy.max_size:
+                self._items.popitem(last=False)
+
+    def pop(self, key: Any) -> Any | None:
+        """Removes an entity from the cache, if present."""
+        return self._items.pop(key, None)
+
+    def evict(self, predicate: Callable[[Any, Any], bool]):
+        """Removes every entity whose key and value match a predicate."""
+        for key in [key for key, item in self._items.items() if predicate(key, item)]:
+            del self._items[key]
+
+    def values(self) -> list[Any]:
+        """Gets every cached entity."""
+        return list(self._items.values())
+
+
+class _MemberColumns:
+    """
+    Represents the index of members following a `columnar` policy.
+
+    ---
+
+    This has the interface of `_EntityStore`, keyed by the IDs of
+    the guild and user of members, on top of a `MemberStore` for
+    every guild. Members given back are built on demand.
+
+    ---
+
+    Attributes
+    ----------
+    policy : `CachePolicy`
+        The policy of the index.
+    _stores : `dict[int, MemberStore]`
+        The member store of every guild.
+    """
+
+    __slots__ = ("policy", "_stores")
+    policy: CachePolicy
+    """The policy of the index."""
+    _stores: dict[int, MemberStore]
+    """The member store of every guild."""
+
+    enabled = True
+    """Whether the index caches anything or not."""
+
+    def __init__(self, policy: CachePolicy):
+        self.policy = policy
+        self._stores = {}
+
+    def __len__(self) -> int:
+        return sum(len(store) for store in self._stores.values())
+
+    def get(self, key: tuple[int, int]) -> Member | None:
+        """Builds a cached member."""
+        store = self._stores.get(key[0])
+        return None if store is None else store.get(key[1])
+
+    peek = get
+
+    def put(self, key: tuple[int, int], member: Member):
+        """Caches a member, replacing any cached for the same user."""
+        self.store(key[0]).put(member)
+
+    def put_data(self, guild_id: int, data: dict):
+        """Caches a member from its data, without structuring it."""
+        self.store(guild_id).put_data(data)
+
+    def pop(self, key: tuple[int, int]):
+        """Removes a member from the cache, if present."""
+        if store := self._stores.get(key[0]):
+            store.remove(key[1])
+
+    def drop(self, guild_id: int):
+        """Removes every member of a guild."""
+        self._stores.pop(guild_id, None)
+
+    def store(self, guild_id: int) -> MemberStore:
+        """Gets the member store of a guild, creating it if needed."""
+        if (store := self._stores.get(guild_id)) is None:
+            store = self._stores[guild_id] = MemberStore(guild_id)
+        return store
+
+
+class Cache:
+    """
+    Represents an in-memory cache of entities, fed by Gateway events.
+
+    ---
+
+    Guilds, channels and threads, roles, members, users, emojis
+    and stickers are cached as they are created, updated and
+    deleted over the Gateway. Every entity is indexed by its ID,
+    with members being indexed by the IDs of their guild and user.
+    Reads are constant time and give back the cached models.
+
+    Each type of entity follows its own `CachePolicy`, caching
+    all of them by default. The Gateway only receives the events
+    needed by enabled policies, along with those having callbacks.
+
+    ---
+
+    Attributes
+    ----------
+    guilds : `_EntityStore`
+        The cached guilds.
+    channels : `_EntityStore`
+        The cached channels and threads.
+    roles : `_EntityStore`
+        The cached roles.
+    members : `_EntityStore`
+        The cached members, keyed by the IDs of their guild and user.
+    users : `_EntityStore`
+        The cached users.
+    emojis : `_EntityStore`
+        The cached emojis.
+    stickers : `_EntityStore`
+        The cached stickers.
+    """
+
+    __slots__ = ("guilds", "channels", "roles", "members", "users", "emojis", "stickers")
+    guilds: _EntityStore
+    """The cached guilds."""
+    channels: _EntityStore
+    """The cached channels and threads."""
+    roles: _EntityStore
+    """The cached roles."""
+    members: _EntityStore
+    """The cached members, keyed by the IDs of their guild and user."""
+    users: _EntityStore
+    """The cached users."""
+    emojis: _EntityStore
+    """The cached emojis."""
+    stickers: _EntityStore
+    """The cached stickers."""
+
+    def __init__(
+        self,
+        *,
+        guilds: NotNeeded[CachePolicy] = MISSING,
+        channels: NotNeeded[CachePolicy] = MISSING,
+        roles: NotNeeded[CachePolicy] = MISSING,
+        members: NotNeeded[CachePolicy] = MISSING,
+        users: NotNeeded[CachePolicy] = MISSING,
+        emojis: NotNeeded[CachePolicy] = MISSING,
+        stickers: NotNeeded[CachePolicy] = MISSING,
+    ):
+        """
+        Creates a new cache.
+
+        Parameters
+        ----------
+        guilds : `CachePolicy`, optional
+            The policy of guilds. Defaults to caching all of them.
+        channels : `CachePolicy`, optional
+            The policy of channels and threads. Defaults to caching all of them.
+        roles : `CachePolicy`, optional
+            The policy of roles. Defaults to caching all of them.
+        members : `CachePolicy`, optional
+            The policy of members. Defaults to caching all of them.
+
+            Bots in very large guilds should consider a `columnar` policy,
+            along with a bounded policy of users.
+        users : `CachePolicy`, optional
+            The policy of users. Defaults to caching all of them.
+        emojis : `CachePolicy`, optional
+            The policy of emojis. Defaults to caching all of them.
+        stickers : `CachePolicy`, optional
+            The policy of stickers. Defaults to caching all of them.
+        """
+        self.guilds = _EntityStore(CachePolicy() if guilds is MISSING else guilds)
+        self.channels = _EntityStore(CachePolicy() if channels is MISSING else channels)
+        self.roles = _EntityStore(CachePolicy() if roles is MISSING else roles)
+        self.members = (
+            _MemberColumns(members)
+            if members is not MISSING and members.kind == "columnar"
+            else _EntityStore(CachePolicy() if members is MISSING else members)
+        )
+        self.users = _EntityStore(CachePolicy() if users is MISSING else users)
+        self.emojis = _EntityStore(CachePolicy() if emojis is MISSING else emojis)
+        self.stickers = _EntityStore(CachePolicy() if stickers is MISSING else stickers)
+
+    @property
+    def events(self) -> list[str]:
+        """The names of the Gateway events needed by the enabled policies."""
+        return [
+            name
+            for name, stores in _EVENTS.items()
+            if any(getattr(self, store).enabled for store in stores)
+        ]
+
+    def get_guild(self, guild_id: Snowflake | int | str) -> Guild | None:
+        """Gets a cached guild by its ID, if present."""
+        return self.guilds.get(int(guild_id))
+
+    def get_channel(self, channel_id: Snowflake | int | str) -> Channel | ThreadChannel | None:
+        """Gets a cached channel or thread by its ID, if present."""
+        return self.channels.get(int(channel_id))
+
+    def get_role(self, role_id: Snowflake | int | str) -> Role | None:
+        """Gets a cached role by its ID, if present."""
+        return self.roles.get(int(role_id))
+
+    def get_member(
+        self, guild_id: Snowflake | int | str, user_id: Snowflake | int | str
+    ) -> Member | None:
+        """Gets a cached member by the IDs of its guild and user, if present."""
+        return self.members.get((int(guild_id), int(user_id)))
+
+    def get_member_store(self, guild_id: Snowflake | int | str) -> MemberStore | None:
+        """Gets the member store of a guild, if members follow a `columnar` policy."""
+        if isinstance(self.members, _MemberColumns):
+            return self.members._stores.get(int(guild_id))
+
+    def get_user(self, user_id: Snowflake | int | str) -> User | None:
+        """Gets a cached user by its ID, if present."""
+        return self.users.get(int(user_id))
+
+    def get_emoji(self, emoji_id: Snowflake | int | str) -> Emoji | None:
+        """Gets a cached emoji by its ID, if present."""
+        return self.emojis.get(int(emoji_id))
+
+    def get_sticker(self, sticker_id: Snowflake | int | str) -> Sticker | None:
+        """Gets a cached sticker by its ID, if present."""
+        return self.stickers.get(int(sticker_id))
+
+    def _handle(
+        self, name: str, data: dict, diff: bool = False
+    ) -> tuple[Any, dict[str, tuple[Any, Any]]] | None:
+        """
+        Updates the cache from a Gateway event.
+
+        ---
+
+        Updates to a cached guild, channel, role or member are
+        applied onto the cached model in place, only changing the
+        attributes that differ and reusing nested models.
+
+        The model of the event is given back, so that it may be
+        dispatched as-is instead of being structured again.
+
+        Exceptions raised while caching are logged rather than
+        propagated, leaving the Gateway connection unaffected.
+
+        ---
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the event, as given by the Gateway.
+        data : `dict`
+            The data of the event, as given by the Gateway.
+        diff : `bool`, optional
+            Whether the values of nested models before the update are
+            needed or not, copying them before being updated. Defaults
+            to `False`.
+
+        Returns
+        -------
+        `tuple[typing.Any, dict[str, tuple[typing.Any, typing.Any]]]`, optional
+            The model of the event, if structured, and the values of its
+            changed attributes before and after the update, if updated in place.
+        """
+        try:
+            match name:
+                case "GUILD_CREATE":
+                    return self._put_guild(data), {}
+                case "GUILD_UPDATE":
+                    if guild := self.guilds.peek(int(data["id"])):
+                        return guild, self._update_guild(guild, data, diff)
+                    return self._put_guild(data), {}
+                case "GUILD_DELETE":
+                    # Guilds become unavailable during outages, but are
+                    # only left once the bot is removed from them.
+                    if not data.get("unavailable"):
+                        self._drop_guild(int(data["id"]))
+                case "GUILD_ROLE_CREATE":
+                    self._put_role(int(data["guild_id"]), structure(data["role"], Role))
+                case "GUILD_ROLE_UPDATE":
+                    # Roles are shared with their guild, which sees the update as well.
+                    if role := self.roles.peek(int(data["role"]["id"])):
+                        return role, self._patch(role, data["role"], diff)
+                    self._put_role(int(data["guild_id"]), structure(data["role"], Role))
+                case "GUILD_ROLE_DELETE":
+                    self._drop_role(int(data["guild_id"]), int(data["role_id"]))
+                case "GUILD_MEMBER_ADD":
+                    self._put_member(int(data["guild_id"]), data)
+                case "GUILD_MEMBER_UPDATE":
+                    key = (int(data["guild_id"]), int(data["user"]["id"]))
+
+                    # The user is shared with the member, and is updated along with it.
+                    if member := self.members.peek(key):
+                        changes = self._patch(member, data, diff)
+
+                        # Columnar members are built on demand, and need to be written back.
+                        if isinstance(self.members, _MemberColumns):
+                            self.members.put(key, member)
+                            self._update_user(data["user"])
+                        return member, changes
+                    self._put_member(key[0], data)
+                case "GUILD_MEMBER_REMOVE":
+                    self.members.pop((int(data["guild_id"]), int(data["user"]["id"])))
+                case "GUILD_MEMBERS_CHUNK":
+                    guild_id = int(data["guild_id"])
+
+                    for member in data["members"]:
+                        self._put_member(guild_id, member)
+                case "GUILD_EMOJIS_UPDATE":
+                    emojis = structure(data["emojis"], list[Emoji])
+                    self._replace(int(data["guild_id"]), "emojis", self.emojis, emojis)
+                case "GUILD_STICKERS_UPDATE":
+                    stickers = structure(data["stickers"], list[Sticker])
+                    self._replace(int(data["guild_id"]), "stickers", self.stickers, stickers)
+                case "CHANNEL_CREATE":
+                    return self._put_channel(data, Channel), {}
+                case "THREAD_CREATE":
+                    return self._put_channel(data, ThreadChannel), {}
+                case "CHANNEL_UPDATE" | "THREAD_UPDATE":
+                    if channel := self.channels.peek(int(data["id"])):
+                        return channel, self._patch(channel, data, diff)
+                    cls = Channel if name == "CHANNEL_UPDATE" else ThreadChannel
+                    return self._put_channel(data, cls), {}
+                case "CHANNEL_DELETE" | "THREAD_DELETE":
+                    return self.channels.pop(int(data["id"])), {}
+                case "THREAD_LIST_SYNC":
+                    for thread in data["threads"]:
+                        self._put_channel(thread, ThreadChannel)
+                case "USER_UPDATE":
+                    if updated := self._update_user(data, diff):
+                        self.users.put(updated[0].id, updated[0])
+                        return updated
+
+                    user = structure(data, User)
+                    self.users.put(user.id, user)
+                    return user, {}
+        except Exception:
+            logger.exception(f"Could not cache the {name} event.")
+
+    def _put_guild(self, data: dict) -> Guild | None:
+        """Caches a guild along with the entities given alongside it, giving back the guild."""
+        guild_id = int(data["id"])
+        guild = None
+
+        if (
+            self.guilds.enabled
+            or self.roles.enabled
+            or self.emojis.enabled
+            or self.stickers.enabled
+        ):
+            guild = structure(data, Guild)
+            self.guilds.put(guild_id, guild)
+            self._index_guild(guild)
+
+        # Channels and threads given by GUILD_CREATE lack a guild ID. They are
+        # copied before adding it, as the data is also given to callbacks.
+        for channel in data.get("channels", ()):
+            self._put_channel({"guild_id": data["id"], **channel}, Channel)
+        for thread in data.get("threads", ()):
+            self._put_channel({"guild_id": data["id"], **thread}, ThreadChannel)
+
+        for member in data.get("members", ()):
+            self._put_member(guild_id, member)
+
+        return guild
+
+    def _update_guild(self, guild: Guild, data: dict, diff: bool) -> dict[str, tuple[Any, Any]]:
+        """Updates a cached guild in place, along with the entities given alongside it."""
+        stale = {name: list(getattr(guild, name) or ()) for name in ("roles", "emojis", "stickers")}
+        changes = self._patch(guild, data, diff)
+        self._index_guild(guild, stale)
+        return changes
+
+    def _index_guild(self, guild: Guild, stale: NotNeeded[dict[str, list]] = MISSING):
+        """
+        Indexes the roles, emojis and stickers of a guild.
+
+        ---
+
+        The models are shared between the guild and the indexes.
+        Any of them given in `stale` and no longer part of the
+        guild are removed from the indexes.
+
+        ---
+
+        Parameters
+        ----------
+        guild : `Guild`
+            The guild to index.
+        stale : `dict[str, list]`, optional
+            The roles, emojis and stickers of the guild before it was updated.
+        """
+        for name in ("roles", "emojis", "stickers"):
+            store = getattr(self, name)
+            items = getattr(guild, name) or ()
+
+            if stale is not MISSING:
+                ids = {item.id for item in items}
+
+                for item in stale[name]:
+                    if item.id not in ids:
+                        store.pop(item.id)
+
+            for item in items:
+                if item.id is not None:
+                    store.put(item.id, item)
+
+    def _patch(self, obj: Any, data: dict, diff: bool) -> dict[str, tuple[Any, Any]]:
+        """
+        Applies the data of an update onto a model in place.
+
+        ---
+
+        Only the attributes given in `data` and differing from the
+        current ones are changed. Nested models are updated in place,
+        as are models of nested lists with the same ID, so that they
+        stay shared with any other model or index referencing them.
+
+        ---
+
+        Parameters
+        ----------
+        obj : `typing.Any`
+            The model to update.
+        data : `dict`
+            The data of the update, as given by Discord.
+        diff : `bool`
+            Whether the values of nested models before the update are
+            needed or not, copying them before being updated.
+
+        Returns
+        -------
+        `dict[str, tuple[typing.Any, typing.Any]]`
+            The values of every changed attribute before and after the update.
+        """
+        changes = {}
+
+        for attr in fields(obj.__class__):
+            if attr.name not in data:
+                continue
+
+            raw = data[attr.name]
+            value = getattr(obj, attr.name)
+
+            if raw is None or value is None:
+                after = None if raw is None else structure(raw, attr.type)
+            elif isinstance(raw, dict) and has(value.__class__):
+                before = copy(value) if diff else value
+
+                if self._patch(value, raw, False):
+                    changes[attr.name] = (before, value)
+                continue
+            elif isinstance(raw, list) and value and has(value[0].__class__):
+                if patched := self._patch_list(value, raw, attr.type, diff):
+                    before, after = patched
+                    setattr(obj, attr.name, after)
+                    changes[attr.name] = (before, after)
+                continue
+            else:
+                after = structure(raw, attr.type)
+
+            if after != value:
+                setattr(obj, attr.name, after)
+                changes[attr.name] = (value, after)
+
+        return changes
+
+    def _patch_list(
+        self, items: list, data: list[dict], cls: type, diff: bool
+    ) -> tuple[list, list] | None:
+        """
+        Applies the data of an update onto a list of models, matching them by their ID.
+
+        Parameters
+        ----------
+        items : `list`
+            The current models.
+        data : `list[dict]`
+            The data of the update, as given by Discord.
+        cls : `type`
+            The type of the list.
+        diff : `bool`
+            Whether the models before the update are needed or not.
+
+        Returns
+        -------
+        `tuple[list, list]`, optional
+            The models before and after the update, if any changed.
+        """
+        if not hasattr(items[0], "id"):
+            after = structure(data, cls)
+            return (items, after) if after != items else None
+
+        before = [copy(item) for item in items] if diff else list(items)
+        current = {item.id: item for item in items}
+        after = []
+        changed = len(data) != len(items)
+
+        for index, raw in enumerate(data):
+            item = current.get(None if raw.get("id") is None else int(raw["id"]))
+
+            if item is None:
+                item = structure(raw, get_args(cls)[0])
+                changed = True
+            elif self._patch(item, raw, False):
+                changed = True
+            elif not changed and item is not items[index]:
+                changed = True
+
+            after.append(item)
+
+        return (before, after) if changed else None
+
+    def _drop_guild(self, guild_id: int):
+        """Removes a guild along with every entity belonging to it."""
+        if guild := self.guilds.pop(guild_id):
+            for role in guild.roles or ():
+                self.roles.pop(role.id)
+            for emoji in guild.emojis or ():
+                self.emojis.pop(emoji.id)
+            for sticker in guild.stickers or ():
+                self.stickers.pop(sticker.id)
+
+        self.channels.evict(lambda _, channel: channel.guild_id == guild_id)
+        if isinstance(self.members, _MemberColumns):
+            self.members.drop(guild_id)
+        else:
+            self.members.evict(lambda key, _: key[0] == guild_id)
+
+    def _put_role(self, guild_id: int, role: Role):
+        """Caches a role, keeping the roles of its guild up to date."""
+        self.roles.put(role.id, role)
+
+        if guild := self.guilds.peek(guild_id):
+            guild.roles = [other for other in guild.roles or () if other.id != role.id] + [role]
+
+    def _drop_role(self, guild_id: int, role_id: int):
+        """Removes a role, keeping the roles of its guild up to date."""
+        self.roles.pop(role_id)
+
+        if guild := self.guilds.peek(guild_id):
+            guild.roles = [role for role in guild.roles or () if role.id != role_id]
+
+    def _put_member(self, guild_id: int, data: dict):
+        """Caches a member and its user."""
+        self._update_user(data["user"])
+
+        if isinstance(self.members, _MemberColumns):
+            self.members.put_data(guild_id, data)
+
+            if not self.users.enabled:
+                return
+            user = structure(data["user"], User)
+        elif self.members.enabled:
+            member = structure(data, Member)
+            user = member.user
+            self.members.put((guild_id, user.id), member)
+        elif self.users.enabled:
+            user = structure(data["user"], User)
+        else:
+            return
+
+        self.users.put(user.id, user)
+
+    def _update_user(
+        self, data: dict, diff: bool = False
+    ) -> tuple[User, dict[str, tuple[Any, Any]]] | None:
+        """
+        Applies the data of a Gateway event onto the shared user of its ID.
+
+        ---
+
+        Users are shared by every model structured with them, and
+        are only updated from Gateway events, whose data is the
+        most recent.
+
+        ---
+
+        Parameters
+        ----------
+        data : `dict`
+            The data of the user, as given by the Gateway.
+        diff : `bool`, optional
+            Whether the values of nested models before the update are
+            needed or not. Defaults to `False`.
+
+        Returns
+        -------
+        `tuple[User, dict[str, tuple[typing.Any, typing.Any]]]`, optional
+            The shared user and the values of its changed attributes
+            before and after the update, if a user is shared for the ID.
+        """
+        if (user := shared_user(int(data["id"]))) is None:
+            return None
+        return user, self._patch(user, data, diff)
+
+    def _put_channel(self, data: dict, cls: type) -> Channel | ThreadChannel | None:
+        """Caches a channel or thread, giving it back if cached."""
+        if self.channels.enabled:
+            channel = structure(data, cls)
+            self.channels.put(int(data["id"]), channel)
+            return channel
+
+    def _replace(self, guild_id: int, field: str, store: _EntityStore, items: list):
+        """Replaces every emoji or sticker of a guild, removing any no longer present."""
+        ids = {item.id for item in items}
+
+        if guild := self.guilds.peek(guild_id):
+            for item in getattr(guild, field) or ():
+                if item.id not in ids:
+                    store.pop(item.id)
+
+            setattr(guild, field, items)
+
+        for item in items:
+            store.put(item.id, item)
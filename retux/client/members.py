@@ -0,0 +1,584 @@
+from array import array
+from datetime import datetime, timezone
+from typing import Iterator
+
+from .resources.abc import Snowflake, Timestamp
+from .resources.guild import Member
+from .resources.user import User, UserFlags
+
+__all__ = ("MemberStore",)
+
+_EMPTY = -1
+"""A slot of the index never holding a row."""
+_DELETED = -2
+"""A slot of the index whose row was removed."""
+_NONE = 0xFFFF
+"""The length of a string that is not present."""
+
+_DEAF = 1 << 0
+_MUTE = 1 << 1
+_PENDING = 1 << 2
+_BOT = 1 << 3
+_SYSTEM = 1 << 4
+_AVATAR = 1 << 5
+_ANIMATED = 1 << 6
+
+
+def _millis(value: str | datetime | Timestamp | None) -> int:
+    """Converts a timestamp into milliseconds since the Unix epoch, or `-1` if not present."""
+    if value is None:
+        return -1
+    if isinstance(value, Timestamp):
+        value = value.datetime
+    elif isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return int(value.timestamp() * 1000)
+
+
+def _timestamp(value: int) -> Timestamp | None:
+    """Converts milliseconds since the Unix epoch into a timestamp, if present."""
+    return None if value < 0 else Timestamp(datetime.fromtimestamp(value / 1000, timezone.utc))
+
+
+class _Strings:
+    """
+    Represents a column of strings packed into one buffer.
+
+    ---
+
+    Strings are stored encoded back to back, with the offset and
+    length of every row kept in arrays. Strings replaced or removed
+    leave their bytes behind, which are compacted once they make up
+    half of the buffer.
+
+    ---
+
+    Attributes
+    ----------
+    _data : `bytearray`
+        The encoded strings.
+    _offsets : `array.array`
+        The offset of the string of every row.
+    _lengths : `array.array`
+        The length of the string of every row.
+    _garbage : `int`
+        The amount of bytes no longer used by any row.
+    """
+
+    __slots__ = ("_data", "_offsets", "_lengths", "_garbage")
+    _data: bytearray
+    """The encoded strings."""
+    _offsets: array
+    """The offset of the string of every row."""
+    _lengths: array
+    """The length of the string of every row."""
+    _garbage: int
+    """The amount of bytes no longer used by any row."""
+
+    def __init__(self):
+        self._data = bytearray()
+        self._offsets = array("I")
+        self._lengths = array("H")
+        self._garbage = 0
+
+    def __getitem__(self, row: int) -> str | None:
+        length = self._lengths[row]
+
+        if length == _NONE:
+            return None
+
+        offset = self._offsets[row]
+        return self._data[offset : offset + length].decode()
+
+    def __setitem__(self, row: int, value: str | None):
+        length = self._lengths[row]
+        self._garbage += 0 if length == _NONE else length
+        self._offsets[row], self._lengths[row] = self._encode(value)
+
+        if self._garbage > 4096 and self._garbage * 2 > len(self._data):
+            self._compact()
+
+    def append(self, value: str | None):
+        offset, length = self._encode(value)
+        self._offsets.append(offset)
+        self._lengths.append(length)
+
+    def remove(self, row: int):
+        """Removes a row by moving the last row in its place."""
+        length = self._lengths[row]
+        self._garbage += 0 if length == _NONE else length
+        self._offsets[row] = self._offsets[-1]
+        self._lengths[row] = self._lengths[-1]
+        self._offsets.pop()
+        self._lengths.pop()
+
+    def _encode(self, value: str | None) -> tuple[int, int]:
+        """Appends a string to the buffer, giving back its offset and length."""
+        if value is None:
+            return 0, _NONE
+
+        encoded = value.encode()
+        offset = len(self._data)
+        self._data += encoded
+        return offset, len(encoded)
+
+    def _compact(self):
+        """Rebuilds the buffer with only the strings still used."""
+        data = bytearray()
+
+        for row, length in enumerate(self._lengths):
+            if length != _NONE:
+                offset = self._offsets[row]
+                self._offsets[row] = len(data)
+                data += self._data[offset : offset + length]
+
+        self._data = data
+        self._garbage = 0
+
+
+class MemberStore:
+    """
+    Represents the members of a guild, stored column by column.
+
+    ---
+
+    Rather than keeping a `Member` and `User` object for every
+    member, their data is kept in parallel arrays: user IDs and
+    timestamps as 64-bit integers, flags as bytes, usernames and
+    nicknames packed into buffers, and roles as an index into
+    the distinct sets of roles found in the guild. Members cost
+    tens of bytes each instead of kilobytes.
+
+    `Member` objects are only built on demand, and are copies:
+    changing them does not change the store. Scans over roles
+    and join dates go over the arrays without building any.
+
+    The guild avatar and timeout of a member are not stored.
+
+    ---
+
+    Attributes
+    ----------
+    guild_id : `Snowflake`
+        The ID of the guild of the members.
+    _ids : `array.array`
+        The user ID of every member.
+    _joined : `array.array`
+        When every member joined, in milliseconds since the Unix epoch.
+    _boosted : `array.array`
+        When every member started boosting, in milliseconds since the
+        Unix epoch, or `-1` if not boosting.
+    _flags : `array.array`
+        The boolean attributes of every member and user, as bits.
+    _discriminators : `array.array`
+        The discriminator of every user.
+    _public_flags : `array.array`
+        The public flags of every user.
+    _avatars : `bytearray`
+        The avatar hash of every user, as 16 bytes each.
+    _usernames : `_Strings`
+        The username of every user.
+    _nicks : `_Strings`
+        The nickname of every member.
+    _roles : `array.array`
+        The index of the set of roles of every member.
+    _role_sets : `list[tuple[int, ...]]`
+        The distinct sets of roles of members.
+    _role_set_index : `dict[tuple[int, ...], int]`
+        The index of every distinct set of roles.
+    _slots : `array.array`
+        The open addressing index of user IDs to rows.
+    _used : `int`
+        The amount of slots of the index either holding a row or deleted.
+    """
+
+    __slots__ = (
+        "guild_id",
+        "_ids",
+        "_joined",
+        "_boosted",
+        "_flags",
+        "_discriminators",
+        "_public_flags",
+        "_avatars",
+        "_usernames",
+        "_nicks",
+        "_roles",
+        "_role_sets",
+        "_role_set_index",
+        "_slots",
+        "_used",
+    )
+    guild_id: Snowflake
+    """The ID of the guild of the members."""
+    _ids: array
+    """The user ID of every member."""
+    _joined: array
+    """When every member joined, in milliseconds since the Unix epoch."""
+    _boosted: array
+    """When every member started boosting, in milliseconds since the Unix epoch."""
+    _flags: array
+    """The boolean attributes of every member and user, as bits."""
+    _discriminators: array
+    """The discriminator of every user."""
+    _public_flags: array
+    """The public flags of every user."""
+    _avatars: bytearray
+    """The avatar hash of every user, as 16 bytes each."""
+    _usernames: _Strings
+    """The username of every user."""
+    _nicks: _Strings
+    """The nickname of every member."""
+    _roles: array
+    """The index of the set of roles of every member."""
+    _role_sets: list[tuple[int, ...]]
+    """The distinct sets of roles of members."""
+    _role_set_index: dict[tuple[int, ...], int]
+    """The index of every distinct set of roles."""
+    _slots: array
+    """The open addressing index of user IDs to rows."""
+    _used: int
+    """The amount of slots of the index either holding a row or deleted."""
+
+    def __init__(self, guild_id: Snowflake | int | str):
+        """
+        Creates a new, empty member store.
+
+        Parameters
+        ----------
+        guild_id : `Snowflake`, `int`, `str`
+            The ID of the guild of the members.
+        """
+        self.guild_id = Snowflake(guild_id)
+        self._ids = array("Q")
+        self._joined = array("q")
+        self._boosted = array("q")
+        self._flags = array("B")
+        self._discriminators = array("H")
+        self._public_flags = array("I")
+        self._avatars = bytearray()
+        self._usernames = _Strings()
+        self._nicks = _Strings()
+        self._roles = array("I")
+        self._role_sets = []
+        self._role_set_index = {}
+        self._slots = array("i", [_EMPTY]) * 8
+        self._used = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, user_id: Snowflake | int | str) -> bool:
+        return self._find(int(user_id)) != _EMPTY
+
+    def __iter__(self) -> Iterator[Snowflake]:
+        return (Snowflake(user_id) for user_id in self._ids)
+
+    def get(self, user_id: Snowflake | int | str) -> Member | None:
+        """
+        Builds the member of a user, if present.
+
+        Parameters
+        ----------
+        user_id : `Snowflake`, `int`, `str`
+            The ID of the user.
+
+        Returns
+        -------
+        `Member`, optional
+            A new `Member` holding the stored data, if present.
+        """
+        if (slot := self._find(int(user_id))) == _EMPTY:
+            return None
+
+        row = self._slots[slot]
+        flags = self._flags[row]
+        discriminator = self._discriminators[row]
+        avatar = None
+
+        if flags & _AVATAR:
+            avatar = self._avatars[row * 16 : row * 16 + 16].hex()
+            avatar = f"a_{avatar}" if flags & _ANIMATED else avatar
+
+        user = User(
+            id=Snowflake(self._ids[row]),
+            username=self._usernames[row],
+            discriminator="0" if discriminator == 0 else f"{discriminator:04}",
+            avatar=avatar,
+            bot=bool(flags & _BOT),
+            system=bool(flags & _SYSTEM),
+            public_flags=UserFlags(self._public_flags[row]),
+        )
+        return Member(
+            user=user,
+            nick=self._nicks[row],
+            roles=[Snowflake(role_id) for role_id in self._role_sets[self._roles[row]]],
+            joined_at=_timestamp(self._joined[row]),
+            premium_since=_timestamp(self._boosted[row]),
+            deaf=bool(flags & _DEAF),
+            mute=bool(flags & _MUTE),
+            pending=bool(flags & _PENDING),
+        )
+
+    def put(self, member: Member):
+        """
+        Stores a member, replacing any stored for the same user.
+
+        Parameters
+        ----------
+        member : `Member`
+            The member to store.
+        """
+        user = member.user
+        self._write(
+            int(user.id),
+            _millis(member.joined_at),
+            _millis(member.premium_since),
+            (_DEAF if member.deaf else 0)
+            | (_MUTE if member.mute else 0)
+            | (_PENDING if member.pending else 0)
+            | (_BOT if user.bot else 0)
+            | (_SYSTEM if user.system else 0),
+            user.discriminator,
+            int(user.public_flags or 0),
+            user.avatar,
+            user.username,
+            member.nick,
+            member.roles or (),
+        )
+
+    def put_data(self, data: dict):
+        """
+        Stores a member from its data, replacing any stored for the same user.
+
+        ---
+
+        This skips structuring the member entirely, and should be
+        preferred when storing members given by the Gateway.
+
+        ---
+
+        Parameters
+        ----------
+        data : `dict`
+            The data of the member, as given by Discord.
+        """
+        user = data["user"]
+        self._write(
+            int(user["id"]),
+            _millis(data.get("joined_at")),
+            _millis(data.get("premium_since")),
+            (_DEAF if data.get("deaf") else 0)
+            | (_MUTE if data.get("mute") else 0)
+            | (_PENDING if data.get("pending") else 0)
+            | (_BOT if user.get("bot") else 0)
+            | (_SYSTEM if user.get("system") else 0),
+            user.get("discriminator"),
+            user.get("public_flags") or 0,
+            user.get("avatar"),
+            user.get("username"),
+            data.get("nick"),
+            data.get("roles") or (),
+        )
+
+    def remove(self, user_id: Snowflake | int | str) -> bool:
+        """
+        Removes the member of a user.
+
+        ---
+
+        The last row is moved in place of the removed one,
+        keeping every column packed.
+
+        ---
+
+        Parameters
+        ----------
+        user_id : `Snowflake`, `int`, `str`
+            The ID of the user.
+
+        Returns
+        -------
+        `bool`
+            Whether the member was stored or not.
+        """
+        if (slot := self._find(int(user_id))) == _EMPTY:
+            return False
+
+        row = self._slots[slot]
+        last = len(self._ids) - 1
+        self._slots[slot] = _DELETED
+
+        if row != last:
+            self._slots[self._find(self._ids[last])] = row
+            self._avatars[row * 16 : row * 16 + 16] = self._avatars[last * 16 :]
+
+        for column in (
+            self._ids,
+            self._joined,
+            self._boosted,
+            self._flags,
+            self._discriminators,
+            self._public_flags,
+            self._roles,
+        ):
+            column[row] = column[last]
+            column.pop()
+
+        del self._avatars[last * 16 :]
+        self._usernames.remove(row)
+        self._nicks.remove(row)
+        return True
+
+    def with_role(self, role_id: Snowflake | int | str) -> list[Snowflake]:
+        """
+        Gets the members having a role.
+
+        Parameters
+        ----------
+        role_id : `Snowflake`, `int`, `str`
+            The ID of the role.
+
+        Returns
+        -------
+        `list[Snowflake]`
+            The user IDs of the members with the role.
+        """
+        role_id = int(role_id)
+        sets = {index for index, roles in enumerate(self._role_sets) if role_id in roles}
+        return [Snowflake(self._ids[row]) for row, index in enumerate(self._roles) if index in sets]
+
+    def joined_between(
+        self, after: datetime | Timestamp | None = None, before: datetime | Timestamp | None = None
+    ) -> list[Snowflake]:
+        """
+        Gets the members that joined within a period of time.
+
+        Parameters
+        ----------
+        after : `datetime.datetime`, `Timestamp`, optional
+            The time members must have joined after. Defaults to any time.
+        before : `datetime.datetime`, `Timestamp`, optional
+            The time members must have joined before. Defaults to any time.
+
+        Returns
+        -------
+        `list[Snowflake]`
+            The user IDs of the members that joined within the period.
+        """
+        start = -1 if after is None else _millis(after)
+        end = 1 << 62 if before is None else _millis(before)
+        return [
+            Snowflake(self._ids[row])
+            for row, joined in enumerate(self._joined)
+            if start < joined < end
+        ]
+
+    def _write(
+        self,
+        user_id: int,
+        joined: int,
+        boosted: int,
+        flags: int,
+        discriminator: str | None,
+        public_flags: int,
+        avatar: str | None,
+        username: str | None,
+        nick: str | None,
+        roles: list,
+    ):
+        """Writes the columns of a member, either onto its row or a new one."""
+        if avatar is not None:
+            flags |= _AVATAR
+
+            if avatar.startswith("a_"):
+                flags |= _ANIMATED
+                avatar = avatar[2:]
+
+        avatar = bytes.fromhex(avatar) if avatar is not None else bytes(16)
+        discriminator = int(discriminator or 0)
+        roles = self._intern(roles)
+
+        if (slot := self._find(user_id)) != _EMPTY:
+            row = self._slots[slot]
+            self._joined[row] = joined
+            self._boosted[row] = boosted
+            self._flags[row] = flags
+            self._discriminators[row] = discriminator
+            self._public_flags[row] = public_flags
+            self._avatars[row * 16 : row * 16 + 16] = avatar
+            self._roles[row] = roles
+
+            if self._usernames[row] != username:
+                self._usernames[row] = username
+            if self._nicks[row] != nick:
+                self._nicks[row] = nick
+            return
+
+        self._insert(user_id, len(self._ids))
+        self._ids.append(user_id)
+        self._joined.append(joined)
+        self._boosted.append(boosted)
+        self._flags.append(flags)
+        self._discriminators.append(discriminator)
+        self._public_flags.append(public_flags)
+        self._avatars += avatar
+        self._roles.append(roles)
+        self._usernames.append(username)
+        self._nicks.append(nick)
+
+    def _intern(self, roles: list) -> int:
+        """Gets the index of a set of roles, adding it if new."""
+        key = tuple(sorted(int(role_id) for role_id in roles))
+
+        if (index := self._role_set_index.get(key)) is None:
+            index = self._role_set_index[key] = len(self._role_sets)
+            self._role_sets.append(key)
+        return index
+
+    def _find(self, user_id: int) -> int:
+        """Gets the slot of the index holding a user ID, or `_EMPTY` if not present."""
+        mask = len(self._slots) - 1
+        slot = (user_id ^ (user_id >> 22)) & mask
+
+        while (row := self._slots[slot]) != _EMPTY:
+            if row != _DELETED and self._ids[row] == user_id:
+                return slot
+            slot = (slot + 1) & mask
+
+        return _EMPTY
+
+    def _insert(self, user_id: int, row: int):
+        """Adds a user ID to the index, growing it past half of its capacity."""
+        if (self._used + 1) * 2 > len(self._slots):
+            self._grow()
+
+        mask = len(self._slots) - 1
+        slot = (user_id ^ (user_id >> 22)) & mask
+
+        while self._slots[slot] >= 0:
+            slot = (slot + 1) & mask
+
+        if self._slots[slot] == _EMPTY:
+            self._used += 1
+        self._slots[slot] = row
+
+    def _grow(self):
+        """Rebuilds the index with room for four times as many members, dropping deleted slots."""
+        size = 8
+
+        while size < len(self._ids) * 4:
+            size *= 2
+
+        self._slots = array("i", [_EMPTY]) * size
+        self._used = 0
+        mask = size - 1
+
+        for row, user_id in enumerate(self._ids):
+            slot = (user_id ^ (user_id >> 22)) & mask
+
+            while self._slots[slot] != _EMPTY:
+                slot = (slot + 1) & mask
+
+            self._slots[slot] = row
+            self._used += 1
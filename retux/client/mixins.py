@@ -1,6 +1,5 @@
 from attrs import asdict
 
-from ..api.http import _Route, _RouteMethod
 
 __all__ = ("Respondable", "Controllable", "Editable")
 
@@ -19,6 +18,8 @@ class Editable:
         Delete an object from discord.
     """
 
+    __slots__ = ()
+
     async def edit(self, bot: "Bot", path: str, **kwargs) -> dict:  # noqa
         """
         Edits an object with the given path and kwargs.
@@ -38,7 +39,6 @@ class Editable:
             The data returned from Discord.
         """
 
-        route = _Route(method=_RouteMethod.PATCH, path=path)
         payload = {}
         for key, value in kwargs.items():
             if hasattr(value, "__slots__"):
@@ -49,7 +49,7 @@ class Editable:
             else:
                 payload[key] = value
 
-        return await bot.http.request(route, payload)
+        return await bot.http.request("PATCH", path, json=payload)
 
     async def modify(self, bot: "Bot", path: str, **kwargs) -> dict:  # noqa
         """An alias of the `edit()` method."""
@@ -71,8 +71,7 @@ class Editable:
         `dict | None`
             The data given from Discord, if any.
         """
-        route = _Route(method=_RouteMethod.DELETE, path=path)
-        return await bot.http.request(route)
+        return await bot.http.request("DELETE", path)
 
 
 class Respondable(Editable):
@@ -87,6 +86,8 @@ class Respondable(Editable):
         An alias of the `respond()` method.
     """
 
+    __slots__ = ()
+
     async def respond(self, bot: "Bot", path: str, **kwargs) -> dict:  # noqa
         """
         Executes a `respond` action to Discord with the given path and keyword arguments.
@@ -106,8 +107,6 @@ class Respondable(Editable):
             The data of the interaction response returned by Discord.
         """
 
-        route = _Route(method=_RouteMethod.POST, path=path)
-
         payload = {}
         for key, value in kwargs.items():
             if hasattr(value, "__slots__"):
@@ -118,7 +117,7 @@ class Respondable(Editable):
             else:
                 payload[key] = value
 
-        return await bot.http.request(route, payload)
+        return await bot.http.request("POST", path, json=payload)
 
     async def send(self, bot: "Bot", path: str, **kwargs) -> dict:  # noqa
         """An alias of the `respond()` method."""
@@ -137,6 +136,8 @@ class Controllable:
         Gets an object from the Discord API.
     """
 
+    __slots__ = ()
+
     @classmethod
     async def create(cls, bot: "Bot", path: str, **kwargs) -> dict:  # noqa
         """
@@ -156,8 +157,6 @@ class Controllable:
         `dict`
             The data of the object returned by Discord.
         """
-        route = _Route(method=_RouteMethod.POST, path=path)
-
         payload = {}
         for key, value in kwargs.items():
             if hasattr(value, "__slots__"):
@@ -168,7 +167,7 @@ class Controllable:
             else:
                 payload[key] = value
 
-        return await bot.http.request(route, payload)
+        return await bot.http.request("POST", path, json=payload)
 
     @classmethod
     async def get(cls, bot: "Bot", path: str, **query_params: dict | None) -> dict:  # noqa
@@ -189,5 +188,4 @@ class Controllable:
         `dict`
             The data of the object returned by Discord.
         """
-        route = _Route(method=_RouteMethod.GET, path=path)
-        return await bot.http.request(route, payload=query_params)
+        return await bot.http.request("GET", path, query=query_params)
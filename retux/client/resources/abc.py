@@ -1,4 +1,5 @@
-from datetime import datetime
+from contextvars import ContextVar
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Union
 
@@ -8,9 +9,17 @@ __all__ = ("Snowflake", "Image", "Partial", "Object", "Component")
 
 from ...const import MISSING, NotNeeded
 
+_current_bot: ContextVar["Bot"] = ContextVar("_current_bot")  # noqa
+"""
+The instance of `Bot` handling the current event.
 
-@define(repr=False, eq=False)
-class Snowflake:
+This is shared by every object instead of being stored on each of
+them. It is set for the whole connection of a bot, and for the
+callbacks of a bot while they run.
+"""
+
+
+class Snowflake(int):
     """
     Represents an unique identifier for a Discord resource.
 
@@ -20,15 +29,11 @@ class Snowflake:
     (IDs). These IDs are guaranteed to be unique across all of Discord, except in some
     unique scenarios in which child objects share their parent's ID.
 
-    ---
-
-    Attributes
-    ----------
-    _snowflake : `str`
-        The internally stored snowflake. Snowflakes are always in string-form.
+    Snowflakes are stored as integers, despite Discord giving them in string-form.
+    They are compared, ordered and hashed by their value, and may be used as keys
+    interchangeably with `int`.
 
-        This value should never need to be directly checked. Please use the
-        representation of the class itself to do this for identity comparisons.
+    ---
 
     Methods
     -------
@@ -48,24 +53,7 @@ class Snowflake:
         generated on this snowflake, e.g. a resource.
     """
 
-    _snowflake: str | int = field(converter=str)
-    """
-    The internally stored snowflake. Snowflakes are always in string-form.
-
-    The snowflake may only be `None` in the event that a given
-    field in a resource does not supply it. This should not be always
-    taken for granted as having a value. Please use the representation
-    of the class itself.
-    """
-
-    def __repr__(self) -> str | None:
-        return self._snowflake
-
-    def __eq__(self, other: Union[str, int, "Snowflake"]) -> bool:
-        if type(other) == int:
-            return bool(int(self._snowflake) == other)
-        else:
-            return bool(self._snowflake == str(other))
+    __slots__ = ()
 
     @property
     def timestamp(self) -> datetime:
@@ -75,18 +63,18 @@ class Snowflake:
         Timestamps are denoted as milliseconds since the Discord Epoch:
         the first second of 2015, or `1420070400000`.
         """
-        retrieval: int | float = (int(self._snowflake) >> 22) + 1420070400000
-        return datetime.utcfromtimestamp(retrieval)
+        retrieval: int | float = (self >> 22) + 1420070400000
+        return datetime.utcfromtimestamp(retrieval / 1000)
 
     @property
     def worker_id(self) -> int:
         """The internal worker ID of the snowflake."""
-        return (int(self._snowflake) & 0x3E0000) >> 17
+        return (self & 0x3E0000) >> 17
 
     @property
     def process_id(self) -> int:
         """The internal process ID of the snowflake."""
-        return (int(self._snowflake) & 0x1F000) >> 12
+        return (self & 0x1F000) >> 12
 
     @property
     def increment(self) -> int:
@@ -96,7 +84,7 @@ class Snowflake:
         This value will only increment when a process has been
         generated on this snowflake, e.g. a resource.
         """
-        return int(self._snowflake) & 0xFFF
+        return self & 0xFFF
 
 
 class CDNEndpoint(Enum):
@@ -442,7 +430,6 @@ class TimestampStyle(Enum):
     """Formats the timestamp as `x` (DD/MM/YY)."""
 
 
-@define(repr=False, eq=False)
 class Timestamp:
     """
     Represents a formatted timestamp from Discord.
@@ -454,35 +441,57 @@ class Timestamp:
     a bad practice to monkeypatch a solution into existing core
     modules, this helps serve as a further layer of abstraction.
 
+    Timestamps are kept as given by Discord, and are only parsed
+    into a `datetime` upon first access of `datetime`. Most timestamps,
+    such as the `joined_at` of every member in a guild, are never read.
+
     ---
 
     Attributes
     ----------
-    _timestamp : `datetime`
-        The Python formatted date and time of the timestamp. This
-        is only used for internal reference. Please use the representation
-        of the class instead.
+    _raw : `str`, `int`, `float`, `datetime.datetime`
+        The timestamp as given, either in ISO 8601 form or as seconds
+        since the Unix epoch.
+    _datetime : `datetime.datetime`, optional
+        The parsed date and time of the timestamp, if parsed yet.
 
     Methods
     -------
+    datetime : `datetime.datetime`
+        The Python formatted date and time of the timestamp.
     mention(TimestampStyle.SHORT_DATE_TIME) : `str`
         Creates a mentionable format for the timestamp.
     """
 
-    _timestamp: str | datetime = field(converter=datetime.fromisoformat)
+    __slots__ = ("_raw", "_datetime")
+    _raw: str | int | float | datetime
     """
-    The Python formatted date and time of the timestamp. This is only used for internal
-    reference. Please use the representation of the class instead.
+    The timestamp as given, either in ISO 8601 form or as seconds
+    since the Unix epoch.
     """
+    _datetime: datetime | None
+    """The parsed date and time of the timestamp, if parsed yet."""
+
+    def __init__(self, timestamp: str | int | float | datetime):
+        self._raw = timestamp
+        self._datetime = timestamp if isinstance(timestamp, datetime) else None
 
-    def __repr__(self) -> datetime:
-        return self._timestamp
+    def __repr__(self) -> str:
+        return f"Timestamp({str(self)!r})"
 
-    def __eq__(self, other: str | datetime) -> bool:
+    def __str__(self) -> str:
+        return self._raw if isinstance(self._raw, str) else self.datetime.isoformat()
+
+    def __eq__(self, other: Union[str, datetime, "Timestamp"]) -> bool:
         if type(other) == str:
-            return bool(str(self._timestamp) == other)
+            return str(self) == other
+        elif isinstance(other, Timestamp):
+            return self.datetime == other.datetime
         else:
-            return bool(self._timestamp == other)
+            return self.datetime == other
+
+    def __hash__(self) -> int:
+        return hash(self.datetime)
 
     def mention(self, style: NotNeeded[str | TimestampStyle] = MISSING) -> str:
         """
@@ -504,7 +513,17 @@ class Timestamp:
         else:
             _style = style if isinstance(style, str) else style.value
 
-        return f"<t:{self._timestamp}:{_style}>"
+        return f"<t:{int(self.datetime.timestamp())}:{_style}>"
+
+    @property
+    def datetime(self) -> datetime:
+        """The Python formatted date and time of the timestamp."""
+        if self._datetime is None:
+            if isinstance(self._raw, str):
+                self._datetime = datetime.fromisoformat(self._raw)
+            else:
+                self._datetime = datetime.fromtimestamp(self._raw, timezone.utc)
+        return self._datetime
 
 
 @define()
@@ -536,8 +555,17 @@ class Object:
 
     id: Snowflake
     """The ID associated to the object."""
-    _bot_inst: object = MISSING
-    """An instance of `Bot` used for helper methods."""
+
+    @property
+    def _bot_inst(self) -> "Bot":  # noqa
+        """
+        An instance of `Bot` used for helper methods.
+
+        Within a callback, this is the bot running it. Elsewhere,
+        this is the bot whose connection the current task was
+        spawned under, or `MISSING` outside of any bot.
+        """
+        return _current_bot.get(MISSING)
 
 
 @define()
@@ -1,14 +1,12 @@
-from datetime import datetime
 from enum import IntEnum, IntFlag
 
-from attrs import define
+from attrs import define, field
 
 from retux.client.resources.abc import Object, Partial, Snowflake
 
 from ..mixins import Respondable
 from .abc import Timestamp
 from .application import Application
-from .role import Role
 from .sticker import Sticker, StickerItem
 from .user import User
 
@@ -1882,9 +1880,9 @@ class Message(Object):
         The author of the message.
     content : `str`
         The content of the message.
-    timestamp : `datetime`
+    timestamp : `Timestamp`
         When the message was sent.
-    edited_timestamp : `datetime`, optional
+    edited_timestamp : `Timestamp`, optional
         When the message was last edited.
     tts : `bool`
         Whether or not this was a Text to Speech message.
@@ -1892,8 +1890,8 @@ class Message(Object):
         Whether or not this message mentions everyone.
     mentions : `list[User]`
         Users specifically mentioned in this message.
-    mention_roles : `list[Role]`
-        Roles specifically mentioned in this message.
+    mention_roles : `list[Snowflake]`
+        The IDs of roles specifically mentioned in this message.
     mention_channels : `list[ChannelMention]`, optional
         Channels specifically mentioned in this message.
     attachments : `list[Attachment]`, optional
@@ -1950,21 +1948,21 @@ class Message(Object):
     """The content of the message."""
     timestamp: Timestamp
     """When the message was sent."""
-    edited_timestamp: datetime
+    edited_timestamp: Timestamp | None
     """When the message was last edited."""
     tts: bool
     """Whether or not this was a Text to Speech message."""
     mention_everyone: bool
     """Whether or not this message mentions everyone."""
-    mentions: list[User]
+    mentions: list[User] = field(metadata={"lazy": True})
     """Users specifically mentioned in this message."""
-    mention_roles: list[Role]
-    """Roles specifically mentioned in this message."""
+    mention_roles: list[Snowflake] = field(metadata={"lazy": True})
+    """The IDs of roles specifically mentioned in this message."""
     mention_channels: list[ChannelMention] = None
     """Channels specifically mentioned in this message."""
-    attachments: list[Attachment]
+    attachments: list[Attachment] = field(metadata={"lazy": True})
     """The attachments of the message."""
-    embeds: list[Embed]
+    embeds: list[Embed] = field(metadata={"lazy": True})
     """The embeds of the message."""
     reactions: list[Reaction] = None
     """The reactions to the message."""
@@ -2009,7 +2007,7 @@ class Message(Object):
     # TODO: Implement Component object.
     # components: list[dict] | list[Component] | None = field(converter=optional_c(list_c(Component)), default=None)
     # """The components on a message."""
-    sticker_items: list[StickerItem] = None
+    sticker_items: list[StickerItem] = field(default=None, metadata={"lazy": True})
     """The items used to begin rendering the message's stickers."""
     stickers: list[Sticker] = None
     """The stickers of a message."""
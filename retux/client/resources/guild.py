@@ -1,7 +1,7 @@
 from enum import IntEnum, IntFlag
 from typing import Any
 
-from attrs import define
+from attrs import define, field
 
 from .abc import Object, Partial, Snowflake, Timestamp
 from .emoji import Emoji
@@ -373,9 +373,9 @@ class Guild(Object):
     """Whether the server has its widget enabled or not."""
     widget_channel_id: Snowflake = None
     """The ID of the channel which the widget targets, if present."""
-    roles: list[Role] = None
+    roles: list[Role] = field(default=None, metadata={"lazy": True})
     """The roles that the guild has, if present."""
-    emojis: list[Emoji] = None
+    emojis: list[Emoji] = field(default=None, metadata={"lazy": True})
     """The Emojis that the guild owns."""
     application_id: Snowflake = None
     """The ID of the application for the guild if created via. a bot."""
@@ -412,7 +412,7 @@ class Guild(Object):
     """The approximated amount of presences in the guild."""
     welcome_screen: WelcomeScreen = None
     """The welcome screen of the guild, if present."""
-    stickers: list[Sticker] = None
+    stickers: list[Sticker] = field(default=None, metadata={"lazy": True})
     """The stickers that the guild owns."""
 
 
@@ -588,8 +588,6 @@ class Member(Partial):
         The ID of the user, if present.
     discriminator : `str`, optional
         The discriminator (4-digit tag) of the user, if present.
-    avatar : `str`, optional
-        The hash of the user's avatar, if present.
     bot : `bool`, optional
         Whether the user is a bot or not, if present.
     system : `bool`, optional
@@ -697,34 +695,27 @@ class Member(Partial):
     @property
     def id(self) -> Snowflake | None:
         """The ID of the user, if present."""
-        return self.exists(self.user, self.user.id)
+        return None if self.user is None else self.user.id
 
     @property
     def username(self) -> str | None:
         """The ID of the user, if present."""
-        return self.exists(self.user, self.user.username)
+        return None if self.user is None else self.user.username
 
     @property
     def discriminator(self) -> str | None:
         """The discriminator (4-digit tag) of the user, if present."""
-        return self.exists(self.user, self.user.discriminator)
-
-    @property
-    def avatar(self) -> str | None:
-        """The hash of the user's avatar, if present."""
-        if _avatar := self.exists(self.user, self.user.avatar):
-            return _avatar
-        return self.avatar
+        return None if self.user is None else self.user.discriminator
 
     @property
     def bot(self) -> bool | None:
         """Whether the user is a bot or not, if present."""
-        return self.exists(self.user, self.user.bot)
+        return None if self.user is None else self.user.bot
 
     @property
     def system(self) -> bool | None:
         """Whether the user is from the official Discord System or not, if present."""
-        return self.exists(self.user, self.user.system)
+        return None if self.user is None else self.user.system
 
     @property
     def mfa_enabled(self) -> bool | None:
@@ -732,39 +723,39 @@ class Member(Partial):
         Whether the user has 2FA (two-factor authentication) enabled
         or not, if present.
         """
-        return self.exists(self.user, self.user.mfa_enabled)
+        return None if self.user is None else self.user.mfa_enabled
 
     @property
     def banner(self) -> str | None:
         """The hash of the user's banner, if present."""
-        return self.exists(self.user, self.user.banner)
+        return None if self.user is None else self.user.banner
 
     @property
     def accent_color(self) -> int | None:
         """The color of the user's banner, if present."""
-        return self.exists(self.user, self.user.accent_color)
+        return None if self.user is None else self.user.accent_color
 
     @property
     def locale(self) -> str | None:
         """The user's selected locale, if present."""
-        return self.exists(self.user, self.user.locale)
+        return None if self.user is None else self.user.locale
 
     @property
     def verified(self) -> bool | None:
         """Whether the user has a verified e-mail or not."""
-        return self.exists(self.user, self.user.verified)
+        return None if self.user is None else self.user.verified
 
     @property
     def email(self) -> str | None:
         """The e-mail associated to the user's account, if present."""
-        return self.exists(self.user, self.user.email)
+        return None if self.user is None else self.user.email
 
     @property
     def premium_type(self) -> UserPremiumType | None:
         """The type of Nitro subscription the user has, if present."""
-        return self.exists(self.user, self.user.premium_type)
+        return None if self.user is None else self.user.premium_type
 
     @property
     def public_flags(self) -> UserFlags | None:
         """The type of Nitro subscription the user has, if present."""
-        return self.exists(self.user, self.user.public_flags)
+        return None if self.user is None else self.user.public_flags
@@ -0,0 +1,264 @@
+from logging import getLogger
+from typing import Coroutine
+
+from trio import (
+    CapacityLimiter,
+    MemorySendChannel,
+    MemoryReceiveChannel,
+    Nursery,
+    WouldBlock,
+    open_memory_channel,
+    open_nursery,
+)
+
+from ..const import MISSING
+
+logger = getLogger(__name__)
+
+__all__ = ("DispatchScheduler",)
+
+
+class DispatchScheduler:
+    """
+    Represents a scheduler for the callbacks of dispatched Gateway events.
+
+    ---
+
+    Events are queued by a key, which is the ID of the guild they
+    belong to. Every key has its own queue and worker task, so events
+    of one guild are handled in the order they were received while
+    events of different guilds are handled concurrently. Events without
+    a guild are not ordered, and are ran as soon as possible.
+
+    Queues are bounded: once a guild has `max_pending` events waiting,
+    queueing another one waits for room, applying backpressure onto
+    the Gateway connection. Workers exit once their queue is drained.
+    Events without a guild share a lane bounded the same way, limiting
+    how many of them are waiting or running at once.
+
+    ---
+
+    Attributes
+    ----------
+    max_pending : `int`
+        The maximum amount of events waiting per guild.
+    submitted : `int`
+        The total amount of events queued.
+    completed : `int`
+        The total amount of events handled.
+    blocked : `int`
+        The amount of times queueing an event had to wait for room.
+    _limiter : `trio.CapacityLimiter`
+        The limiter of callbacks running at once.
+    _unordered : `trio.CapacityLimiter`
+        The limiter of events without a guild waiting or running at once.
+    _queues : `dict[str, trio.MemorySendChannel]`
+        The queues of every guild with a running worker.
+    _nursery : `trio.Nursery`, optional
+        The nursery that workers are spawned into while running.
+    _tasks : `trio.Nursery`
+        The tasks associated with the scheduler.
+    """
+
+    __slots__ = (
+        "max_pending",
+        "submitted",
+        "completed",
+        "blocked",
+        "_limiter",
+        "_unordered",
+        "_queues",
+        "_nursery",
+        "_tasks",
+    )
+    max_pending: int
+    """The maximum amount of events waiting per guild."""
+    submitted: int
+    """The total amount of events queued."""
+    completed: int
+    """The total amount of events handled."""
+    blocked: int
+    """The amount of times queueing an event had to wait for room."""
+    _limiter: CapacityLimiter
+    """The limiter of callbacks running at once."""
+    _unordered: CapacityLimiter
+    """The limiter of events without a guild waiting or running at once."""
+    _queues: dict[str, MemorySendChannel]
+    """The queues of every guild with a running worker."""
+    _nursery: Nursery | MISSING
+    """The nursery that workers are spawned into while running."""
+    _tasks: Nursery
+    """The tasks associated with the scheduler."""
+
+    def __init__(self, max_handlers: int = 100, max_pending: int = 256):
+        """
+        Creates a new dispatch scheduler.
+
+        Parameters
+        ----------
+        max_handlers : `int`, optional
+            The maximum amount of callbacks to run at once. Defaults to `100`.
+        max_pending : `int`, optional
+            The maximum amount of events waiting per guild, and of events
+            without a guild waiting or running. Defaults to `256`.
+        """
+        self.max_pending = max_pending
+        self.submitted = 0
+        self.completed = 0
+        self.blocked = 0
+        self._limiter = CapacityLimiter(max_handlers)
+        self._unordered = CapacityLimiter(max_pending)
+        self._queues = {}
+        self._nursery = MISSING
+        self._tasks = None
+
+    async def __aenter__(self):
+        self._tasks = open_nursery()
+        self._nursery = await self._tasks.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc):
+        self._nursery.cancel_scope.cancel()
+        self._nursery = MISSING
+        self._queues.clear()
+        return await self._tasks.__aexit__(*exc)
+
+    @property
+    def running(self) -> bool:
+        """Whether the scheduler is running or not."""
+        return self._nursery is not MISSING
+
+    async def submit(self, key: str | None, calls: list[Coroutine], *args):
+        """
+        Queues the callbacks of an event.
+
+        Parameters
+        ----------
+        key : `str`, optional
+            The key to order the event by. Events without a key are ran
+            as soon as possible, once there is room in their lane.
+        calls : `list[typing.Coroutine]`
+            The callbacks to run, in order.
+        """
+        self.submitted += 1
+
+        if key is None:
+            # Every event holds a token of the lane until its callbacks are done.
+            token = object()
+
+            try:
+                self._unordered.acquire_on_behalf_of_nowait(token)
+            except WouldBlock:
+                self.blocked += 1
+                logger.debug("The lane of events without a guild is full, waiting for room.")
+                await self._unordered.acquire_on_behalf_of(token)
+
+            self._nursery.start_soon(self._run_unordered, token, calls, args)
+            return
+
+        queue = self._queues.get(key)
+
+        if queue is None:
+            queue, receive = open_memory_channel(self.max_pending)
+            self._queues[key] = queue
+            self._nursery.start_soon(self._work, key, receive)
+
+        try:
+            queue.send_nowait((calls, args))
+        except WouldBlock:
+            self.blocked += 1
+            logger.debug(f"The queue of {key} is full, waiting for room.")
+            await queue.send((calls, args))
+
+    async def _work(self, key: str, receive: MemoryReceiveChannel):
+        """
+        Handles the queued events of a key in order.
+
+        Parameters
+        ----------
+        key : `str`
+            The key of the queue.
+        receive : `trio.MemoryReceiveChannel`
+            The receiving end of the queue.
+        """
+        while True:
+            try:
+                calls, args = receive.receive_nowait()
+            except WouldBlock:
+                break
+
+            await self._run(calls, args)
+
+        # The queue is only dropped once empty, so nothing
+        # can be sent to it between draining and closing.
+        del self._queues[key]
+        receive.close()
+
+    async def _run_unordered(self, token: object, calls: list[Coroutine], args: tuple):
+        """
+        Runs the callbacks of an event without a guild, freeing its room in the lane after.
+
+        Parameters
+        ----------
+        token : `object`
+            The token the event holds in the lane.
+        calls : `list[typing.Coroutine]`
+            The callbacks to run, in order.
+        args : `tuple`
+            The arguments given to every callback.
+        """
+        try:
+            await self._run(calls, args)
+        finally:
+            self._unordered.release_on_behalf_of(token)
+
+    async def _run(self, calls: list[Coroutine], args: tuple):
+        """
+        Runs the callbacks of an event under the limit of callbacks running at once.
+
+        ---
+
+        Exceptions raised by a callback are logged rather than
+        propagated, isolating them from other callbacks and
+        the Gateway connection.
+
+        ---
+
+        Parameters
+        ----------
+        calls : `list[typing.Coroutine]`
+            The callbacks to run, in order.
+        args : `tuple`
+            The arguments given to every callback.
+        """
+        async with self._limiter:
+            for coro in calls:
+                try:
+                    await coro(*args)
+                except Exception:
+                    logger.exception(f"An exception occurred in the callback {coro.__name__}.")
+
+        self.completed += 1
+
+    def statistics(self) -> dict[str, int]:
+        """
+        Gets the backpressure metrics of the scheduler.
+
+        Returns
+        -------
+        `dict[str, int]`
+            The amount of `queues` with a running worker, events `pending`
+            across every queue, the most events pending in one queue as
+            `deepest`, events without a guild waiting or running as
+            `unordered`, and the `submitted`, `completed` and `blocked` counts.
+        """
+        depths = [queue.statistics().current_buffer_used for queue in self._queues.values()]
+        return {
+            "queues": len(depths),
+            "pending": sum(depths),
+            "deepest": max(depths, default=0),
+            "unordered": self._unordered.borrowed_tokens,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "blocked": self.blocked,
+        }
@@ -0,0 +1,281 @@
+from collections.abc import Sequence
+from typing import Any, Callable, get_args
+from weakref import WeakValueDictionary
+
+from attrs import fields, has
+from cattrs import Converter
+from cattrs.gen import make_dict_structure_fn, make_dict_unstructure_fn, override
+
+from ..client.resources.abc import Snowflake, Timestamp
+from ..client.resources.user import User
+from .hooks import cattrs_structure_hooks
+
+__all__ = ("converter", "structure", "unstructure", "set_lazy", "shared_user", "LazyList")
+
+converter = Converter(forbid_extra_keys=False, omit_if_default=True, detailed_validation=False)
+"""
+The converter of retux, used for structuring and unstructuring every model.
+
+Unlike the global converter of `cattrs`, extra keys given by Discord are
+ignored and fields left to their default are omitted upon unstructuring.
+"""
+
+_structure_fns: dict[type, Callable[[dict, type], Any]] = {}
+"""The structuring functions built for every model so far."""
+_unstructure_fns: dict[type, Callable[[Any], dict]] = {}
+"""The unstructuring functions built for every model so far."""
+_lazy: bool = False
+"""Whether fields marked as lazy are structured on first access or not."""
+_users: WeakValueDictionary[int, User] = WeakValueDictionary()
+"""Every user structured and still referenced elsewhere, by their ID."""
+
+
+class LazyList(Sequence):
+    """
+    Represents a list of models structured on first access.
+
+    ---
+
+    The data given by Discord is kept as-is until an item is
+    first accessed, at which point every item is structured at
+    once. Taking the length of the list does not structure it.
+
+    ---
+
+    Attributes
+    ----------
+    _data : `list[dict]`
+        The data of the items, as given by Discord.
+    _cls : `type`
+        The model to structure the items into.
+    _items : `list[typing.Any]`, optional
+        The structured items, if accessed already.
+    """
+
+    __slots__ = ("_data", "_cls", "_items")
+    _data: list[dict]
+    """The data of the items, as given by Discord."""
+    _cls: type
+    """The model to structure the items into."""
+    _items: list[Any] | None
+    """The structured items, if accessed already."""
+
+    def __init__(self, data: list[dict], cls: type):
+        self._data = data
+        self._cls = cls
+        self._items = None
+
+    @property
+    def items(self) -> list[Any]:
+        """The structured items, structuring them if needed."""
+        if self._items is None:
+            self._items = structure(self._data, list[self._cls])
+        return self._items
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the items have been structured or not."""
+        return self._items is not None
+
+    def __getitem__(self, index: int | slice) -> Any:
+        return self.items[index]
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyList):
+            other = other.items
+        return self.items == other
+
+    def __repr__(self) -> str:
+        return repr(self.items)
+
+
+def set_lazy(enabled: bool):
+    """
+    Sets whether fields marked as lazy are structured on first access or not.
+
+    ---
+
+    Lazy fields are nested lists of large payloads, such as the
+    roles of a guild or the embeds of a message. When enabled,
+    they are given as a `LazyList`. This is disabled by default,
+    structuring them as plain lists.
+
+    ---
+
+    Parameters
+    ----------
+    enabled : `bool`
+        Whether to structure lazy fields on first access.
+    """
+    global _lazy
+    _lazy = enabled
+
+
+def _make_lazy_hook(cls: type) -> Callable[[list | None, type], Any]:
+    """Builds a structuring hook deferring a list field until first access."""
+    item = get_args(cls)[0]
+    eager = list[item]
+
+    def hook(data: list | None, _) -> Any:
+        if data is None:
+            return None
+        return LazyList(data, item) if _lazy else structure(data, eager)
+
+    return hook
+
+
+def _unstructure_lazy(obj: LazyList | list | None) -> list | None:
+    """Unstructures a lazy field, giving back the data as-is if never accessed."""
+    if isinstance(obj, LazyList):
+        return unstructure(obj._items) if obj.materialized else obj._data
+    return unstructure(obj)
+
+
+def _make_structure_fn(cls: type) -> Callable[[dict, type], Any]:
+    """Builds a specialized structuring function for an `attrs` model."""
+    overrides = {
+        attr.name: override(struct_hook=_make_lazy_hook(attr.type))
+        for attr in fields(cls)
+        if attr.metadata.get("lazy")
+    }
+    return make_dict_structure_fn(cls, converter, _cattrs_forbid_extra_keys=False, **overrides)
+
+
+def shared_user(user_id: int) -> User | None:
+    """
+    Gets the user structured for an ID and shared by every model, if any.
+
+    ---
+
+    Users are held weakly, and are forgotten once no other
+    model or cache references them.
+
+    ---
+
+    Parameters
+    ----------
+    user_id : `int`
+        The ID of the user.
+
+    Returns
+    -------
+    `User`, optional
+        The shared user, if still referenced.
+    """
+    return _users.get(user_id)
+
+
+def _make_user_hook() -> Callable[[dict, type], User]:
+    """
+    Builds the structuring hook of users, deduplicating them by their ID.
+
+    ---
+
+    The same user is given by Discord in every guild it is a
+    member of, every message it sends or is mentioned in, and
+    more. Rather than structuring a new `User` each time, the
+    one already structured is given back as-is.
+
+    Structuring never changes a shared user, as the data may be
+    older than it, such as for a lazy field read late or a message
+    fetched from history. Shared users are updated by the cache
+    from the Gateway events carrying them instead.
+
+    ---
+
+    Returns
+    -------
+    `typing.Callable[[dict, type], User]`
+        The structuring hook of users.
+    """
+    structure_user = _make_structure_fn(User)
+
+    def hook(data: dict, cls: type) -> User:
+        user_id = int(data["id"])
+
+        if (user := _users.get(user_id)) is None:
+            user = _users[user_id] = structure_user(data, cls)
+        return user
+
+    return hook
+
+
+def _make_unstructure_fn(cls: type) -> Callable[[Any], dict]:
+    """Builds a specialized unstructuring function for an `attrs` model."""
+    overrides = {
+        attr.name: override(unstruct_hook=_unstructure_lazy)
+        for attr in fields(cls)
+        if attr.metadata.get("lazy")
+    }
+    return make_dict_unstructure_fn(cls, converter, _cattrs_omit_if_default=True, **overrides)
+
+
+cattrs_structure_hooks(converter)
+converter.register_structure_hook(int | str, lambda data, _: data)
+converter.register_unstructure_hook(Snowflake, str)
+converter.register_unstructure_hook(Timestamp, str)
+converter.register_structure_hook_factory(has, _make_structure_fn)
+converter.register_unstructure_hook_factory(has, _make_unstructure_fn)
+converter.register_structure_hook(User, _make_user_hook())
+
+
+def structure(data: Any, cls: type) -> Any:
+    """
+    Structures data into a model.
+
+    ---
+
+    The structuring function of a model is built on first use
+    and reused afterwards, skipping the dispatch of `cattrs`
+    on every call.
+
+    ---
+
+    Parameters
+    ----------
+    data : `typing.Any`
+        The data to structure, usually given by Discord.
+    cls : `type`
+        The model to structure the data into.
+
+    Returns
+    -------
+    `typing.Any`
+        An instance of the model.
+    """
+    if (fn := _structure_fns.get(cls)) is None:
+        fn = _structure_fns[cls] = converter.get_structure_hook(cls)
+    return fn(data, cls)
+
+
+def unstructure(obj: Any) -> Any:
+    """
+    Unstructures a model into data.
+
+    ---
+
+    Fields left to their default are omitted from the data.
+
+    ---
+
+    Parameters
+    ----------
+    obj : `typing.Any`
+        The instance of the model to unstructure.
+
+    Returns
+    -------
+    `typing.Any`
+        The unstructured data.
+    """
+    cls = obj.__class__
+
+    if (fn := _unstructure_fns.get(cls)) is None:
+        fn = _unstructure_fns[cls] = converter.get_unstructure_hook(cls)
+    return fn(obj)
@@ -6,7 +6,7 @@ __all__ = "cattrs_structure_hooks"
 
 
 def _pos_arg(data, type):
-    return type(data)
+    return None if data is None else type(data)
 
 
 def cattrs_structure_hooks(converter: Converter = None):
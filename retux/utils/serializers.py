@@ -0,0 +1,73 @@
+from typing import Any
+
+__all__ = ("json_loads", "json_dumps", "__json_backend__")
+
+try:
+    import orjson
+
+    __json_backend__ = "orjson"
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+except ImportError:
+    try:
+        import ujson
+
+        __json_backend__ = "ujson"
+        _loads = ujson.loads
+
+        def _dumps(obj: Any) -> str:
+            return ujson.dumps(obj, ensure_ascii=False)
+
+    except ImportError:
+        import json
+
+        __json_backend__ = "json"
+        _loads = json.loads
+
+        def _dumps(obj: Any) -> str:
+            return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """
+    Deserializes JSON data with the fastest available backend.
+
+    ---
+
+    The backend is picked upon import in the order of `orjson`, `ujson`
+    and lastly the standard library's `json`. Data may be given as `bytes`
+    directly, avoiding a decode when it comes straight from a socket.
+
+    ---
+
+    Parameters
+    ----------
+    data : `str`, `bytes`
+        The JSON data to deserialize.
+
+    Returns
+    -------
+    `typing.Any`
+        The deserialized data.
+    """
+    return _loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Serializes an object into JSON with the fastest available backend.
+
+    Parameters
+    ----------
+    obj : `typing.Any`
+        The object to serialize.
+
+    Returns
+    -------
+    `str`
+        The serialized JSON data.
+    """
+    return _dumps(obj)
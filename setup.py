@@ -29,9 +29,10 @@ setup(
     url="https://github.com/i0bs/retux",
     license="AGPL-3.0",
     keywords="python discord discord-bot discord-api python3 discord-bots",
-    packages=find_packages(),
+    packages=find_packages(exclude=("tests", "tests.*")),
     include_package_data=True,
     install_requires=["attrs", "cattrs", "httpx", "trio", "trio_websocket"],
+    extras_require={"json": ["orjson"], "ujson": ["ujson"], "etf": ["erlpack"]},
     python_requires=">=3.10.0",
     classifiers=[
         "Intended Audience :: Developers",
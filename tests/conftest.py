@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+
+import pytest
+import trio
+from trio_websocket import ConnectionClosed
+
+from retux.const import MISSING
+from retux.utils.serializers import json_dumps, json_loads
+
+
+class FakeConnection:
+    """
+    Represents a websocket connection replaying scripted messages.
+
+    Messages given as a `dict` are sent as JSON, and anything sent
+    to the connection is recorded in `sent`. Once every message is
+    received, receiving waits until the connection is closed.
+    """
+
+    def __init__(self, messages: list):
+        self.messages = list(messages)
+        self.sent = []
+        self.closed = None
+        self._done = trio.Event()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def get_message(self) -> str | bytes:
+        if self.closed is None and self.messages:
+            message = self.messages.pop(0)
+            return json_dumps(message) if isinstance(message, dict) else message
+
+        await self._done.wait()
+        raise ConnectionClosed(self.closed)
+
+    async def send_message(self, data: str | bytes):
+        self.sent.append(json_loads(data) if isinstance(data, str) else data)
+
+    async def aclose(self, code: int = 1000):
+        if self.closed is None:
+            self.closed = SimpleNamespace(code=code, reason=None)
+        self._done.set()
+
+
+@pytest.fixture
+def connections(monkeypatch) -> list[FakeConnection]:
+    """
+    Replaces the connections made to the Gateway by fake ones.
+
+    Every connection made takes the next `FakeConnection` of the list,
+    and its URL is recorded onto it.
+    """
+    connections = []
+    opened = iter(connections)
+
+    def open_websocket_url(url: str) -> FakeConnection:
+        connection = next(opened, MISSING)
+
+        if connection is MISSING:
+            connection = FakeConnection([])
+        connection.url = url
+        return connection
+
+    monkeypatch.setattr("retux.api.gateway.open_websocket_url", open_websocket_url)
+    return connections
@@ -0,0 +1,31 @@
+import trio
+
+from retux.client.bot import Bot
+from retux.client.flags import Intents
+from retux.client.resources.abc import Object
+from retux.const import MISSING
+
+
+def test_bot_reference():
+    first, second = Bot(Intents.GUILDS), Bot(Intents.GUILDS)
+    seen = []
+
+    async def on_thing(obj: Object):
+        seen.append(obj._bot_inst)
+
+    first._calls = {"thing": [on_thing]}
+    second._calls = {"thing": [on_thing]}
+
+    obj = Object(id=1)
+    assert obj._bot_inst is MISSING
+    assert not hasattr(obj, "__dict__")
+
+    async def main():
+        await first._trigger("thing", obj)
+        await second._trigger("thing", obj)
+
+    trio.run(main)
+
+    # Callbacks see the bot running them, and nothing is stored on the object.
+    assert seen == [first, second]
+    assert obj._bot_inst is MISSING
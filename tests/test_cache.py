@@ -0,0 +1,192 @@
+import pytest
+import trio
+
+from retux.api.gateway import GatewayClient
+from retux.client.bot import Bot
+from retux.client.cache import Cache, CachePolicy
+from retux.client.flags import Intents
+from retux.client.resources.channel import Message
+from retux.client.resources.user import User
+from retux.utils.conversion import structure
+
+MEMBER = {
+    "guild_id": "1",
+    "user": {"id": "4", "username": "user", "discriminator": "0001"},
+    "roles": [],
+    "joined_at": "2022-01-01T00:00:00+00:00",
+    "premium_since": None,
+    "communication_disabled_until": None,
+}
+
+
+def test_patch_nullable_fields():
+    cache = Cache()
+    cache._handle("GUILD_MEMBER_ADD", MEMBER)
+    member = cache.get_member(1, 4)
+
+    update = {**MEMBER, "premium_since": "2022-02-01T00:00:00+00:00"}
+    model, changes = cache._handle("GUILD_MEMBER_UPDATE", update, diff=True)
+
+    assert model is member
+    assert list(changes) == ["premium_since"]
+    assert changes["premium_since"][0] is None
+    assert member.premium_since == "2022-02-01T00:00:00+00:00"
+
+    model, changes = cache._handle("GUILD_MEMBER_UPDATE", MEMBER, diff=True)
+
+    assert list(changes) == ["premium_since"]
+    assert member.premium_since is None
+    assert member.communication_disabled_until is None
+
+    _, changes = cache._handle("GUILD_MEMBER_UPDATE", MEMBER, diff=True)
+
+    assert changes == {}
+
+
+def test_dispatch_patched_model():
+    bot = Bot(Intents.GUILDS)
+    gateway = GatewayClient("token", Intents.GUILDS)
+    gateway._subscribe(*bot.cache.events)
+    gateway._bots.append(bot)
+    seen = []
+
+    async def on_channel_update(channel):
+        seen.append(channel)
+
+    async def on_parent_id(channel, before, after):
+        seen.append((channel, before, after))
+
+    bot._calls = {"channel_update": [on_channel_update], "channel_update.parent_id": [on_parent_id]}
+    bot.cache._handle("CHANNEL_CREATE", {"id": "3", "type": 0, "guild_id": "1", "parent_id": "2"})
+    channel = bot.cache.get_channel(3)
+
+    payload = gateway._structure(
+        {"op": 0, "t": "CHANNEL_UPDATE", "s": 1, "d": {"id": "3", "type": 0, "parent_id": None}}
+    )
+    trio.run(gateway._track, payload)
+
+    # Both the change and the update are given the cached channel, patched in place.
+    assert seen == [(channel, 2, None), channel]
+    assert seen[1] is channel
+    assert channel.parent_id is None
+
+
+def test_shared_user_ordering():
+    cache = Cache()
+    user = {"id": "6", "username": "old", "discriminator": "0001"}
+    message = structure(
+        {
+            "id": "10",
+            "channel_id": "3",
+            "author": {"id": "7", "username": "author", "discriminator": "0002"},
+            "content": "",
+            "timestamp": "2022-01-01T00:00:00+00:00",
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [user],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [],
+            "pinned": False,
+            "type": 0,
+        },
+        Message,
+    )
+    cache._handle("GUILD_MEMBER_ADD", {**MEMBER, "user": {**user, "username": "new"}})
+    shared = cache.get_user(6)
+
+    assert shared.username == "new"
+
+    # Reading the older message later leaves the shared user as it is.
+    assert message.mentions[0] is shared
+    assert shared.username == "new"
+    assert structure(user, User) is shared
+    assert shared.username == "new"
+
+    _, changes = cache._handle("USER_UPDATE", {**user, "username": "newer"}, diff=True)
+
+    assert changes == {"username": ("new", "newer")}
+    assert shared.username == "newer"
+
+
+def test_guild_create_leaves_payload_unchanged():
+    cache = Cache()
+    guild = {
+        "id": "1",
+        "name": "guild",
+        "icon": None,
+        "owner_id": "2",
+        "afk_timeout": 300,
+        "verification_level": 0,
+        "default_message_notifications": 0,
+        "explicit_content_filter": 0,
+        "features": [],
+        "mfa_level": 0,
+        "system_channel_flags": 0,
+        "premium_tier": 0,
+        "preferred_locale": "en-US",
+        "nsfw_level": 0,
+        "premium_progress_bar_enabled": False,
+        "channels": [{"id": "3", "type": 0}],
+        "threads": [],
+    }
+
+    cache._handle("GUILD_CREATE", guild)
+
+    assert guild["channels"] == [{"id": "3", "type": 0}]
+    assert cache.get_channel(3).guild_id == 1
+
+
+def channel(channel_id: int) -> dict:
+    return {"id": str(channel_id), "type": 0, "guild_id": "1"}
+
+
+def test_none_policy():
+    cache = Cache(channels=CachePolicy.none())
+    model, _ = cache._handle("CHANNEL_CREATE", channel(3))
+
+    assert model is None
+    assert cache.get_channel(3) is None
+    assert len(cache.channels) == 0
+
+
+def test_all_policy():
+    cache = Cache(channels=CachePolicy.all())
+
+    for channel_id in range(100):
+        cache._handle("CHANNEL_CREATE", channel(channel_id))
+
+    assert len(cache.channels) == 100
+    assert cache.get_channel(0) is cache.get_channel(0)
+
+
+def test_lru_policy():
+    cache = Cache(channels=CachePolicy.lru(2))
+    cache._handle("CHANNEL_CREATE", channel(1))
+    cache._handle("CHANNEL_CREATE", channel(2))
+
+    # Reading a channel makes it the most recently used.
+    assert cache.get_channel(1) is not None
+    cache._handle("CHANNEL_CREATE", channel(3))
+
+    assert cache.get_channel(2) is None
+    assert [c.id for c in (cache.get_channel(1), cache.get_channel(3))] == [1, 3]
+
+
+def test_columnar_policy():
+    cache = Cache(members=CachePolicy.columnar())
+    cache._handle("GUILD_MEMBER_ADD", MEMBER)
+    member = cache.get_member(1, 4)
+
+    assert member.user.username == "user"
+    assert member.joined_at == "2022-01-01T00:00:00+00:00"
+
+
+def test_invalid_policies():
+    with pytest.raises(ValueError):
+        CachePolicy("some")
+    with pytest.raises(ValueError):
+        CachePolicy.lru(0)
+    with pytest.raises(ValueError):
+        Cache(channels=CachePolicy.columnar())
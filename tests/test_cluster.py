@@ -0,0 +1,162 @@
+from multiprocessing import Pipe
+
+import pytest
+import trio
+
+from retux.api.cluster import ClusterManager, IPCChannel, _IPCScheduler, _run_cluster
+from retux.api.error import IPCError
+from retux.api.shard import IdentifyScheduler
+from retux.client.flags import Intents
+from retux.const import MISSING
+
+
+def test_ipc_request_reply():
+    parent, child = Pipe()
+    manager, process = IPCChannel(parent), IPCChannel(child)
+
+    @manager.handler
+    async def double(data: int) -> int:
+        return data * 2
+
+    @manager.handler
+    def fail(data: None):
+        raise ValueError("failed")
+
+    async def main():
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(manager.listen)
+            nursery.start_soon(process.listen)
+
+            assert await process.request("double", 21) == 42
+
+            with pytest.raises(IPCError, match="ValueError"):
+                await process.request("fail")
+            with pytest.raises(IPCError, match="No handler"):
+                await process.request("missing")
+
+            nursery.cancel_scope.cancel()
+
+    trio.run(main)
+
+    assert process._pending == {}
+
+
+def test_broadcast_across_clusters():
+    manager = ClusterManager("token", Intents.GUILDS)
+    processes = []
+
+    for cluster_id in range(2):
+        parent, child = Pipe()
+        channel, process = IPCChannel(parent), IPCChannel(child)
+        channel.handler(manager._broadcast, name="broadcast")
+        process.handler(lambda data, cluster_id=cluster_id: cluster_id * 10, name="guild_count")
+        manager.channels.append(channel)
+        processes.append(process)
+
+    async def main():
+        async with trio.open_nursery() as nursery:
+            for channel in manager.channels + processes:
+                nursery.start_soon(channel.listen)
+
+            counts = await processes[1].request("broadcast", {"op": "guild_count"})
+            missing = await manager.broadcast("missing")
+            nursery.cancel_scope.cancel()
+
+        return counts, missing
+
+    counts, missing = trio.run(main)
+
+    # Replies are ordered by cluster ID, and failures are given back in place.
+    assert counts == [0, 10]
+    assert all(isinstance(reply, IPCError) for reply in missing)
+
+
+def test_ipc_pending_failed_on_shutdown():
+    parent, child = Pipe()
+    process = IPCChannel(child)
+    failed = []
+
+    async def request():
+        with pytest.raises(IPCError, match="closed"):
+            await process.request("ignored")
+        failed.append(True)
+
+    async def main():
+        async with trio.open_nursery() as nursery:
+            listening = trio.CancelScope()
+
+            async def listen():
+                with listening:
+                    await process.listen()
+
+            nursery.start_soon(listen)
+            nursery.start_soon(request)
+            await trio.sleep(0.1)
+
+            # Cancelling the listener still fails the request awaiting a reply.
+            listening.cancel()
+
+    trio.run(main)
+
+    assert failed == [True]
+    assert process._pending == {}
+    parent.close()
+
+
+def test_ipc_abandoned_identify_frees_bucket():
+    parent, child = Pipe()
+    manager = ClusterManager("token", Intents.GUILDS)
+    channel, process = IPCChannel(parent), IPCChannel(child)
+    channel.handler(manager._identify, name="identify")
+    channel.handler(manager._abandon, name="abandon")
+    channel.handler(manager._release, name="release")
+    scheduler = _IPCScheduler(process)
+    identified = []
+
+    async def main():
+        manager.scheduler = IdentifyScheduler()
+
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(channel.listen)
+            nursery.start_soon(process.listen)
+
+            await scheduler.wait(0)
+
+            # Shard 1 waits behind shard 0, then gives up before its turn.
+            with trio.move_on_after(0.2):
+                await scheduler.wait(1)
+            await scheduler.release(0, identified=False)
+
+            with trio.move_on_after(2):
+                await scheduler.wait(2)
+                identified.append(2)
+
+            nursery.cancel_scope.cancel()
+
+    trio.run(main)
+
+    assert identified == [2]
+    assert manager._waiting == set()
+    assert manager._abandoned == set()
+
+
+class Handlers(Exception):
+    """Raised by a setup function to give back the handlers of a process."""
+
+
+def capture_handlers(bot):
+    raise Handlers(set(bot.ipc._handlers))
+
+
+@pytest.mark.parametrize("allow_eval", [False, True])
+def test_eval_handler_opt_in(monkeypatch, allow_eval):
+    monkeypatch.setattr("retux.api.cluster.HTTPClient", lambda token: None)
+    parent, child = Pipe()
+
+    with pytest.raises(Handlers) as handlers:
+        _run_cluster(
+            0, "token", Intents.GUILDS, [0], 1, capture_handlers, MISSING, allow_eval, child
+        )
+
+    assert ("eval" in handlers.value.args[0]) is allow_eval
+    assert "shards" in handlers.value.args[0]
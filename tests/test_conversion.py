@@ -0,0 +1,30 @@
+from retux.client.resources.abc import Snowflake
+from retux.client.resources.user import User
+from retux.utils import conversion
+from retux.utils.conversion import structure, unstructure
+
+USER = {"id": "4", "username": "user", "discriminator": "0001", "avatar": None}
+
+
+def test_structure_ignores_extra_keys():
+    user = structure({**USER, "id": "40", "unknown_field": 1}, User)
+
+    assert user.id == 40
+    assert isinstance(user.id, Snowflake)
+    assert user.username == "user"
+
+
+def test_structure_fn_built_once():
+    structure({**USER, "id": "41"}, User)
+    fn = conversion._structure_fns[User]
+    structure({**USER, "id": "42"}, User)
+
+    assert conversion._structure_fns[User] is fn
+
+
+def test_unstructure_omits_defaults():
+    user = structure({"id": "43", "username": "user", "discriminator": "0001"}, User)
+    data = unstructure(user)
+
+    assert data == {"id": "43", "username": "user", "discriminator": "0001"}
+    assert structure(data, User) == user
@@ -0,0 +1,53 @@
+import pytest
+
+from retux.api import etf
+
+PAYLOAD = {
+    "op": 0,
+    "s": 42,
+    "t": "MESSAGE_CREATE",
+    "d": {
+        "id": "1012345678901234567",
+        "content": "héllo",
+        "pinned": False,
+        "tts": True,
+        "edited_timestamp": None,
+        "mentions": [],
+        "embeds": [{"color": 16777215, "ratio": 0.5}],
+        "nonce": -2147483649,
+    },
+}
+
+
+def test_pure_python_round_trip(monkeypatch):
+    monkeypatch.setattr(etf, "erlpack", None)
+
+    assert etf.loads(etf.dumps(PAYLOAD)) == PAYLOAD
+
+
+def test_erlpack_round_trip(monkeypatch):
+    erlpack = pytest.importorskip("erlpack")
+    monkeypatch.setattr(etf, "erlpack", erlpack)
+    monkeypatch.setattr(etf, "_erlpack_decoder", erlpack.ErlangTermDecoder(encoding="utf-8"))
+
+    data = etf.dumps(PAYLOAD)
+
+    assert etf.loads(data) == PAYLOAD
+    monkeypatch.setattr(etf, "erlpack", None)
+    assert etf.loads(data) == PAYLOAD
+
+
+class _Atom(str):
+    """Stands in for `erlpack.Atom`, a subclass of `str`."""
+
+
+def test_normalize_erlpack_output():
+    decoded = {
+        b"op": 0,
+        b"d": {b"flag": _Atom("true"), b"name": _Atom("custom"), b"pair": (1, b"x")},
+    }
+
+    assert etf._normalize(decoded) == {
+        "op": 0,
+        "d": {"flag": True, "name": "custom", "pair": [1, "x"]},
+    }
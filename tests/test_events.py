@@ -0,0 +1,62 @@
+from retux.api.events.abc import _EventTable
+from retux.client.resources.abc import Snowflake
+from retux.client.resources.channel import Message
+from retux.utils import conversion
+from retux.utils.conversion import LazyList
+
+MESSAGE_CREATE = {
+    "id": "10",
+    "channel_id": "3",
+    "guild_id": "1",
+    "author": {"id": "4", "username": "author", "discriminator": "0001"},
+    "member": {"roles": [], "joined_at": "2022-01-01T00:00:00+00:00"},
+    "content": "hello",
+    "timestamp": "2022-01-01T00:00:00+00:00",
+    "edited_timestamp": None,
+    "tts": False,
+    "mention_everyone": False,
+    "mentions": [{"id": "5", "username": "mentioned", "discriminator": "0002"}],
+    "mention_roles": [],
+    "attachments": [],
+    "embeds": [],
+    "pinned": False,
+    "type": 0,
+}
+
+
+def test_message_create_eager():
+    model = _EventTable.lookup("MESSAGE_CREATE")
+    message = _EventTable.structure(MESSAGE_CREATE, model)
+
+    assert type(message.mentions) is list
+    assert message.mentions[0].username == "mentioned"
+
+
+def test_message_create_lazy(monkeypatch):
+    monkeypatch.setattr(conversion, "_lazy", False)
+    conversion.set_lazy(True)
+    model = _EventTable.lookup("MESSAGE_CREATE")
+    message = _EventTable.structure(MESSAGE_CREATE, model)
+
+    assert isinstance(message, Message)
+    assert isinstance(message.mentions, LazyList)
+    assert not message.mentions.materialized
+    assert len(message.mentions) == 1
+    assert not message.mentions.materialized
+    assert message.mentions[0].username == "mentioned"
+    assert message.mentions.materialized
+
+
+def test_message_create_mention_roles():
+    model = _EventTable.lookup("MESSAGE_CREATE")
+    message = _EventTable.structure({**MESSAGE_CREATE, "mention_roles": ["7", "8"]}, model)
+
+    assert list(message.mention_roles) == [7, 8]
+    assert all(isinstance(role, Snowflake) for role in message.mention_roles)
+
+
+def test_message_update_partial():
+    partial = {"id": "10", "channel_id": "3", "guild_id": "1", "embeds": []}
+
+    assert _EventTable.lookup("MESSAGE_UPDATE", MESSAGE_CREATE) is Message
+    assert _EventTable.lookup("MESSAGE_UPDATE", partial) is None
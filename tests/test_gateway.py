@@ -0,0 +1,378 @@
+from zlib import Z_SYNC_FLUSH, compressobj, decompressobj
+
+import trio
+import trio.testing
+
+from retux.api.events.abc import _EventTable
+from retux.api.events.connection import Resumed
+from retux.api.gateway import GatewayClient, _GatewayRateLimit, _GatewaySpill
+from retux.client.bot import Bot
+from retux.client.flags import Intents
+from retux.utils.serializers import json_dumps
+
+from .conftest import FakeConnection
+
+
+def track(gateway: GatewayClient, name: str, data: dict):
+    payload = gateway._structure({"op": 0, "t": name, "s": 1, "d": data})
+    trio.run(gateway._track, payload)
+
+
+def test_dispatch_cached_model(monkeypatch):
+    bot = Bot(Intents.GUILDS)
+    gateway = GatewayClient("token", Intents.GUILDS)
+    gateway._subscribe(*bot.cache.events)
+    gateway._bots.append(bot)
+    seen = []
+
+    async def on_channel_create(channel):
+        seen.append(channel)
+
+    bot._calls = {"channel_create": [on_channel_create]}
+
+    structured = []
+    structure = _EventTable.structure
+    monkeypatch.setattr(
+        _EventTable,
+        "structure",
+        classmethod(lambda cls, data, model: structured.append(model) or structure(data, model)),
+    )
+
+    track(gateway, "CHANNEL_CREATE", {"id": "3", "type": 0, "guild_id": "1"})
+
+    # The callback is given the cached channel, structured once by the cache.
+    assert seen == [bot.cache.get_channel(3)]
+    assert seen[0] is bot.cache.get_channel(3)
+    assert structured == []
+
+
+def test_spill_order():
+    async def main():
+        spill = await _GatewaySpill.open()
+
+        async with trio.open_nursery() as nursery:
+            for message in ("first", "second", b"third"):
+                nursery.start_soon(spill.push, message)
+                await trio.sleep(0.01)
+
+        assert spill.count == 3
+        assert [await spill.pop() for _ in range(3)] == [b"first", b"second", b"third"]
+        assert spill.count == 0
+        assert spill._read_at == 0
+        spill.close()
+
+    trio.run(main)
+
+
+def test_sequence_tracked_once_processed():
+    gateway = GatewayClient("token", Intents.GUILDS)
+    gateway._subscribe("TYPING_START")
+    seen = []
+
+    async def track(payload):
+        seen.append((payload.sequence, gateway._meta.seq))
+
+    gateway._track = track
+
+    async def main():
+        send, receive = trio.open_memory_channel(10)
+
+        for seq in (1, 2):
+            send.send_nowait({"op": 0, "t": "TYPING_START", "s": seq, "d": {}})
+        send.close()
+
+        await gateway._process(receive)
+
+    trio.run(main)
+
+    # Each sequence is only resumed past once its event has been handled.
+    assert seen == [(1, None), (2, 1)]
+    assert gateway._meta.seq == 2
+
+
+def test_zlib_stream():
+    gateway = GatewayClient("token", Intents.GUILDS, compress="zlib-stream")
+    gateway._zlib = decompressobj()
+    gateway._buffer = bytearray()
+
+    compressor = compressobj()
+    frames = []
+
+    for message in ('{"op":11}', '{"op":1,"d":null}'):
+        data = compressor.compress(message.encode()) + compressor.flush(Z_SYNC_FLUSH)
+        # The first message is split across two frames.
+        frames.extend([data[:5], data[5:]] if not frames else [data])
+
+    gateway._conn = FakeConnection(frames)
+
+    async def main():
+        return [await gateway._receive() for _ in frames]
+
+    received = trio.run(main)
+
+    assert received[0] is None
+    assert [gateway._decode(message) for message in received[1:]] == [
+        {"op": 11},
+        {"op": 1, "d": None},
+    ]
+
+
+def test_dispatch_drops_malformed_event(caplog):
+    bot = Bot(Intents.GUILD_MESSAGES)
+    gateway = GatewayClient("token", Intents.GUILD_MESSAGES)
+    gateway._subscribe("MESSAGE_CREATE")
+    gateway._bots.append(bot)
+    seen = []
+
+    async def on_message_create(message):
+        seen.append(message)
+
+    bot._calls = {"message_create": [on_message_create]}
+
+    track(gateway, "MESSAGE_CREATE", {"id": "10", "mention_roles": ["7"]})
+
+    assert seen == []
+    assert "Could not structure MESSAGE_CREATE" in caplog.text
+
+
+def test_dispatch_partial_message_update():
+    bot = Bot(Intents.GUILD_MESSAGES)
+    gateway = GatewayClient("token", Intents.GUILD_MESSAGES)
+    gateway._subscribe("MESSAGE_UPDATE")
+    gateway._bots.append(bot)
+    seen = []
+
+    async def on_message_update(message):
+        seen.append(message)
+
+    bot._calls = {"message_update": [on_message_update]}
+
+    partial = {"id": "10", "channel_id": "3", "guild_id": "1", "embeds": []}
+    track(gateway, "MESSAGE_UPDATE", partial)
+
+    assert seen == [partial]
+
+
+def test_block_overflow_reads_pending_ack():
+    gateway = GatewayClient("token", Intents.GUILDS, queue_size=1)
+    typing = {"op": 0, "t": "TYPING_START", "d": {}}
+    gateway._conn = FakeConnection([{**typing, "s": 1}, {**typing, "s": 2}, {"op": 11}])
+    gateway._closed = False
+    gateway._heartbeat_ack = False
+    gateway._last_ack = [0.0, 0.0]
+    gateway._meta.heartbeat_interval = 0.4
+
+    async def main():
+        send, receive = trio.open_memory_channel(gateway.queue_size)
+
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(gateway._read, send)
+
+            # Nothing is processed, so the second event finds the queue full.
+            with trio.fail_after(5):
+                while not gateway._heartbeat_ack:
+                    await trio.sleep(0.01)
+            nursery.cancel_scope.cancel()
+
+        assert receive.receive_nowait()["s"] == 1
+        # Once spilling, the acknowledgement is spilled after the event for ordering.
+        assert gateway._spill.count == 2
+        assert gateway._decode(await gateway._spill.pop())["s"] == 2
+        assert gateway._decode(await gateway._spill.pop())["op"] == 11
+        gateway._spill.close()
+
+    trio.run(main)
+
+
+def test_resumed_omits_token():
+    bot = Bot(Intents.GUILDS)
+    gateway = GatewayClient("token", Intents.GUILDS)
+    gateway._bots.append(bot)
+    gateway._meta.session_id = "session"
+    gateway._meta.seq = 5
+    seen = []
+
+    async def on_resumed(event):
+        seen.append(event)
+
+    bot._calls = {"resumed": [on_resumed]}
+
+    track(gateway, "RESUMED", {})
+
+    assert seen == [Resumed(session_id="session", seq=5)]
+    assert not hasattr(seen[0], "token")
+
+
+def test_zlib_stream_connection(connections):
+    gateway = GatewayClient("token", Intents.GUILDS, compress="zlib-stream")
+    compressor = compressobj()
+    hello = compressor.compress(b'{"op":10,"d":{"heartbeat_interval":45000}}')
+    hello += compressor.flush(Z_SYNC_FLUSH)
+    connections.append(FakeConnection([hello[:8], hello[8:]]))
+
+    async def main():
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(gateway._run)
+
+            with trio.fail_after(5):
+                while not connections[0].sent:
+                    await trio.sleep(0.01)
+            nursery.cancel_scope.cancel()
+
+    trio.run(main)
+
+    # The HELLO split across two frames is decoded, and identified to.
+    assert connections[0].url.endswith("&compress=zlib-stream")
+    assert gateway._meta.heartbeat_interval == 45
+    assert connections[0].sent[0]["op"] == 2
+
+
+def test_command_rate_limit():
+    sent = []
+
+    async def send(limit: _GatewayRateLimit, name: str, priority: bool = False):
+        await limit.acquire(priority)
+        sent.append((name, trio.current_time()))
+
+    async def main():
+        limit = _GatewayRateLimit(limit=4, per=60, reserved=1)
+
+        async with trio.open_nursery() as nursery:
+            for index in range(4):
+                nursery.start_soon(send, limit, f"command{index}")
+                await trio.sleep(1)
+            nursery.start_soon(send, limit, "heartbeat", True)
+
+    trio.run(main, clock=trio.testing.MockClock(autojump_threshold=0))
+
+    # Heartbeats use the reserved slot, while commands wait for room in the
+    # window, which the heartbeat still counts towards once command0 expires.
+    assert sent == [
+        ("command0", 0),
+        ("command1", 1),
+        ("command2", 2),
+        ("heartbeat", 4),
+        ("command3", 61),
+    ]
+
+
+def test_unsubscribed_events_dropped(monkeypatch):
+    bot = Bot(Intents.GUILDS)
+    gateway = GatewayClient("token", Intents.GUILDS)
+    gateway._bots.append(bot)
+    gateway._subscribe("GUILD_CREATE")
+    tracked = []
+
+    async def on_typing_start(event):
+        pass
+
+    bot._calls = {"typing_start": [on_typing_start]}
+
+    async def track(payload):
+        tracked.append(payload.name)
+
+    gateway._track = track
+
+    structured = []
+    structure = _EventTable.structure
+    monkeypatch.setattr(
+        _EventTable,
+        "structure",
+        classmethod(lambda cls, data, model: structured.append(model) or structure(data, model)),
+    )
+
+    async def main():
+        send, receive = trio.open_memory_channel(10)
+
+        for seq, name in enumerate(("PRESENCE_UPDATE", "TYPING_START", "GUILD_CREATE", "READY")):
+            send.send_nowait({"op": 0, "t": name, "s": seq + 1, "d": {}})
+        send.close()
+
+        await gateway._process(receive)
+
+    trio.run(main)
+
+    # Events with neither a callback nor a consumer are never structured,
+    # but their sequence is still tracked for resuming.
+    assert tracked == ["TYPING_START", "GUILD_CREATE", "READY"]
+    assert structured == []
+    assert gateway._meta.seq == 4
+
+
+def read_overflowing(overflow: str, messages: list[dict]) -> tuple[GatewayClient, list[dict]]:
+    """Reads messages into a receive queue of one message that is never processed."""
+    gateway = GatewayClient("token", Intents.GUILDS, overflow=overflow, queue_size=1)
+    gateway._subscribe("TYPING_START", "MESSAGE_CREATE")
+    gateway._conn = FakeConnection(messages)
+    gateway._closed = False
+    gateway._meta.heartbeat_interval = 0.4
+
+    async def main():
+        send, receive = trio.open_memory_channel(gateway.queue_size)
+
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(gateway._read, send)
+
+            with trio.fail_after(5):
+                while gateway._conn.messages:
+                    await trio.sleep(0.01)
+            await trio.sleep(0.5)
+            nursery.cancel_scope.cancel()
+
+        queued = [receive.receive_nowait()]
+        spilled = []
+
+        while gateway._spill is not None and gateway._spill.count:
+            spilled.append(gateway._decode(await gateway._spill.pop()))
+        return queued + spilled
+
+    return gateway, trio.run(main)
+
+
+def test_drop_overflow():
+    messages = [
+        {"op": 0, "t": "MESSAGE_CREATE", "s": 1, "d": {}},
+        {"op": 0, "t": "TYPING_START", "s": 2, "d": {}},
+        {"op": 0, "t": "MESSAGE_CREATE", "s": 3, "d": {}},
+    ]
+    gateway, received = read_overflowing("drop", messages)
+
+    # Typing is dropped, while other events are kept, spilling once blocked too long.
+    assert [data["s"] for data in received] == [1, 3]
+    gateway._spill.close()
+
+
+def test_spill_overflow():
+    messages = [{"op": 0, "t": "TYPING_START", "s": seq, "d": {}} for seq in range(1, 5)]
+    gateway, received = read_overflowing("spill", messages)
+
+    assert [data["s"] for data in received] == [1, 2, 3, 4]
+    gateway._spill.close()
+
+
+def test_spilled_messages_processed_in_order():
+    gateway = GatewayClient("token", Intents.GUILDS, overflow="spill")
+    gateway._subscribe("TYPING_START")
+    processed = []
+
+    async def track(payload):
+        processed.append(payload.sequence)
+
+    gateway._track = track
+
+    async def main():
+        gateway._spill = await _GatewaySpill.open()
+        send, receive = trio.open_memory_channel(1)
+        send.send_nowait({"op": 0, "t": "TYPING_START", "s": 1, "d": {}})
+
+        for seq in (2, 3):
+            await gateway._spill.push(json_dumps({"op": 0, "t": "TYPING_START", "s": seq, "d": {}}))
+        send.close()
+
+        await gateway._process(receive)
+        gateway._spill.close()
+
+    trio.run(main)
+
+    # The queue is drained before spilled messages, which were received after it.
+    assert processed == [1, 2, 3]
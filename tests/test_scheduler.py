@@ -0,0 +1,104 @@
+import trio
+import trio.testing
+
+from retux.client.scheduler import DispatchScheduler
+
+
+async def drain(scheduler: DispatchScheduler):
+    """Waits until every event submitted to a scheduler is handled."""
+    while scheduler.completed < scheduler.submitted:
+        await trio.sleep(0.01)
+
+
+def test_unordered_lane_is_bounded():
+    running = []
+
+    async def call():
+        running.append(None)
+        await trio.sleep(1)
+
+    async def main():
+        async with DispatchScheduler(max_handlers=2, max_pending=4) as scheduler:
+            for _ in range(4):
+                await scheduler.submit(None, [call])
+
+            with trio.move_on_after(0.5) as scope:
+                await scheduler.submit(None, [call])
+
+            # The fifth event waits for room instead of spawning another task.
+            assert scope.cancelled_caught
+            assert scheduler.statistics()["unordered"] == 4
+            assert scheduler.blocked == 1
+
+            await trio.sleep(0)
+            assert len(running) == 2
+
+    trio.run(main)
+
+
+def test_guilds_run_concurrently_in_order():
+    handled = []
+
+    async def call(guild: str, index: int, delay: float):
+        await trio.sleep(delay)
+        handled.append((guild, index, trio.current_time()))
+
+    async def main():
+        async with DispatchScheduler() as scheduler:
+            # Submitting returns at once, however slow the callbacks are.
+            await scheduler.submit("1", [call], "1", 0, 2)
+            await scheduler.submit("1", [call], "1", 1, 0)
+            await scheduler.submit("2", [call], "2", 0, 0)
+            assert trio.current_time() == 0
+
+            await drain(scheduler)
+
+    trio.run(main, clock=trio.testing.MockClock(autojump_threshold=0))
+
+    # The slow callback of guild 1 only delays the events of guild 1.
+    assert handled == [("2", 0, 0), ("1", 0, 2), ("1", 1, 2)]
+
+
+def test_callback_exceptions_isolated(caplog):
+    handled = []
+
+    async def fail(event):
+        raise RuntimeError("failed")
+
+    async def call(event):
+        handled.append(event)
+
+    async def main():
+        async with DispatchScheduler() as scheduler:
+            await scheduler.submit("1", [fail, call], "first")
+            await scheduler.submit("1", [call], "second")
+            await drain(scheduler)
+
+        return scheduler
+
+    scheduler = trio.run(main)
+
+    assert handled == ["first", "second"]
+    assert scheduler.completed == 2
+    assert "An exception occurred in the callback fail." in caplog.text
+
+
+def test_running_callbacks_bounded():
+    running, peak = [0], [0]
+
+    async def call():
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        await trio.sleep(1)
+        running[0] -= 1
+
+    async def main():
+        async with DispatchScheduler(max_handlers=3) as scheduler:
+            for guild in range(10):
+                await scheduler.submit(str(guild), [call])
+
+            await drain(scheduler)
+
+    trio.run(main, clock=trio.testing.MockClock(autojump_threshold=0))
+
+    assert peak == [3]
@@ -0,0 +1,41 @@
+import sys
+from importlib import reload
+
+import pytest
+
+from retux.utils import serializers
+
+PAYLOAD = {"op": 0, "t": "MESSAGE_CREATE", "d": {"content": "héllo", "mentions": [], "tts": False}}
+
+
+@pytest.fixture(params=["orjson", "ujson", "json"])
+def backend(request, monkeypatch):
+    """Reloads the serializers with a given backend, skipping those not installed."""
+    if request.param != "json":
+        pytest.importorskip(request.param)
+
+    # Blocking an import makes the serializers fall back to the next backend.
+    for blocked in ("orjson", "ujson")[: ("orjson", "ujson", "json").index(request.param)]:
+        monkeypatch.setitem(sys.modules, blocked, None)
+
+    yield reload(serializers)
+
+    monkeypatch.undo()
+    reload(serializers)
+
+
+def test_backend_order(backend, request):
+    assert backend.__json_backend__ == request.node.callspec.params["backend"]
+
+
+def test_round_trip(backend):
+    data = backend.json_dumps(PAYLOAD)
+
+    assert isinstance(data, str)
+    assert "héllo" in data
+    assert backend.json_loads(data) == PAYLOAD
+    assert backend.json_loads(data.encode("utf-8")) == PAYLOAD
+
+
+def test_compact(backend):
+    assert backend.json_dumps({"a": [1, 2]}) == '{"a":[1,2]}'
@@ -0,0 +1,91 @@
+import json
+
+import trio
+
+from retux.api.gateway import GatewayClient
+from retux.client.flags import Intents
+
+from .conftest import FakeConnection
+
+HELLO = {"op": 10, "d": {"heartbeat_interval": 45000}}
+SESSION = {
+    "shard": None,
+    "session_id": "session",
+    "seq": 42,
+    "resume_url": "wss://resume.discord.gg",
+}
+
+
+def first_sent(gateway: GatewayClient, connection: FakeConnection) -> dict:
+    """Runs a connection until it sends its first payload, giving it back."""
+
+    async def main():
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(gateway._run)
+
+            with trio.fail_after(5):
+                while not connection.sent:
+                    await trio.sleep(0.01)
+            nursery.cancel_scope.cancel()
+
+    trio.run(main)
+    return connection.sent[0]
+
+
+def test_resume_from_session_file(tmp_path, connections):
+    session_file = tmp_path / "sessions.json"
+    session_file.write_text(json.dumps({"0": SESSION}))
+    gateway = GatewayClient("token", Intents.GUILDS, session_file=str(session_file))
+    connections.append(FakeConnection([HELLO]))
+
+    sent = first_sent(gateway, connections[0])
+
+    assert connections[0].url.startswith("wss://resume.discord.gg/?v=10")
+    assert sent == {
+        "op": 6,
+        "d": {"token": "token", "session_id": "session", "seq": 42},
+        "s": None,
+        "t": None,
+    }
+
+
+def test_identify_on_shard_change(tmp_path, connections):
+    session_file = tmp_path / "sessions.json"
+    session_file.write_text(json.dumps({"0": {**SESSION, "shard": [0, 1]}}))
+    gateway = GatewayClient("token", Intents.GUILDS, shard=[0, 2], session_file=str(session_file))
+    connections.append(FakeConnection([HELLO]))
+
+    # The amount of shards changed, so the session cannot be resumed.
+    assert first_sent(gateway, connections[0])["op"] == 2
+
+
+def test_unreadable_session_file(tmp_path):
+    session_file = tmp_path / "sessions.json"
+    session_file.write_text("{not json")
+    gateway = GatewayClient("token", Intents.GUILDS, session_file=str(session_file))
+
+    assert gateway._meta.session_id is None
+
+
+def test_save_session(tmp_path):
+    session_file = str(tmp_path / "sessions.json")
+    gateway = GatewayClient("token", Intents.GUILDS, shard=[1, 2], session_file=session_file)
+    gateway._meta.session_id = "session"
+    gateway._meta.seq = 42
+    gateway._meta.resume_url = "wss://resume.discord.gg"
+    gateway._save_session()
+
+    other = GatewayClient("token", Intents.GUILDS, shard=[0, 2], session_file=session_file)
+    other._meta.session_id = "other"
+    other._save_session()
+
+    # Every shard keeps its own session in the same file.
+    loaded = GatewayClient("token", Intents.GUILDS, shard=[1, 2], session_file=session_file)
+    assert (loaded._meta.session_id, loaded._meta.seq) == ("session", 42)
+    assert loaded._meta.resume_url == "wss://resume.discord.gg"
+
+    gateway._meta.session_id = None
+    gateway._save_session()
+
+    with open(session_file) as file:
+        assert list(json.load(file)) == ["0"]
@@ -0,0 +1,137 @@
+import pytest
+import trio
+import trio.testing
+
+from retux.api.gateway import GatewayClient
+from retux.api.http import Endpoint
+from retux.api.shard import IdentifyScheduler, ShardManager
+from retux.client.flags import Intents
+
+from .conftest import FakeConnection
+
+
+def test_identify_spacing_counts_from_identification():
+    identified = {}
+
+    async def identify(scheduler: IdentifyScheduler, shard_id: int, connecting: float):
+        await scheduler.wait(shard_id)
+        await trio.sleep(connecting)
+        identified[shard_id] = trio.current_time()
+        await scheduler.release(shard_id)
+
+    async def main():
+        # The scheduler reads the clock, and is created inside of trio.
+        scheduler = IdentifyScheduler(max_concurrency=2)
+
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(identify, scheduler, 0, 3)
+            await trio.sleep(0.1)
+            nursery.start_soon(identify, scheduler, 2, 0)
+            nursery.start_soon(identify, scheduler, 1, 0)
+
+        return scheduler
+
+    scheduler = trio.run(main, clock=trio.testing.MockClock(autojump_threshold=0))
+
+    # Shards 0 and 2 share a bucket, and shard 0 took 3 seconds to connect.
+    assert identified[2] - identified[0] >= 5
+    assert identified[1] < identified[0]
+    assert scheduler.remaining == 997
+
+
+def test_identify_slot_freed_without_identifying():
+    identified = {}
+
+    async def main():
+        # The scheduler reads the clock, and is created inside of trio.
+        scheduler = IdentifyScheduler()
+        await scheduler.wait(0)
+        await scheduler.release(0, identified=False)
+
+        with trio.move_on_after(1):
+            await scheduler.wait(1)
+            identified[1] = trio.current_time()
+
+    trio.run(main, clock=trio.testing.MockClock(autojump_threshold=0))
+
+    assert identified == {1: 0}
+
+
+class RecordingScheduler:
+    """Represents a scheduler recording every release made to it."""
+
+    def __init__(self):
+        self.released = []
+
+    async def wait(self, shard_id: int):
+        pass
+
+    async def release(self, shard_id: int, identified: bool = True):
+        self.released.append((shard_id, identified))
+
+
+def test_identify_released_once(connections):
+    scheduler = RecordingScheduler()
+    gateway = GatewayClient("token", Intents.GUILDS, scheduler=scheduler)
+    connections.append(FakeConnection([{"op": 10, "d": {"heartbeat_interval": 45000}}]))
+
+    async def main():
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(gateway._run)
+
+            while not connections[0].sent:
+                await trio.sleep(0.01)
+            nursery.cancel_scope.cancel()
+
+    trio.run(main)
+
+    # Shutting down after identifying does not free the bucket a second time.
+    assert connections[0].sent[0]["op"] == 2
+    assert scheduler.released == [(0, True)]
+
+
+class FakeHTTP:
+    """Represents an HTTP client replying to `GET /gateway/bot` only."""
+
+    def __init__(self, data: dict):
+        self.data = data
+        self.requests = []
+
+    async def request(self, method: str, path: str, **kwargs) -> dict:
+        self.requests.append((method, path))
+        return self.data
+
+
+def test_shard_manager_runs_every_shard(connections):
+    http = FakeHTTP({"shards": 2, "session_start_limit": {"max_concurrency": 2}})
+    manager = ShardManager("token", Intents.GUILDS, http)
+
+    for _ in range(2):
+        connections.append(FakeConnection([{"op": 10, "d": {"heartbeat_interval": 45000}}]))
+
+    async def main():
+        with trio.CancelScope() as scope:
+            async with manager:
+                with trio.fail_after(5):
+                    while not all(connection.sent for connection in connections):
+                        await trio.sleep(0.01)
+                scope.cancel()
+
+    trio.run(main)
+
+    assert http.requests == [("GET", Endpoint.GET_GATEWAY_BOT)]
+    assert manager.scheduler.max_concurrency == 2
+    assert sorted(connection.sent[0]["d"]["shard"] for connection in connections) == [
+        [0, 2],
+        [1, 2],
+    ]
+
+
+def test_shard_manager_get_shard():
+    manager = ShardManager("token", Intents.GUILDS, None, shard_count=2, shard_ids=[1])
+    manager.shards = [GatewayClient("token", Intents.GUILDS, shard=[1, 2])]
+
+    assert manager.get_shard(1 << 22) is manager.shards[0]
+
+    with pytest.raises(ValueError):
+        manager.get_shard(2 << 22)
@@ -0,0 +1,76 @@
+from retux.client.cache import Cache
+from retux.client.resources.channel import Channel
+from retux.client.resources.guild import Guild, Member
+from retux.utils.conversion import structure
+
+GUILD_CREATE = {
+    "id": "1",
+    "name": "guild",
+    "icon": None,
+    "owner_id": "2",
+    "afk_channel_id": None,
+    "afk_timeout": 300,
+    "verification_level": 0,
+    "default_message_notifications": 0,
+    "explicit_content_filter": 0,
+    "features": [],
+    "mfa_level": 0,
+    "application_id": None,
+    "system_channel_id": None,
+    "system_channel_flags": 0,
+    "rules_channel_id": None,
+    "public_updates_channel_id": None,
+    "premium_tier": 0,
+    "preferred_locale": "en-US",
+    "nsfw_level": 0,
+    "premium_progress_bar_enabled": False,
+    "roles": [],
+    "emojis": [],
+    "stickers": [],
+    "channels": [
+        {"id": "3", "type": 0, "name": "general", "last_message_id": None, "parent_id": None}
+    ],
+    "members": [],
+}
+
+
+def test_null_snowflakes():
+    guild = structure(GUILD_CREATE, Guild)
+
+    assert guild.id == 1
+    assert guild.afk_channel_id is None
+    assert guild.application_id is None
+    assert guild.system_channel_id is None
+    assert guild.rules_channel_id is None
+    assert guild.public_updates_channel_id is None
+
+    channel = structure(GUILD_CREATE["channels"][0], Channel)
+
+    assert channel.last_message_id is None
+    assert channel.parent_id is None
+
+
+def test_null_snowflakes_cached():
+    cache = Cache()
+    cache._handle("GUILD_CREATE", GUILD_CREATE)
+
+    assert cache.get_guild(1).afk_channel_id is None
+    assert cache.get_channel(3).parent_id is None
+
+
+def test_null_timestamps():
+    member = structure(
+        {
+            "user": {"id": "4", "username": "user", "discriminator": "0001"},
+            "roles": [],
+            "joined_at": "2022-01-01T00:00:00+00:00",
+            "premium_since": None,
+            "communication_disabled_until": None,
+        },
+        Member,
+    )
+
+    assert member.joined_at == "2022-01-01T00:00:00+00:00"
+    assert member.premium_since is None
+    assert member.communication_disabled_until is None
+    assert "premium_since=None" in repr(member)